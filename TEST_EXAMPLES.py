@@ -6,6 +6,7 @@ Run with proper .env configuration.
 """
 import asyncio
 import logging
+import time
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -84,6 +85,28 @@ async def test_signer(config):
         is_valid = signer.verify_signature(test_order, signature)
         print(f"✓ Signature valid: {is_valid}")
 
+        # Batch signing and verification
+        batch_orders = [
+            {**test_order, "salt": i + 1, "nonce": i}
+            for i in range(16)
+        ]
+        start = time.perf_counter()
+        signatures = signer.sign_orders_batch(batch_orders)
+        sign_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = signer.verify_signatures_batch(batch_orders, signatures)
+        verify_elapsed = time.perf_counter() - start
+
+        print(
+            f"✓ Batch signed {len(signatures)} orders in {sign_elapsed * 1000:.1f}ms "
+            f"({sign_elapsed * 1000 / len(signatures):.2f}ms/order)"
+        )
+        print(
+            f"✓ Batch verified {sum(results)}/{len(results)} signatures "
+            f"in {verify_elapsed * 1000:.1f}ms"
+        )
+
         return signer
     except Exception as e:
         print(f"✗ Signer failed: {e}")
@@ -268,5 +291,12 @@ async def run_all_tests():
 
 
 if __name__ == "__main__":
+    # Use uvloop when available (pip install polymarket-mcp[speedups])
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run tests
     asyncio.run(run_all_tests())
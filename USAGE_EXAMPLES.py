@@ -5,7 +5,29 @@ This file demonstrates common usage patterns for the 18 new tools.
 """
 
 import asyncio
+import sys
+from contextlib import AsyncExitStack
 from polymarket_mcp.tools import market_discovery, market_analysis
+from polymarket_mcp.utils import close_http_client, get_rate_limiter
+
+# Maximum number of market analyses in flight at once
+MAX_CONCURRENT_ANALYSES = 10
+
+
+async def gather_bounded(coros, limit: int = MAX_CONCURRENT_ANALYSES):
+    """
+    Run coroutines concurrently with at most `limit` in flight.
+
+    Results are returned in input order; exceptions are returned in place
+    of results instead of being raised.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*[_run(coro) for coro in coros], return_exceptions=True)
 
 
 # ============================================
@@ -105,7 +127,7 @@ async def example_get_market_details():
     markets = await market_discovery.get_trending_markets(limit=1)
 
     if markets:
-        market_id = markets[0].get("id") or markets[0].get("market_id")
+        market_id = markets[0]["id"]
 
         # Get detailed information
         details = await market_analysis.get_market_details(market_id=market_id)
@@ -124,25 +146,23 @@ async def example_price_analysis():
     markets = await market_discovery.get_trending_markets(limit=1)
 
     if markets and markets[0].get("tokens"):
+        market_id = markets[0]["id"]
         token_id = markets[0]["tokens"][0].get("token_id")
 
-        # Get current price
-        price_data = await market_analysis.get_current_price(
-            token_id=token_id,
-            side="BOTH"
+        # Get price and spread together
+        snapshot = await market_analysis.get_market_snapshot(
+            market_id=market_id,
+            token_id=token_id
         )
 
         print("Price Analysis:")
-        print(f"  Bid: {price_data.bid:.4f}")
-        print(f"  Ask: {price_data.ask:.4f}")
-        print(f"  Mid: {price_data.mid:.4f}")
-
-        # Get spread
-        spread = await market_analysis.get_spread(token_id=token_id)
+        print(f"  Bid: {snapshot.bid:.4f}")
+        print(f"  Ask: {snapshot.ask:.4f}")
+        print(f"  Mid: {snapshot.mid:.4f}")
 
         print(f"\nSpread Analysis:")
-        print(f"  Spread: {spread['spread_value']:.4f}")
-        print(f"  Spread %: {spread['spread_percentage']:.2f}%")
+        print(f"  Spread: {snapshot.spread_value:.4f}")
+        print(f"  Spread %: {snapshot.spread_percentage:.2f}%")
 
 
 async def example_orderbook():
@@ -158,14 +178,16 @@ async def example_orderbook():
             depth=10
         )
 
+        top_bids, top_asks = orderbook.top(5)
+
         print("Order Book:")
         print(f"\nTop 5 Bids:")
-        for bid in orderbook.bids[:5]:
-            print(f"  {bid.price:.4f} - Size: {bid.size:.2f}")
+        for price, size in top_bids:
+            print(f"  {price:.4f} - Size: {size:.2f}")
 
         print(f"\nTop 5 Asks:")
-        for ask in orderbook.asks[:5]:
-            print(f"  {ask.price:.4f} - Size: {ask.size:.2f}")
+        for price, size in top_asks:
+            print(f"  {price:.4f} - Size: {size:.2f}")
 
 
 async def example_volume_and_liquidity():
@@ -173,23 +195,17 @@ async def example_volume_and_liquidity():
     markets = await market_discovery.get_trending_markets(limit=1)
 
     if markets:
-        market_id = markets[0].get("id") or markets[0].get("market_id")
+        market_id = markets[0]["id"]
 
-        # Get volume data
-        volume = await market_analysis.get_market_volume(
-            market_id=market_id,
-            timeframes=["24h", "7d", "30d"]
-        )
+        # Get volume and liquidity together
+        snapshot = await market_analysis.get_market_snapshot(market_id=market_id)
 
         print("Volume Analysis:")
-        print(f"  24h: ${volume.volume_24h:,.2f}")
-        print(f"  7d: ${volume.volume_7d:,.2f}")
-        print(f"  30d: ${volume.volume_30d:,.2f}")
+        print(f"  24h: ${snapshot.volume_24h:,.2f}")
+        print(f"  7d: ${snapshot.volume_7d:,.2f}")
+        print(f"  30d: ${snapshot.volume_30d:,.2f}")
 
-        # Get liquidity
-        liquidity = await market_analysis.get_liquidity(market_id=market_id)
-
-        print(f"\nLiquidity: {liquidity['liquidity_formatted']}")
+        print(f"\nLiquidity: ${snapshot.liquidity_usd:,.2f}")
 
 
 async def example_ai_opportunity_analysis():
@@ -199,29 +215,38 @@ async def example_ai_opportunity_analysis():
 
     print("AI Market Opportunity Analysis:\n")
 
+    lines = []
     for market in markets:
-        market_id = market.get("id") or market.get("market_id")
+        market_id = market["id"]
 
         # Analyze opportunity
         analysis = await market_analysis.analyze_market_opportunity(market_id)
 
-        print(f"Market: {analysis.market_question}")
-        print(f"  Recommendation: {analysis.recommendation}")
-        print(f"  Confidence: {analysis.confidence_score}%")
-        print(f"  Risk: {analysis.risk_assessment}")
-        print(f"  Reasoning: {analysis.reasoning}")
+        lines.append(f"Market: {analysis.market_question}")
+        lines.append(f"  Recommendation: {analysis.recommendation}")
+        lines.append(f"  Confidence: {analysis.confidence_score}%")
+        lines.append(f"  Risk: {analysis.risk_assessment}")
+        lines.append(f"  Reasoning: {analysis.reasoning}")
 
         # Show key metrics
-        if analysis.current_price_yes:
-            print(f"  YES Price: {analysis.current_price_yes:.4f}")
-        if analysis.spread_pct:
-            print(f"  Spread: {analysis.spread_pct:.2f}%")
-        if analysis.volume_24h:
-            print(f"  Volume 24h: ${analysis.volume_24h:,.2f}")
-        if analysis.liquidity_usd:
-            print(f"  Liquidity: ${analysis.liquidity_usd:,.2f}")
+        price, spread, volume, liquidity = (
+            analysis.current_price_yes,
+            analysis.spread_pct,
+            analysis.volume_24h,
+            analysis.liquidity_usd,
+        )
+        if price:
+            lines.append(f"  YES Price: {price:.4f}")
+        if spread:
+            lines.append(f"  Spread: {spread:.2f}%")
+        if volume:
+            lines.append(f"  Volume 24h: ${volume:,.2f}")
+        if liquidity:
+            lines.append(f"  Liquidity: ${liquidity:,.2f}")
 
-        print()
+        lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def example_compare_markets():
@@ -230,22 +255,28 @@ async def example_compare_markets():
     crypto = await market_discovery.get_crypto_markets(limit=3)
 
     if len(crypto) >= 2:
-        market_ids = [m.get("id") or m.get("market_id") for m in crypto]
-        market_ids = [mid for mid in market_ids if mid]
+        market_ids = [m["id"] for m in crypto if m["id"]]
 
         # Compare markets
         comparison = await market_analysis.compare_markets(market_ids)
 
-        print("Market Comparison:\n")
-        print(f"{'Market':<50} {'Volume 24h':<15} {'Liquidity':<15}")
-        print("-" * 80)
+        # One bound format method shared by the header and every row
+        row_fmt = "{:<50} {:<15} {:<15}".format
 
+        lines = [
+            "Market Comparison:\n",
+            row_fmt("Market", "Volume 24h", "Liquidity"),
+            "-" * 80,
+        ]
         for comp in comparison:
             if "error" not in comp:
-                question = comp.get("question", "Unknown")[:47] + "..."
-                volume = f"${comp.get('volume_24h', 0):,.0f}"
-                liquidity = f"${comp.get('liquidity_usd', 0):,.0f}"
-                print(f"{question:<50} {volume:<15} {liquidity:<15}")
+                lines.append(row_fmt(
+                    comp.get("question", "Unknown")[:47] + "...",
+                    f"${comp.get('volume_24h') or 0:,.0f}",
+                    f"${comp.get('liquidity_usd') or 0:,.0f}",
+                ))
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ============================================
@@ -263,16 +294,40 @@ async def workflow_find_best_opportunity():
 
     # Step 2: Analyze each market
     print("2. Analyzing opportunities...\n")
-    opportunities = []
 
-    for market in markets[:5]:  # Analyze top 5
-        market_id = market.get("id") or market.get("market_id")
+    # Markets below the liquidity floor are always rated AVOID, so use the
+    # liquidity already in the listing to skip analysing them at all
+    top_markets = [
+        market for market in markets
+        if float(market.get("liquidity", 0) or 0) >= market_analysis.MIN_TRADABLE_LIQUIDITY_USD
+    ][:5]  # Analyze top 5 candidates
+    print(f"   {len(top_markets)} markets pass the liquidity pre-filter\n")
+
+    # Reserve rate limit tokens for the whole batch so the analyses
+    # don't queue on the limiter one request at a time. Tokens left unused
+    # (e.g. cached analyses) go back to the limiter when the block exits
+    rate_limiter = get_rate_limiter()
+    async with AsyncExitStack() as reservations:
+        for category, per_market in market_analysis.OPPORTUNITY_REQUESTS.items():
+            await reservations.enter_async_context(
+                rate_limiter.acquire_many(category, per_market * len(top_markets))
+            )
+
+        results = await gather_bounded(
+            market_analysis.analyze_market_opportunity(market["id"])
+            for market in top_markets
+        )
 
-        try:
-            analysis = await market_analysis.analyze_market_opportunity(market_id)
-            opportunities.append(analysis)
-        except Exception as e:
-            print(f"   Skipped {market.get('question', 'Unknown')}: {e}")
+    opportunities = []
+    skipped = []
+    for market, result in zip(top_markets, results):
+        if isinstance(result, BaseException):
+            skipped.append(f"   Skipped {market.get('question', 'Unknown')}: {result}")
+        else:
+            opportunities.append(result)
+
+    if skipped:
+        sys.stdout.write("\n".join(skipped) + "\n")
 
     # Step 3: Filter by recommendation and confidence
     print("3. Filtering opportunities...\n")
@@ -281,32 +336,34 @@ async def workflow_find_best_opportunity():
         if opp.recommendation == "BUY" and opp.confidence_score > 60
     ]
 
-    # Step 4: Sort by confidence
-    buy_opportunities.sort(key=lambda x: x.confidence_score, reverse=True)
-
-    # Step 5: Display results
+    # Step 4: Display results
     print(f"4. Results: Found {len(buy_opportunities)} BUY opportunities\n")
 
+    lines = []
     if buy_opportunities:
-        best = buy_opportunities[0]
-        print("=== BEST OPPORTUNITY ===")
-        print(f"Market: {best.market_question}")
-        print(f"Recommendation: {best.recommendation}")
-        print(f"Confidence: {best.confidence_score}%")
-        print(f"Risk: {best.risk_assessment}")
-        print(f"Reasoning: {best.reasoning}")
-
-        if best.current_price_yes:
-            print(f"\nEntry Price (YES): {best.current_price_yes:.4f}")
-        if best.spread_pct:
-            print(f"Spread: {best.spread_pct:.2f}%")
-
-        print("\n=== Next Steps ===")
-        print("1. Review market details")
-        print("2. Check orderbook for liquidity")
-        print("3. Use trading tools to execute order")
+        # Only the top opportunity is shown, so a single max() pass is enough
+        best = max(buy_opportunities, key=lambda x: x.confidence_score)
+        lines.append("=== BEST OPPORTUNITY ===")
+        lines.append(f"Market: {best.market_question}")
+        lines.append(f"Recommendation: {best.recommendation}")
+        lines.append(f"Confidence: {best.confidence_score}%")
+        lines.append(f"Risk: {best.risk_assessment}")
+        lines.append(f"Reasoning: {best.reasoning}")
+
+        price, spread = best.current_price_yes, best.spread_pct
+        if price:
+            lines.append(f"\nEntry Price (YES): {price:.4f}")
+        if spread:
+            lines.append(f"Spread: {spread:.2f}%")
+
+        lines.append("\n=== Next Steps ===")
+        lines.append("1. Review market details")
+        lines.append("2. Check orderbook for liquidity")
+        lines.append("3. Use trading tools to execute order")
     else:
-        print("No BUY opportunities found at this time.")
+        lines.append("No BUY opportunities found at this time.")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def workflow_monitor_category():
@@ -324,31 +381,43 @@ async def workflow_monitor_category():
 
     print(f"Found {len(markets)} active {category} markets\n")
 
-    # Analyze each
-    for market in markets:
-        market_id = market.get("id") or market.get("market_id")
+    async def _monitor(market_id):
+        # Get volume and liquidity together
+        snapshot = await market_analysis.get_market_snapshot(market_id)
+
+        # Analyze if high volume
+        analysis = None
+        if snapshot.volume_24h > 10000:
+            analysis = await market_analysis.analyze_market_opportunity(market_id)
+
+        return snapshot, analysis
+
+    # Analyze all markets concurrently, then report in order
+    results = await gather_bounded(
+        _monitor(market["id"]) for market in markets
+    )
+
+    lines = []
+    for market, result in zip(markets, results):
         question = market.get("question", "Unknown")
 
-        print(f"Market: {question[:60]}...")
+        lines.append(f"Market: {question[:60]}...")
 
-        try:
-            # Get volume and liquidity
-            volume = await market_analysis.get_market_volume(market_id)
-            liquidity = await market_analysis.get_liquidity(market_id)
+        if isinstance(result, BaseException):
+            lines.append(f"  Error: {result}")
+        else:
+            snapshot, analysis = result
 
-            print(f"  Volume 24h: ${volume.volume_24h:,.2f}")
-            print(f"  Liquidity: ${liquidity.get('liquidity_usd', 0):,.2f}")
+            lines.append(f"  Volume 24h: ${snapshot.volume_24h:,.2f}")
+            lines.append(f"  Liquidity: ${snapshot.liquidity_usd:,.2f}")
 
-            # Analyze if high volume
-            if volume.volume_24h > 10000:
-                analysis = await market_analysis.analyze_market_opportunity(market_id)
-                print(f"  → {analysis.recommendation} ({analysis.confidence_score}%)")
-                print(f"    {analysis.reasoning}")
+            if analysis:
+                lines.append(f"  → {analysis.recommendation} ({analysis.confidence_score}%)")
+                lines.append(f"    {analysis.reasoning}")
 
-        except Exception as e:
-            print(f"  Error: {e}")
+        lines.append("")
 
-        print()
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def workflow_pre_close_analysis():
@@ -360,36 +429,40 @@ async def workflow_pre_close_analysis():
 
     print(f"Found {len(closing)} markets closing in 24 hours\n")
 
-    for market in closing:
-        market_id = market.get("id") or market.get("market_id")
+    # Full analysis of every market, concurrently
+    results = await gather_bounded(
+        market_analysis.analyze_market_opportunity(market["id"])
+        for market in closing
+    )
+
+    lines = []
+    for market, analysis in zip(closing, results):
         question = market.get("question", "Unknown")
         end_date = market.get("endDate") or market.get("end_date_iso")
 
-        print(f"Market: {question[:60]}...")
-        print(f"  Closes: {end_date}")
-
-        try:
-            # Full analysis
-            analysis = await market_analysis.analyze_market_opportunity(market_id)
+        lines.append(f"Market: {question[:60]}...")
+        lines.append(f"  Closes: {end_date}")
 
-            print(f"  Recommendation: {analysis.recommendation}")
-            print(f"  Confidence: {analysis.confidence_score}%")
+        if isinstance(analysis, BaseException):
+            lines.append(f"  Error: {analysis}")
+        else:
+            lines.append(f"  Recommendation: {analysis.recommendation}")
+            lines.append(f"  Confidence: {analysis.confidence_score}%")
 
             if analysis.current_price_yes:
-                print(f"  Current YES Price: {analysis.current_price_yes:.4f}")
+                lines.append(f"  Current YES Price: {analysis.current_price_yes:.4f}")
 
             # Closing strategy
             if analysis.recommendation in ["BUY", "HOLD"]:
-                print("  → Consider entering before close")
+                lines.append("  → Consider entering before close")
             elif analysis.recommendation == "SELL":
-                print("  → Consider exiting position")
+                lines.append("  → Consider exiting position")
             else:
-                print("  → Avoid - high risk near close")
+                lines.append("  → Avoid - high risk near close")
 
-        except Exception as e:
-            print(f"  Error: {e}")
+        lines.append("")
 
-        print()
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ============================================
@@ -427,14 +500,25 @@ async def main():
         example_ai_opportunity_analysis,
     ]
 
-    for example_func in selected_examples:
-        try:
-            await example_func()
-            print("\n" + "=" * 80 + "\n")
-        except Exception as e:
-            print(f"Error running example: {e}\n")
+    try:
+        for example_func in selected_examples:
+            try:
+                await example_func()
+                print("\n" + "=" * 80 + "\n")
+            except Exception as e:
+                print(f"Error running example: {e}\n")
+    finally:
+        # All examples share one pooled HTTP client; release it on exit
+        await close_http_client()
 
 
 if __name__ == "__main__":
+    # Use uvloop when available (pip install polymarket-mcp[speedups])
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run examples
     asyncio.run(main())
@@ -2,273 +2,13 @@
 """
 Demo completo das ferramentas do MCP Polymarket
 Mostra dados reais usando as tools que criamos
+
+Equivale a: python -m polymarket_mcp.scripts demo
 """
 import sys
 sys.path.insert(0, 'src')
 
-import asyncio
-import httpx
-import json
-from decimal import Decimal
-
-# Simular o ambiente do MCP sem precisar de auth
-async def demo_market_discovery():
-    """Demo das ferramentas de Market Discovery"""
-    print("\n" + "="*70)
-    print("🔍 DEMO: MARKET DISCOVERY TOOLS")
-    print("="*70)
-
-    async with httpx.AsyncClient() as client:
-        # 1. Get trending markets
-        print("\n📊 Tool: get_trending_markets")
-        print("-" * 50)
-        response = await client.get(
-            'https://gamma-api.polymarket.com/markets',
-            params={
-                'limit': 5,
-                'closed': 'false',
-                'order': 'volume24hr',
-                'ascending': 'false'
-            }
-        )
-        markets = response.json()
-
-        for i, market in enumerate(markets[:5], 1):
-            volume = float(market.get("volume24hr", 0) or 0)
-            liquidity = float(market.get("liquidity", 0) or 0)
-            print(f"\n{i}. {market.get('question', 'N/A')[:60]}...")
-            print(f"   💰 Volume 24h: ${volume:,.0f}")
-            print(f"   💧 Liquidity: ${liquidity:,.0f}")
-            if market.get('outcomePrices'):
-                prices_raw = market['outcomePrices']
-                # Parse JSON string if needed
-                if isinstance(prices_raw, str):
-                    prices = json.loads(prices_raw)
-                else:
-                    prices = prices_raw
-
-                if isinstance(prices, list) and len(prices) >= 2:
-                    yes_price = float(prices[0])
-                    no_price = float(prices[1])
-                    print(f"   📈 YES: ${yes_price:.3f} | NO: ${no_price:.3f}")
-
-        # 2. Get featured markets
-        print("\n\n🌟 Tool: get_featured_markets")
-        print("-" * 50)
-        response = await client.get(
-            'https://gamma-api.polymarket.com/markets',
-            params={'limit': 3, 'featured': 'true'}
-        )
-        featured = response.json()
-
-        for i, market in enumerate(featured[:3], 1):
-            print(f"\n{i}. {market.get('question', 'N/A')}")
-            print(f"   🏷️  Featured Market")
-            if market.get('category'):
-                print(f"   📂 Category: {market['category']}")
-
-        # 3. Get events
-        print("\n\n🎯 Tool: get_event_markets")
-        print("-" * 50)
-        response = await client.get(
-            'https://gamma-api.polymarket.com/events',
-            params={'limit': 3, 'closed': 'false'}
-        )
-        events = response.json()
-
-        for i, event in enumerate(events[:3], 1):
-            volume = float(event.get("volume24hr", 0) or 0)
-            markets_count = len(event.get('markets', []))
-            print(f"\n{i}. {event.get('title', 'N/A')}")
-            print(f"   💰 Volume 24h: ${volume:,.0f}")
-            print(f"   📊 Total Markets: {markets_count}")
-
-async def demo_market_analysis():
-    """Demo das ferramentas de Market Analysis"""
-    print("\n\n" + "="*70)
-    print("📈 DEMO: MARKET ANALYSIS TOOLS")
-    print("="*70)
-
-    async with httpx.AsyncClient() as client:
-        # Get a market first
-        response = await client.get(
-            'https://gamma-api.polymarket.com/markets',
-            params={'limit': 1, 'closed': 'false'}
-        )
-        markets = response.json()
-
-        if not markets:
-            print("Nenhum market disponível")
-            return
-
-        market = markets[0]
-        tokens = market.get('tokens', [])
-
-        if not tokens:
-            print("Market sem tokens")
-            return
-
-        token_id = tokens[0].get('token_id')
-
-        # 1. Get market details
-        print("\n📊 Tool: get_market_details")
-        print("-" * 50)
-        print(f"Question: {market.get('question', 'N/A')}")
-        print(f"Market ID: {market.get('id', 'N/A')}")
-        volume = float(market.get("volume24hr", 0) or 0)
-        liquidity = float(market.get("liquidity", 0) or 0)
-        print(f"Volume 24h: ${volume:,.0f}")
-        print(f"Liquidity: ${liquidity:,.0f}")
-
-        # 2. Get current price
-        print("\n\n💵 Tool: get_current_price")
-        print("-" * 50)
-        response = await client.get(
-            f'https://clob.polymarket.com/midpoint',
-            params={'token_id': token_id}
-        )
-        mid_data = response.json()
-        mid_price = float(mid_data.get("mid", 0))
-        print(f"Midpoint Price: ${mid_price:.4f}")
-
-        # 3. Get orderbook
-        print("\n\n📖 Tool: get_orderbook")
-        print("-" * 50)
-        response = await client.get(
-            f'https://clob.polymarket.com/book',
-            params={'token_id': token_id}
-        )
-        book = response.json()
-
-        bids = book.get('bids', [])
-        asks = book.get('asks', [])
-
-        print("💚 Top 5 Bids:")
-        for bid in bids[:5]:
-            price = float(bid.get('price', 0))
-            size = float(bid.get('size', 0))
-            print(f"   ${price:.4f} - Size: {size:.2f}")
-
-        print("\n❤️  Top 5 Asks:")
-        for ask in asks[:5]:
-            price = float(ask.get('price', 0))
-            size = float(ask.get('size', 0))
-            print(f"   ${price:.4f} - Size: {size:.2f}")
-
-        # 4. Get spread
-        print("\n\n📊 Tool: get_spread")
-        print("-" * 50)
-        if bids and asks:
-            best_bid = float(bids[0].get('price', 0))
-            best_ask = float(asks[0].get('price', 0))
-            spread = best_ask - best_bid
-            spread_pct = (spread / best_bid) * 100 if best_bid > 0 else 0
-
-            print(f"Best Bid: ${best_bid:.4f}")
-            print(f"Best Ask: ${best_ask:.4f}")
-            print(f"Spread: ${spread:.4f} ({spread_pct:.2f}%)")
-
-            # AI-powered analysis simulation
-            print("\n\n🤖 Tool: analyze_market_opportunity")
-            print("-" * 50)
-            print(f"Market: {market.get('question', 'N/A')[:60]}...")
-            print(f"\nAnalysis:")
-            print(f"  • Spread: {spread_pct:.2f}% ({'✅ Good' if spread_pct < 2 else '⚠️  Wide'})")
-            print(f"  • Liquidity: ${liquidity:,.0f} ({'✅ High' if liquidity > 50000 else '⚠️  Low'})")
-            print(f"  • Volume: ${volume:,.0f} ({'✅ Active' if volume > 1000 else '📊 Moderate'})")
-
-            # Simple recommendation logic
-            if spread_pct < 2 and liquidity > 50000:
-                recommendation = "BUY"
-                confidence = 75
-                reasoning = "Good spread and high liquidity make this a favorable market"
-            elif spread_pct > 5:
-                recommendation = "AVOID"
-                confidence = 80
-                reasoning = "Spread too wide, poor trading conditions"
-            else:
-                recommendation = "HOLD"
-                confidence = 60
-                reasoning = "Moderate conditions, wait for better opportunity"
-
-            print(f"\n  🎯 Recommendation: {recommendation}")
-            print(f"  📊 Confidence: {confidence}%")
-            print(f"  💡 Reasoning: {reasoning}")
-
-async def demo_portfolio_tools():
-    """Demo das ferramentas de Portfolio (simulado)"""
-    print("\n\n" + "="*70)
-    print("💼 DEMO: PORTFOLIO MANAGEMENT TOOLS (Simulado)")
-    print("="*70)
-
-    print("\n📊 Tool: get_all_positions")
-    print("-" * 50)
-    print("⚠️  Requer autenticação - mostrando exemplo:")
-    print("""
-    Position #1:
-      Market: Trump wins 2024?
-      Size: 150 shares
-      Avg Price: $0.52
-      Current: $0.58
-      P&L: +$9.00 (+11.5%)
-
-    Position #2:
-      Market: Bitcoin > $100k in 2025?
-      Size: 200 shares
-      Avg Price: $0.35
-      Current: $0.42
-      P&L: +$14.00 (+20%)
-    """)
-
-    print("\n💰 Tool: get_portfolio_value")
-    print("-" * 50)
-    print("Total Portfolio Value: $1,523.45")
-    print("Cash (USDC): $500.00")
-    print("Open Positions: $1,023.45")
-    print("Total P&L: +$123.45 (+8.8%)")
-
-    print("\n⚠️  Tool: analyze_portfolio_risk")
-    print("-" * 50)
-    print("Risk Analysis:")
-    print("  • Total Exposure: $1,023.45 (✅ Within limits)")
-    print("  • Concentration: 45% in largest position (⚠️  Moderate)")
-    print("  • Diversification: 5 markets (✅ Good)")
-    print("  • Risk Score: 42/100 (✅ Low Risk)")
-
-async def main():
-    """Run all demos"""
-    print("""
-╔══════════════════════════════════════════════════════════════════════╗
-║                                                                      ║
-║           🤖 POLYMARKET MCP SERVER - LIVE DEMO 🤖                    ║
-║                                                                      ║
-║  Demonstração das 45 ferramentas com dados REAIS da Polymarket      ║
-║                                                                      ║
-╚══════════════════════════════════════════════════════════════════════╝
-    """)
-
-    await demo_market_discovery()
-    await demo_market_analysis()
-    await demo_portfolio_tools()
-
-    print("\n\n" + "="*70)
-    print("✅ DEMO COMPLETA!")
-    print("="*70)
-    print("""
-📊 Ferramentas Testadas:
-   ✅ Market Discovery (8 tools) - DADOS REAIS
-   ✅ Market Analysis (10 tools) - DADOS REAIS
-   ✅ Portfolio Management (8 tools) - EXEMPLO
-
-⚡ Status: Todas as APIs funcionando perfeitamente!
-
-🚀 Próximos passos:
-   1. Configure suas credenciais no .env
-   2. Instale no Claude Desktop
-   3. Comece a tradear com AI!
-
-💡 O MCP está pronto para uso autônomo!
-    """)
+from polymarket_mcp.scripts.__main__ import main
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main(["demo"])
@@ -7,10 +7,120 @@ import sys
 sys.path.insert(0, 'src')
 
 import asyncio
+import functools
+import heapq
+import importlib.util
+import io
 import httpx
-import json
+import orjson
+import re
 from datetime import datetime
 from collections import defaultdict
+from dataclasses import dataclass
+from operator import attrgetter
+
+from polymarket_mcp.utils.cache import cached_get_json
+
+GAMMA_MARKETS_URL = 'https://gamma-api.polymarket.com/markets'
+
+# Paginação da Gamma API: páginas buscadas em paralelo, em lotes
+PAGE_SIZE = 500
+CONCURRENT_PAGES = 16
+MAX_PAGES = 40
+
+# Pool de conexões (HTTP/2 quando o pacote h2 está instalado)
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+@dataclass(slots=True, frozen=True)
+class ShutdownMarket:
+    """Dados de um market de shutdown já convertidos para a análise"""
+    rank: int
+    question: str
+    timing: str
+    volume_24h: float
+    liquidity: float
+    yes_price: float
+    no_price: float
+    yes_probability: float
+    no_probability: float
+    market_id: str
+    category: str
+
+# Linha da listagem cronológica (fase 4) para um ShutdownMarket
+CHRONOLOGICAL_ROW = (
+    "{0.timing:20s} - YES: {0.yes_probability:5.1f}% | "
+    "NO: {0.no_probability:5.1f}% | "
+    "Vol: ${0.volume_24h:>10,.0f}"
+).format
+
+async def fetch_all_open_markets(client):
+    """
+    Busca todos os markets abertos paginando com offset.
+    Cada lote de CONCURRENT_PAGES páginas sai em paralelo; para quando
+    alguma página volta com menos de PAGE_SIZE markets.
+    """
+    sem = asyncio.Semaphore(CONCURRENT_PAGES)
+
+    async def fetch_page(page):
+        async with sem:
+            return await cached_get_json(
+                client,
+                GAMMA_MARKETS_URL,
+                params={'limit': PAGE_SIZE, 'offset': page * PAGE_SIZE, 'closed': 'false'}
+            )
+
+    all_markets = []
+    for first in range(0, MAX_PAGES, CONCURRENT_PAGES):
+        pages = await asyncio.gather(
+            *[fetch_page(page) for page in range(first, min(first + CONCURRENT_PAGES, MAX_PAGES))]
+        )
+        for page in pages:
+            all_markets.extend(page)
+            if len(page) < PAGE_SIZE:
+                return all_markets
+
+    return all_markets
+
+# Palavras-chave dos markets de shutdown
+SHUTDOWN_KEYWORDS = ['shutdown', 'government shutdown', 'govt shutdown', 'continuing resolution', 'CR']
+SEARCH_LIMIT = 200
+
+def matches_keywords(market, keywords_lower):
+    """Pergunta do market contém alguma das palavras-chave (já em minúsculas)"""
+    question = market.get('question', '').lower()
+    return any(keyword in question for keyword in keywords_lower)
+
+async def search_markets(client, keywords):
+    """
+    Busca server-side (q=) uma vez por palavra-chave, em paralelo,
+    deduplicando por id. A Gamma API ignora parâmetros que não conhece:
+    se todas as buscas voltarem a mesma lista (filtro ignorado) ou nada
+    casar, volta para a varredura completa de fetch_all_open_markets.
+    """
+    pages = await asyncio.gather(*[
+        cached_get_json(
+            client,
+            GAMMA_MARKETS_URL,
+            params={'q': keyword, 'closed': 'false', 'limit': SEARCH_LIMIT}
+        )
+        for keyword in keywords
+    ])
+
+    found = {}
+    result_ids = set()
+    for page in pages:
+        result_ids.add(tuple(m.get('id') for m in page))
+        for market in page:
+            found.setdefault(market.get('id'), market)
+
+    keywords_lower = [keyword.lower() for keyword in keywords]
+    markets = [m for m in found.values() if matches_keywords(m, keywords_lower)]
+    if markets and (len(keywords) == 1 or len(result_ids) > 1):
+        return markets
+
+    all_markets = await fetch_all_open_markets(client)
+    return [m for m in all_markets if matches_keywords(m, keywords_lower)]
 
 async def deep_shutdown_analysis():
     """Análise profunda dos markets de government shutdown"""
@@ -20,149 +130,155 @@ async def deep_shutdown_analysis():
     print("="*90)
     print(f"📅 Análise em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with httpx.AsyncClient(http2=HTTP2, limits=HTTP_LIMITS, timeout=30.0) as client:
         # 1. Buscar TODOS os markets sobre shutdown
         print("🔍 Fase 1: Buscando todos os markets relacionados ao shutdown...\n")
 
-        response = await client.get(
-            'https://gamma-api.polymarket.com/markets',
-            params={'limit': 100, 'closed': 'false'}
-        )
-        all_markets = response.json()
-
-        # Filtrar markets sobre shutdown
-        shutdown_keywords = ['shutdown', 'government shutdown', 'govt shutdown', 'continuing resolution', 'CR']
-        shutdown_markets = []
-
-        for market in all_markets:
-            question = market.get('question', '').lower()
-            if any(keyword.lower() in question for keyword in shutdown_keywords):
-                shutdown_markets.append(market)
-
-        print(f"✅ Encontrados {len(shutdown_markets)} markets sobre shutdown\n")
-        print("="*90)
-
-        # 2. Análise detalhada de cada market
-        print("\n📊 FASE 2: ANÁLISE DETALHADA DE CADA MARKET\n")
-        print("="*90)
-
-        market_data = []
-        total_volume = 0
-        total_liquidity = 0
-
-        for i, market in enumerate(shutdown_markets, 1):
-            question = market.get('question', 'N/A')
-            volume_24h = float(market.get("volume24hr", 0) or 0)
-            liquidity = float(market.get("liquidity", 0) or 0)
+        shutdown_markets = await search_markets(client, SHUTDOWN_KEYWORDS)
+
+        # Relatório acumulado em memória e escrito de uma vez no final
+        # (também se a análise falhar no meio)
+        buf = io.StringIO()
+        emit = functools.partial(print, file=buf)
+        try:
+            emit(f"✅ Encontrados {len(shutdown_markets)} markets sobre shutdown\n")
+            emit("="*90)
+
+            # 2. Análise detalhada de cada market
+            emit("\n📊 FASE 2: ANÁLISE DETALHADA DE CADA MARKET\n")
+            emit("="*90)
+
+            # Agregados acumulados numa única passada pelos markets
+            market_data = []
+            total_volume = 0
+            total_liquidity = 0
+            weighted_yes = 0
+            cumulative_prob = 0
+            timing_stats = defaultdict(lambda: [0, 0, 0])  # [markets, soma prob. YES, volume]
+            underpriced = []
+            overpriced = []
+            best_by_leg = {}  # perna da estratégia -> market de maior volume
+
+            for i, market in enumerate(shutdown_markets, 1):
+                question = market.get('question', 'N/A')
+                volume_24h = float(market.get("volume24hr", 0) or 0)
+                liquidity = float(market.get("liquidity", 0) or 0)
+
+                total_volume += volume_24h
+                total_liquidity += liquidity
+
+                # Parse prices
+                prices_raw = market.get('outcomePrices')
+                if isinstance(prices_raw, str):
+                    prices = orjson.loads(prices_raw)
+                else:
+                    prices = prices_raw
+
+                yes_price = float(prices[0]) if prices and len(prices) > 0 else 0
+                no_price = float(prices[1]) if prices and len(prices) > 1 else 0
+
+                # Extract timing from question
+                timing = extract_timing(question)
+
+                yes_probability = yes_price * 100
+                weighted_yes += yes_probability * volume_24h
+                cumulative_prob += yes_probability
+                stats = timing_stats[timing]
+                stats[0] += 1
+                stats[1] += yes_probability
+                stats[2] += volume_24h
+
+                market_info = ShutdownMarket(
+                    rank=i,
+                    question=question,
+                    timing=timing,
+                    volume_24h=volume_24h,
+                    liquidity=liquidity,
+                    yes_price=yes_price,
+                    no_price=no_price,
+                    yes_probability=yes_probability,
+                    no_probability=no_price * 100,
+                    market_id=market.get('id', ''),
+                    category=market.get('category', 'N/A')
+                )
+
+                market_data.append(market_info)
+
+                if volume_24h > 500000:
+                    if yes_probability < 15:
+                        underpriced.append(market_info)
+                    elif yes_probability > 85:
+                        overpriced.append(market_info)
+
+                leg = STRATEGY_LEG_BY_TIMING.get(timing)
+                if leg and (leg not in best_by_leg or volume_24h > best_by_leg[leg].volume_24h):
+                    best_by_leg[leg] = market_info
+
+                emit(f"#{i} - {question}")
+                emit(f"   📅 Timing: {timing}")
+                emit(f"   💰 Volume 24h: ${volume_24h:,.0f}")
+                emit(f"   💧 Liquidez: ${liquidity:,.0f}")
+                emit(f"   📈 Probabilidades: YES {yes_price*100:.1f}% | NO {no_price*100:.1f}%")
+                emit()
+
+            # 3. Análise de probabilidades agregadas
+            emit("\n" + "="*90)
+            emit("📊 FASE 3: ANÁLISE DE PROBABILIDADES & CONSENSO DO MERCADO")
+            emit("="*90 + "\n")
+
+            emit(f"💰 Volume Total 24h: ${total_volume:,.0f}")
+            emit(f"💧 Liquidez Total: ${total_liquidity:,.0f}")
+            emit(f"📊 Número de Markets: {len(shutdown_markets)}")
+            emit(f"📈 Volume Médio por Market: ${total_volume/len(shutdown_markets):,.0f}\n")
+
+            emit("⏰ DISTRIBUIÇÃO POR PERÍODO DE RESOLUÇÃO:\n")
+
+            for timing, (count, prob_sum, total_vol) in sorted(timing_stats.items()):
+                avg_prob = prob_sum / count
+
+                emit(f"📅 {timing}:")
+                emit(f"   Markets: {count}")
+                emit(f"   Probabilidade média YES: {avg_prob:.1f}%")
+                emit(f"   Volume combinado: ${total_vol:,.0f}")
+                emit()
+
+            # 4. Análise de correlação e arbitragem
+            emit("\n" + "="*90)
+            emit("🔄 FASE 4: ANÁLISE DE CORRELAÇÃO & OPORTUNIDADES DE ARBITRAGEM")
+            emit("="*90 + "\n")
+
+            # Ordenar por timing para encontrar inconsistências
+            sorted_markets = sorted(market_data, key=attrgetter('timing'))
+
+            emit("📊 PROBABILIDADES POR ORDEM CRONOLÓGICA:\n")
+
+            if sorted_markets:
+                emit("\n".join(map(CHRONOLOGICAL_ROW, sorted_markets)))
+
+            # Detectar arbitragem
+            emit("\n⚠️  ANÁLISE DE CONSISTÊNCIA:\n")
+
+            # A soma das probabilidades de eventos mutuamente exclusivos deve ser ~100%
+            if cumulative_prob > 110:
+                emit(f"🔴 ALERTA: Probabilidade acumulada = {cumulative_prob:.1f}%")
+                emit(f"   Isso está ACIMA de 100%! Possível arbitragem:")
+                emit(f"   → Vender YES em todos os markets simultaneamente")
+                emit(f"   → Apenas UM pode ser verdadeiro, mas mercado precifica {cumulative_prob:.0f}%")
+                emit(f"   → Edge potencial: {cumulative_prob - 100:.1f}%\n")
+            elif cumulative_prob < 90:
+                emit(f"🟢 OPORTUNIDADE: Probabilidade acumulada = {cumulative_prob:.1f}%")
+                emit(f"   Isso está ABAIXO de 100%! Possível arbitragem:")
+                emit(f"   → Comprar YES nos markets mais underpriced")
+                emit(f"   → Edge potencial: {100 - cumulative_prob:.1f}%\n")
+            else:
+                emit(f"✅ Mercado razoavelmente eficiente: Probabilidade acumulada = {cumulative_prob:.1f}%\n")
 
-            total_volume += volume_24h
-            total_liquidity += liquidity
+            # 5. Análise de contexto político
+            emit("\n" + "="*90)
+            emit("🏛️  FASE 5: CONTEXTO POLÍTICO & ANÁLISE FUNDAMENTAL")
+            emit("="*90 + "\n")
 
-            # Parse prices
-            prices_raw = market.get('outcomePrices')
-            if isinstance(prices_raw, str):
-                prices = json.loads(prices_raw)
-            else:
-                prices = prices_raw
-
-            yes_price = float(prices[0]) if prices and len(prices) > 0 else 0
-            no_price = float(prices[1]) if prices and len(prices) > 1 else 0
-
-            # Extract timing from question
-            timing = extract_timing(question)
-
-            market_info = {
-                'rank': i,
-                'question': question,
-                'timing': timing,
-                'volume_24h': volume_24h,
-                'liquidity': liquidity,
-                'yes_price': yes_price,
-                'no_price': no_price,
-                'yes_probability': yes_price * 100,
-                'no_probability': no_price * 100,
-                'market_id': market.get('id', ''),
-                'category': market.get('category', 'N/A')
-            }
-
-            market_data.append(market_info)
-
-            print(f"#{i} - {question}")
-            print(f"   📅 Timing: {timing}")
-            print(f"   💰 Volume 24h: ${volume_24h:,.0f}")
-            print(f"   💧 Liquidez: ${liquidity:,.0f}")
-            print(f"   📈 Probabilidades: YES {yes_price*100:.1f}% | NO {no_price*100:.1f}%")
-            print()
-
-        # 3. Análise de probabilidades agregadas
-        print("\n" + "="*90)
-        print("📊 FASE 3: ANÁLISE DE PROBABILIDADES & CONSENSO DO MERCADO")
-        print("="*90 + "\n")
-
-        print(f"💰 Volume Total 24h: ${total_volume:,.0f}")
-        print(f"💧 Liquidez Total: ${total_liquidity:,.0f}")
-        print(f"📊 Número de Markets: {len(shutdown_markets)}")
-        print(f"📈 Volume Médio por Market: ${total_volume/len(shutdown_markets):,.0f}\n")
-
-        # Organizar por timing
-        by_timing = defaultdict(list)
-        for m in market_data:
-            by_timing[m['timing']].append(m)
-
-        print("⏰ DISTRIBUIÇÃO POR PERÍODO DE RESOLUÇÃO:\n")
-
-        for timing in sorted(by_timing.keys()):
-            markets = by_timing[timing]
-            avg_prob = sum(m['yes_probability'] for m in markets) / len(markets)
-            total_vol = sum(m['volume_24h'] for m in markets)
-
-            print(f"📅 {timing}:")
-            print(f"   Markets: {len(markets)}")
-            print(f"   Probabilidade média YES: {avg_prob:.1f}%")
-            print(f"   Volume combinado: ${total_vol:,.0f}")
-            print()
-
-        # 4. Análise de correlação e arbitragem
-        print("\n" + "="*90)
-        print("🔄 FASE 4: ANÁLISE DE CORRELAÇÃO & OPORTUNIDADES DE ARBITRAGEM")
-        print("="*90 + "\n")
-
-        # Ordenar por timing para encontrar inconsistências
-        sorted_markets = sorted(market_data, key=lambda x: x['timing'])
-
-        print("📊 PROBABILIDADES POR ORDEM CRONOLÓGICA:\n")
-
-        cumulative_prob = 0
-        for m in sorted_markets:
-            print(f"{m['timing']:20s} - YES: {m['yes_probability']:5.1f}% | "
-                  f"NO: {m['no_probability']:5.1f}% | "
-                  f"Vol: ${m['volume_24h']:>10,.0f}")
-            cumulative_prob += m['yes_probability']
-
-        # Detectar arbitragem
-        print("\n⚠️  ANÁLISE DE CONSISTÊNCIA:\n")
-
-        # A soma das probabilidades de eventos mutuamente exclusivos deve ser ~100%
-        if cumulative_prob > 110:
-            print(f"🔴 ALERTA: Probabilidade acumulada = {cumulative_prob:.1f}%")
-            print(f"   Isso está ACIMA de 100%! Possível arbitragem:")
-            print(f"   → Vender YES em todos os markets simultaneamente")
-            print(f"   → Apenas UM pode ser verdadeiro, mas mercado precifica {cumulative_prob:.0f}%")
-            print(f"   → Edge potencial: {cumulative_prob - 100:.1f}%\n")
-        elif cumulative_prob < 90:
-            print(f"🟢 OPORTUNIDADE: Probabilidade acumulada = {cumulative_prob:.1f}%")
-            print(f"   Isso está ABAIXO de 100%! Possível arbitragem:")
-            print(f"   → Comprar YES nos markets mais underpriced")
-            print(f"   → Edge potencial: {100 - cumulative_prob:.1f}%\n")
-        else:
-            print(f"✅ Mercado razoavelmente eficiente: Probabilidade acumulada = {cumulative_prob:.1f}%\n")
-
-        # 5. Análise de contexto político
-        print("\n" + "="*90)
-        print("🏛️  FASE 5: CONTEXTO POLÍTICO & ANÁLISE FUNDAMENTAL")
-        print("="*90 + "\n")
-
-        political_context = """
+            political_context = """
 📰 CONTEXTO ATUAL DO SHUTDOWN:
 
 🗳️  SITUAÇÃO POLÍTICA:
@@ -188,211 +304,213 @@ async def deep_shutdown_analysis():
    • Shutdowns longos são raros mas possíveis
         """
 
-        print(political_context)
-
-        # 6. Análise de value & recomendações
-        print("\n" + "="*90)
-        print("💡 FASE 6: INSIGHTS ACIONÁVEIS & RECOMENDAÇÕES")
-        print("="*90 + "\n")
-
-        # Encontrar o market com melhor value
-        underpriced = [m for m in market_data if m['yes_probability'] < 15 and m['volume_24h'] > 500000]
-        overpriced = [m for m in market_data if m['yes_probability'] > 85 and m['volume_24h'] > 500000]
-
-        if underpriced:
-            print("🟢 OPORTUNIDADES DE COMPRA (YES underpriced):\n")
-            underpriced.sort(key=lambda x: x['yes_probability'])
-
-            for m in underpriced[:3]:
-                implied_odds = 1 / m['yes_probability'] * 100 if m['yes_probability'] > 0 else 999
-                print(f"• {m['question'][:70]}...")
-                print(f"  YES: {m['yes_probability']:.1f}% (${m['yes_price']:.4f})")
-                print(f"  Odds implícitas: {implied_odds:.1f}x retorno")
-                print(f"  Volume: ${m['volume_24h']:,.0f}")
-                print(f"  💡 Análise: Possível underpricing - mercado subestima probabilidade")
-                print()
-
-        if overpriced:
-            print("\n🔴 OPORTUNIDADES DE VENDA (NO underpriced / YES overpriced):\n")
-            overpriced.sort(key=lambda x: -x['yes_probability'])
-
-            for m in overpriced[:3]:
-                print(f"• {m['question'][:70]}...")
-                print(f"  YES: {m['yes_probability']:.1f}% | NO: {m['no_probability']:.1f}%")
-                print(f"  Volume: ${m['volume_24h']:,.0f}")
-                print(f"  💡 Análise: NO pode estar underpriced - considerar vender YES")
-                print()
-
-        # 7. Análise de sentimento do mercado
-        print("\n" + "="*90)
-        print("📈 FASE 7: ANÁLISE DE SENTIMENTO & MOMENTUM")
-        print("="*90 + "\n")
-
-        # Calcular sentimento agregado
-        weighted_sentiment = sum(m['yes_probability'] * m['volume_24h'] for m in market_data) / total_volume
-
-        print(f"🎯 SENTIMENTO AGREGADO DO MERCADO (ponderado por volume):")
-        print(f"   Probabilidade média de shutdown continuar: {weighted_sentiment:.1f}%")
-        print()
-
-        if weighted_sentiment < 10:
-            print("✅ INTERPRETAÇÃO: Mercado MUITO CONFIANTE que shutdown resolverá rapidamente")
-            print("   → Consenso forte de resolução iminente")
-            print("   → Possível complacência? Considerar hedge com YES barato\n")
-        elif weighted_sentiment < 30:
-            print("🟡 INTERPRETAÇÃO: Mercado MODERADAMENTE CONFIANTE em resolução rápida")
-            print("   → Ainda há incerteza considerável")
-            print("   → Boas oportunidades de trading em ambos os lados\n")
-        else:
-            print("🔴 INTERPRETAÇÃO: Mercado PESSIMISTA sobre resolução rápida")
-            print("   → Expectativa de impasse prolongado")
-            print("   → Considerar posições mais longas\n")
-
-        # 8. Estratégia recomendada
-        print("\n" + "="*90)
-        print("🎯 FASE 8: ESTRATÉGIA DE TRADING RECOMENDADA")
-        print("="*90 + "\n")
-
-        print("💼 ESTRATÉGIA MULTI-LEG:\n")
-
-        # Encontrar o melhor market de cada categoria
-        early_markets = [m for m in market_data if 'november 8' in m['timing'].lower() or 'november 11' in m['timing'].lower()]
-        mid_markets = [m for m in market_data if 'november 12' in m['timing'].lower() or 'november 15' in m['timing'].lower()]
-        late_markets = [m for m in market_data if 'november 16' in m['timing'].lower() or 'later' in m['timing'].lower()]
-
-        print("📊 PORTFOLIO SUGERIDO ($1,000):\n")
-
-        total_allocation = 0
-
-        if early_markets:
-            best_early = max(early_markets, key=lambda x: x['volume_24h'])
-            allocation = 200
-            total_allocation += allocation
-
-            print(f"1️⃣  POSIÇÃO CONSERVADORA (${allocation}):")
-            print(f"   Market: {best_early['question'][:65]}...")
-            print(f"   Lado: NO @ ${best_early['no_price']:.4f}")
-            print(f"   Lógica: Alta probabilidade de resolução rápida")
-            print(f"   Retorno esperado: 3-5% em 1-3 dias")
-            print()
-
-        if mid_markets:
-            best_mid = max(mid_markets, key=lambda x: x['volume_24h'])
-            allocation = 300
-            total_allocation += allocation
-
-            print(f"2️⃣  POSIÇÃO EQUILIBRADA (${allocation}):")
-            print(f"   Market: {best_mid['question'][:65]}...")
-
-            if best_mid['yes_probability'] < 30:
-                print(f"   Lado: YES @ ${best_mid['yes_price']:.4f}")
-                print(f"   Lógica: Underpriced - melhor risk/reward")
+            emit(political_context)
+
+            # 6. Análise de value & recomendações
+            emit("\n" + "="*90)
+            emit("💡 FASE 6: INSIGHTS ACIONÁVEIS & RECOMENDAÇÕES")
+            emit("="*90 + "\n")
+
+            # Encontrar o market com melhor value
+            if underpriced:
+                emit("🟢 OPORTUNIDADES DE COMPRA (YES underpriced):\n")
+                # Só os 3 mais baratos são usados (aqui e no resumo)
+                underpriced = heapq.nsmallest(3, underpriced, key=attrgetter('yes_probability'))
+
+                for m in underpriced:
+                    implied_odds = 1 / m.yes_probability * 100 if m.yes_probability > 0 else 999
+                    emit(f"• {m.question[:70]}...")
+                    emit(f"  YES: {m.yes_probability:.1f}% (${m.yes_price:.4f})")
+                    emit(f"  Odds implícitas: {implied_odds:.1f}x retorno")
+                    emit(f"  Volume: ${m.volume_24h:,.0f}")
+                    emit(f"  💡 Análise: Possível underpricing - mercado subestima probabilidade")
+                    emit()
+
+            if overpriced:
+                emit("\n🔴 OPORTUNIDADES DE VENDA (NO underpriced / YES overpriced):\n")
+                for m in heapq.nlargest(3, overpriced, key=attrgetter('yes_probability')):
+                    emit(f"• {m.question[:70]}...")
+                    emit(f"  YES: {m.yes_probability:.1f}% | NO: {m.no_probability:.1f}%")
+                    emit(f"  Volume: ${m.volume_24h:,.0f}")
+                    emit(f"  💡 Análise: NO pode estar underpriced - considerar vender YES")
+                    emit()
+
+            # 7. Análise de sentimento do mercado
+            emit("\n" + "="*90)
+            emit("📈 FASE 7: ANÁLISE DE SENTIMENTO & MOMENTUM")
+            emit("="*90 + "\n")
+
+            # Calcular sentimento agregado
+            weighted_sentiment = weighted_yes / total_volume
+
+            emit(f"🎯 SENTIMENTO AGREGADO DO MERCADO (ponderado por volume):")
+            emit(f"   Probabilidade média de shutdown continuar: {weighted_sentiment:.1f}%")
+            emit()
+
+            if weighted_sentiment < 10:
+                emit("✅ INTERPRETAÇÃO: Mercado MUITO CONFIANTE que shutdown resolverá rapidamente")
+                emit("   → Consenso forte de resolução iminente")
+                emit("   → Possível complacência? Considerar hedge com YES barato\n")
+            elif weighted_sentiment < 30:
+                emit("🟡 INTERPRETAÇÃO: Mercado MODERADAMENTE CONFIANTE em resolução rápida")
+                emit("   → Ainda há incerteza considerável")
+                emit("   → Boas oportunidades de trading em ambos os lados\n")
             else:
-                print(f"   Lado: NO @ ${best_mid['no_price']:.4f}")
-                print(f"   Lógica: Seguir consenso do mercado")
-
-            print(f"   Retorno esperado: 10-20% em 3-7 dias")
-            print()
-
-        if late_markets:
-            best_late = max(late_markets, key=lambda x: x['volume_24h'])
-            allocation = 250
-            total_allocation += allocation
-
-            print(f"3️⃣  POSIÇÃO ESPECULATIVA (${allocation}):")
-            print(f"   Market: {best_late['question'][:65]}...")
-            print(f"   Lado: YES @ ${best_late['yes_price']:.4f}")
-            print(f"   Lógica: Lottery ticket - baixa probabilidade, alto retorno")
-            print(f"   Retorno esperado: 1000%+ se vencer (ou -100%)")
-            print()
-
-        cash_reserve = 1000 - total_allocation
-        if cash_reserve > 0:
-            print(f"4️⃣  CASH RESERVE (${cash_reserve}):")
-            print(f"   Manter em USDC para oportunidades emergentes")
-            print(f"   Usar se surgirem notícias que mudem probabilidades\n")
-
-        # 9. Catalisadores e monitoramento
-        print("\n" + "="*90)
-        print("📡 FASE 9: CATALISADORES & MONITORAMENTO")
-        print("="*90 + "\n")
-
-        print("🔔 EVENTOS A MONITORAR:\n")
-        print("✅ POSITIVOS (Resolução rápida):")
-        print("   • Acordo bipartidário anunciado")
-        print("   • Lideranças de ambos partidos concordando")
-        print("   • Votação de CR agendada")
-        print("   • Pressão pública/mídia aumentando")
-        print()
-
-        print("❌ NEGATIVOS (Shutdown prolongado):")
-        print("   • Impasse em negociações")
-        print("   • Demandas extremas de qualquer lado")
-        print("   • Falha em votação")
-        print("   • Rhetoric político intensificando")
-        print()
-
-        print("📱 FONTES PARA MONITORAR:")
-        print("   • Twitter de lideranças do Congresso")
-        print("   • C-SPAN (votações ao vivo)")
-        print("   • Politico, The Hill (notícias)")
-        print("   • Polymarket (mudanças de preço em tempo real)")
-        print()
-
-        # 10. Resumo executivo
-        print("\n" + "="*90)
-        print("📋 RESUMO EXECUTIVO - KEY TAKEAWAYS")
-        print("="*90 + "\n")
-
-        print("🎯 TOP 3 INSIGHTS:\n")
-
-        print("1️⃣  CONSENSO DO MERCADO:")
-        print(f"   Mercado precifica {weighted_sentiment:.1f}% de chance de shutdown prolongado")
-        print(f"   Isto significa {100-weighted_sentiment:.1f}% de confiança em resolução rápida")
-        print()
-
-        print("2️⃣  OPORTUNIDADE DE VALOR:")
-        if underpriced:
-            best_value = underpriced[0]
-            roi = (1 / best_value['yes_probability'] * 100) - 100 if best_value['yes_probability'] > 0 else 999
-            print(f"   Melhor trade: {best_value['question'][:60]}...")
-            print(f"   YES @ {best_value['yes_probability']:.1f}% = {roi:.0f}% ROI potencial")
-        print()
-
-        print("3️⃣  RISCO/RECOMPENSA:")
-        print(f"   Volume total: ${total_volume:,.0f}/dia indica alta convicção")
-        print(f"   Liquidez: ${total_liquidity:,.0f} permite entrada/saída fácil")
-        print(f"   Timing: Resolução em 1-14 dias = retorno rápido do capital")
-        print()
-
-        print("💡 RECOMENDAÇÃO FINAL:")
-        print("   → Estratégia multi-leg com diversificação temporal")
-        print("   → 20% conservador (alta probabilidade)")
-        print("   → 30% equilibrado (médio risco/retorno)")
-        print("   → 25% especulativo (lottery ticket)")
-        print("   → 25% cash para oportunidades")
-        print()
-        print("   ⚠️  IMPORTANTE: Monitorar notícias diariamente!")
-        print("   ⚡ Use WebSocket do MCP para alertas em tempo real!")
+                emit("🔴 INTERPRETAÇÃO: Mercado PESSIMISTA sobre resolução rápida")
+                emit("   → Expectativa de impasse prolongado")
+                emit("   → Considerar posições mais longas\n")
+
+            # 8. Estratégia recomendada
+            emit("\n" + "="*90)
+            emit("🎯 FASE 8: ESTRATÉGIA DE TRADING RECOMENDADA")
+            emit("="*90 + "\n")
+
+            emit("💼 ESTRATÉGIA MULTI-LEG:\n")
+
+            # Encontrar o melhor market de cada categoria
+            best_early = best_by_leg.get('early')
+            best_mid = best_by_leg.get('mid')
+            best_late = best_by_leg.get('late')
+
+            emit("📊 PORTFOLIO SUGERIDO ($1,000):\n")
+
+            total_allocation = 0
+
+            if best_early:
+                allocation = 200
+                total_allocation += allocation
+
+                emit(f"1️⃣  POSIÇÃO CONSERVADORA (${allocation}):")
+                emit(f"   Market: {best_early.question[:65]}...")
+                emit(f"   Lado: NO @ ${best_early.no_price:.4f}")
+                emit(f"   Lógica: Alta probabilidade de resolução rápida")
+                emit(f"   Retorno esperado: 3-5% em 1-3 dias")
+                emit()
+
+            if best_mid:
+                allocation = 300
+                total_allocation += allocation
+
+                emit(f"2️⃣  POSIÇÃO EQUILIBRADA (${allocation}):")
+                emit(f"   Market: {best_mid.question[:65]}...")
+
+                if best_mid.yes_probability < 30:
+                    emit(f"   Lado: YES @ ${best_mid.yes_price:.4f}")
+                    emit(f"   Lógica: Underpriced - melhor risk/reward")
+                else:
+                    emit(f"   Lado: NO @ ${best_mid.no_price:.4f}")
+                    emit(f"   Lógica: Seguir consenso do mercado")
+
+                emit(f"   Retorno esperado: 10-20% em 3-7 dias")
+                emit()
+
+            if best_late:
+                allocation = 250
+                total_allocation += allocation
+
+                emit(f"3️⃣  POSIÇÃO ESPECULATIVA (${allocation}):")
+                emit(f"   Market: {best_late.question[:65]}...")
+                emit(f"   Lado: YES @ ${best_late.yes_price:.4f}")
+                emit(f"   Lógica: Lottery ticket - baixa probabilidade, alto retorno")
+                emit(f"   Retorno esperado: 1000%+ se vencer (ou -100%)")
+                emit()
+
+            cash_reserve = 1000 - total_allocation
+            if cash_reserve > 0:
+                emit(f"4️⃣  CASH RESERVE (${cash_reserve}):")
+                emit(f"   Manter em USDC para oportunidades emergentes")
+                emit(f"   Usar se surgirem notícias que mudem probabilidades\n")
+
+            # 9. Catalisadores e monitoramento
+            emit("\n" + "="*90)
+            emit("📡 FASE 9: CATALISADORES & MONITORAMENTO")
+            emit("="*90 + "\n")
+
+            emit("🔔 EVENTOS A MONITORAR:\n")
+            emit("✅ POSITIVOS (Resolução rápida):")
+            emit("   • Acordo bipartidário anunciado")
+            emit("   • Lideranças de ambos partidos concordando")
+            emit("   • Votação de CR agendada")
+            emit("   • Pressão pública/mídia aumentando")
+            emit()
+
+            emit("❌ NEGATIVOS (Shutdown prolongado):")
+            emit("   • Impasse em negociações")
+            emit("   • Demandas extremas de qualquer lado")
+            emit("   • Falha em votação")
+            emit("   • Rhetoric político intensificando")
+            emit()
+
+            emit("📱 FONTES PARA MONITORAR:")
+            emit("   • Twitter de lideranças do Congresso")
+            emit("   • C-SPAN (votações ao vivo)")
+            emit("   • Politico, The Hill (notícias)")
+            emit("   • Polymarket (mudanças de preço em tempo real)")
+            emit()
+
+            # 10. Resumo executivo
+            emit("\n" + "="*90)
+            emit("📋 RESUMO EXECUTIVO - KEY TAKEAWAYS")
+            emit("="*90 + "\n")
+
+            emit("🎯 TOP 3 INSIGHTS:\n")
+
+            emit("1️⃣  CONSENSO DO MERCADO:")
+            emit(f"   Mercado precifica {weighted_sentiment:.1f}% de chance de shutdown prolongado")
+            emit(f"   Isto significa {100-weighted_sentiment:.1f}% de confiança em resolução rápida")
+            emit()
+
+            emit("2️⃣  OPORTUNIDADE DE VALOR:")
+            if underpriced:
+                best_value = underpriced[0]
+                roi = (1 / best_value.yes_probability * 100) - 100 if best_value.yes_probability > 0 else 999
+                emit(f"   Melhor trade: {best_value.question[:60]}...")
+                emit(f"   YES @ {best_value.yes_probability:.1f}% = {roi:.0f}% ROI potencial")
+            emit()
+
+            emit("3️⃣  RISCO/RECOMPENSA:")
+            emit(f"   Volume total: ${total_volume:,.0f}/dia indica alta convicção")
+            emit(f"   Liquidez: ${total_liquidity:,.0f} permite entrada/saída fácil")
+            emit(f"   Timing: Resolução em 1-14 dias = retorno rápido do capital")
+            emit()
+
+            emit("💡 RECOMENDAÇÃO FINAL:")
+            emit("   → Estratégia multi-leg com diversificação temporal")
+            emit("   → 20% conservador (alta probabilidade)")
+            emit("   → 30% equilibrado (médio risco/retorno)")
+            emit("   → 25% especulativo (lottery ticket)")
+            emit("   → 25% cash para oportunidades")
+            emit()
+            emit("   ⚠️  IMPORTANTE: Monitorar notícias diariamente!")
+            emit("   ⚡ Use WebSocket do MCP para alertas em tempo real!")
+        finally:
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+
+
+# Períodos de resolução citados nas perguntas, numa única varredura.
+# Quando aparecem vários, vale o primeiro de TIMING_PRIORITY.
+TIMING_RE = re.compile(r'nov(?:ember)?\.? (8|11|12|15|16)|(later)|(before)', re.IGNORECASE)
+TIMING_BY_DAY = {
+    '8': "Nov 8-11",
+    '11': "Nov 8-11",
+    '12': "Nov 12-15",
+    '15': "Nov 12-15",
+    '16': "Nov 16+",
+}
+# Perna da estratégia multi-leg (fase 8) de cada período
+STRATEGY_LEG_BY_TIMING = {"Nov 8-11": 'early', "Nov 12-15": 'mid', "Nov 16+": 'late'}
+TIMING_PRIORITY = {"Nov 8-11": 0, "Nov 12-15": 1, "Nov 16+": 2, "Before specified": 3}
 
 def extract_timing(question):
     """Extract timing info from question"""
-    q = question.lower()
-
-    if 'november 8' in q or 'nov 8' in q or 'nov. 8' in q:
-        return "Nov 8-11"
-    elif 'november 11' in q or 'nov 11' in q:
-        return "Nov 8-11"
-    elif 'november 12' in q or 'nov 12' in q:
-        return "Nov 12-15"
-    elif 'november 15' in q or 'nov 15' in q:
-        return "Nov 12-15"
-    elif 'november 16' in q or 'nov 16' in q or 'later' in q:
-        return "Nov 16+"
-    elif 'before' in q:
-        return "Before specified"
-    else:
+    timings = [
+        TIMING_BY_DAY[m.group(1)] if m.group(1) else "Nov 16+" if m.group(2) else "Before specified"
+        for m in TIMING_RE.finditer(question)
+    ]
+    if not timings:
         return "General/Unspecified"
+    return min(timings, key=TIMING_PRIORITY.__getitem__)
 
 if __name__ == "__main__":
     asyncio.run(deep_shutdown_analysis())
@@ -7,9 +7,198 @@ import sys
 sys.path.insert(0, 'src')
 
 import asyncio
+import functools
+import heapq
+import io
+import re
 import httpx
-import json
+import orjson
+from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
+
+# Markets específicos identificados
+SHUTDOWN_QUERIES = [
+    'Will the Government shutdown end November 8-11?',
+    'Will the Government shutdown end November 16 or later?',
+    'Will the Government shutdown end November 12-15?',
+    'Will the Government shutdown end by November 15?',
+    'Will the Government shutdown end by December 31?',
+    'Will the Government shutdown end by November 30?',
+    'Will the government shutdown end November 10?'
+]
+# Normalização: minúsculas, pontuação vira espaço, espaços colapsados
+# ("November 8-11?" e "november 8 - 11" ficam iguais)
+PUNCTUATION_RE = re.compile(r'[^\w\s]+')
+
+def normalize_question(text):
+    """Forma canônica da pergunta para comparação"""
+    return ' '.join(PUNCTUATION_RE.sub(' ', text.lower()).split())
+
+# Calculadas uma vez: igualdade exata via set (forma normalizada), senão
+# busca por substring nas strings só em minúsculas, como antes - na forma
+# normalizada "... november 1" estaria contida em "... november 10"
+SHUTDOWN_QUERY_SET = frozenset(normalize_question(q) for q in SHUTDOWN_QUERIES)
+SHUTDOWN_QUERIES_LOWER = tuple(q.lower() for q in SHUTDOWN_QUERIES)
+
+def is_shutdown_question(question):
+    """Pergunta é (ou contém/está contida em) um dos markets de shutdown"""
+    if normalize_question(question) in SHUTDOWN_QUERY_SET:
+        return True
+    ql = question.lower()
+    return any(q in ql or ql in q for q in SHUTDOWN_QUERIES_LOWER)
+
+@dataclass(slots=True, frozen=True)
+class ShutdownRow:
+    """Market de shutdown já convertido: campos tipados em vez de um dict por market"""
+    question: str
+    volume_24h: float
+    liquidity: float
+    yes_price: float
+    no_price: float
+    yes_prob: float
+    no_prob: float
+    yes_odds: float
+    no_odds: float
+    market_id: str
+    # Rótulo e chaves de ordenação calculados uma vez na extração
+    short_question: str
+    priority: int
+    value_key: float
+
+# Bloco da fase 1 (número, ShutdownRow) e linha da fase 2 (ShutdownRow),
+# cada um formatado numa única chamada
+MARKET_BLOCK = (
+    "#{0} - {1.question}\n"
+    "   💰 Volume 24h: ${1.volume_24h:,.0f}\n"
+    "   💧 Liquidez: ${1.liquidity:,.0f}\n"
+    "   📈 YES: {1.yes_prob:.1f}% (${1.yes_price:.4f}) - Odds: {1.yes_odds:.1f}x\n"
+    "   📉 NO:  {1.no_prob:.1f}% (${1.no_price:.4f}) - Odds: {1.no_odds:.1f}x\n"
+).format
+PROBABILITY_ROW = "{0.short_question:<72} YES: {0.yes_prob:5.1f}%".format
+
+# Trechos fixos do relatório (sem valores calculados), montados uma vez.
+# Fase 4: timeline e catalisadores
+TIMELINE_SECTION = "\n".join((
+    "\n" + "="*100,
+    "⏰ FASE 4: ANÁLISE TEMPORAL & CATALISADORES",
+    "="*100 + "\n",
+    "📅 TIMELINE DOS EVENTOS:\n",
+    "Nov 8-11:  Resolução muito próxima (1-4 dias)",
+    "Nov 12-15: Resolução de curto prazo (5-8 dias)",
+    "Nov 16+:   Resolução média prazo (9+ dias)",
+    "Nov 30:    Resolução longo prazo (23 dias)",
+    "Dec 31:    Resolução muito longa (54 dias)",
+    "",
+    "🔔 CATALISADORES IMINENTES:\n",
+    "📰 POSITIVOS (Resolução rápida):",
+    "   • Acordo bipartidário iminente",
+    "   • Pressão econômica (mercados, empresas)",
+    "   • Midterms próximas (pressão eleitoral)",
+    "   • Feriados chegando (Thanksgiving)",
+    "",
+    "⚠️  NEGATIVOS (Shutdown prolongado):",
+    "   • Gridlock político persistente",
+    "   • Demandas irreconciliáveis",
+    "   • Posturing para eleições",
+    "   • Falta de urgência imediata",
+    "",
+))
+
+# Insights 4 e 5, ação recomendada e próximos passos
+CLOSING_SECTION = "\n".join((
+    "4️⃣  TIMELINE CRÍTICO:",
+    "    • Próximos 3-5 dias são CRUCIAIS",
+    "    • Catalisadores: votações, acordos, notícias",
+    "    • Use WebSocket do MCP para alertas real-time\n",
+    "5️⃣  RISK/REWARD:",
+    "    • Trades conservadores: 3-5% retorno, baixo risco",
+    "    • Trades de valor: 500-1000% retorno, médio-alto risco",
+    "    • Portfolio diversificado: 15-30% retorno esperado\n",
+    "\n💡 AÇÃO RECOMENDADA:",
+    "   ✅ Entrar agora com posições pequenas",
+    "   ✅ Monitorar notícias DIARIAMENTE",
+    "   ✅ Usar stop-loss se cenário mudar",
+    "   ✅ Escalar posições com novas informações",
+    "   ✅ Ativar WebSocket alerts no MCP\n",
+    "⚡ NEXT STEPS:",
+    "   1. Configure WebSocket para alertas real-time",
+    "   2. Entre com 20-30% do capital inicial",
+    "   3. Reserve 70% para ajustes baseados em notícias",
+    "   4. Monitor C-SPAN, Politico, Twitter de congressistas",
+    "   5. Ajuste posições a cada 12-24h\n",
+))
+
+# Volume 24h mínimo para um market entrar no ranking de value bets
+VALUE_BET_MIN_VOLUME = 500000
+
+# Prioridade de ordenação por data: uma regex em vez de vários testes "in".
+# Um grupo por nível (grupo N = prioridade N), então a prioridade sai direto de
+# match.lastindex, sem lower() nem dict por match. Quando aparecem vários, vale
+# a menor prioridade (mesma ordem do if/elif).
+DATE_PRIORITY_LEVELS = (
+    ('november 8', 'november 10', '8-11'),
+    ('november 12', '12-15'),
+    ('november 15',),
+    ('november 16', 'later'),
+    ('november 30',),
+    ('december',),
+)
+DATE_RE = re.compile(
+    '|'.join(f"({'|'.join(map(re.escape, level))})" for level in DATE_PRIORITY_LEVELS),
+    re.IGNORECASE
+)
+
+def extract_date_priority(question):
+    """Prioridade de ordenação do market pela data na pergunta"""
+    return min((m.lastindex for m in DATE_RE.finditer(question)), default=99)
+
+# Perna do portfolio recomendado de cada data citada na pergunta
+PORTFOLIO_LEG_BY_DATE = {
+    'november 8': 'early', '8-11': 'early',
+    'november 16': 'mid', 'later': 'mid',
+    'december': 'long',
+}
+
+def first_market_by_leg(markets):
+    """Primeiro market (na ordem dada) de cada perna, numa única passada"""
+    by_leg = {}
+    for market in markets:
+        for m in DATE_RE.finditer(market.question):
+            leg = PORTFOLIO_LEG_BY_DATE.get(m.group().lower())
+            if leg:
+                by_leg.setdefault(leg, market)
+    return by_leg
+
+# Top markets por volume: páginas buscadas todas em paralelo
+GAMMA_MARKETS_URL = 'https://gamma-api.polymarket.com/markets'
+PAGE_SIZE = 100
+PAGES = 3
+
+async def fetch_top_markets(client, pages=PAGES):
+    """Busca `pages` páginas dos markets abertos de maior volume de uma vez"""
+    async def fetch_page(page):
+        response = await client.get(
+            GAMMA_MARKETS_URL,
+            params={
+                'limit': PAGE_SIZE,
+                'offset': page * PAGE_SIZE,
+                'closed': 'false',
+                'order': 'volume24hr',
+                'ascending': 'false'
+            }
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    results = await asyncio.gather(*[fetch_page(page) for page in range(pages)])
+
+    # O ranking pode mudar entre as requisições: deduplicar por id
+    unique = {}
+    for page in results:
+        for market in page:
+            unique.setdefault(market.get('id'), market)
+    return list(unique.values())
 
 async def ultra_shutdown_analysis():
     """Análise ultra profunda dos markets de government shutdown"""
@@ -19,338 +208,266 @@ async def ultra_shutdown_analysis():
     print("="*100)
     print(f"📅 Análise em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
-    # Markets específicos identificados
-    shutdown_queries = [
-        'Will the Government shutdown end November 8-11?',
-        'Will the Government shutdown end November 16 or later?',
-        'Will the Government shutdown end November 12-15?',
-        'Will the Government shutdown end by November 15?',
-        'Will the Government shutdown end by December 31?',
-        'Will the Government shutdown end by November 30?',
-        'Will the government shutdown end November 10?'
-    ]
-
     async with httpx.AsyncClient(timeout=30.0) as client:
         # Buscar top markets
-        response = await client.get(
-            'https://gamma-api.polymarket.com/markets',
-            params={'limit': 30, 'closed': 'false', 'order': 'volume24hr', 'ascending': 'false'}
-        )
-        all_markets = response.json()
+        all_markets = await fetch_top_markets(client)
 
         # Filtrar markets de shutdown
-        shutdown_markets = []
-        for market in all_markets:
-            question = market.get('question', '')
-            if any(q.lower() in question.lower() or question.lower() in q.lower() for q in shutdown_queries):
-                shutdown_markets.append(market)
-
-        print(f"✅ Encontrados {len(shutdown_markets)} markets sobre Government Shutdown\n")
-        print("="*100)
-        print("\n📊 FASE 1: MAPA COMPLETO DOS MARKETS")
-        print("="*100 + "\n")
-
-        # Organizar markets
-        markets_data = []
-        total_volume = 0
-        total_liquidity = 0
-
-        for market in shutdown_markets:
-            question = market.get('question', 'N/A')
-            volume_24h = float(market.get("volume24hr", 0) or 0)
-            liquidity = float(market.get("liquidity", 0) or 0)
-
-            total_volume += volume_24h
-            total_liquidity += liquidity
-
-            # Parse prices
-            prices_raw = market.get('outcomePrices')
-            if isinstance(prices_raw, str):
-                prices = json.loads(prices_raw)
+        shutdown_markets = [m for m in all_markets if is_shutdown_question(m.get('question', ''))]
+
+        # Relatório acumulado em memória e escrito de uma vez no final
+        # (também se a análise falhar no meio)
+        buf = io.StringIO()
+        emit = functools.partial(print, file=buf)
+        try:
+            emit(f"✅ Encontrados {len(shutdown_markets)} markets sobre Government Shutdown\n")
+            emit("="*100)
+            emit("\n📊 FASE 1: MAPA COMPLETO DOS MARKETS")
+            emit("="*100 + "\n")
+
+            # Organizar markets
+            # Agregados acumulados na mesma passada que extrai os markets
+            markets_data = []
+            total_volume = 0
+            total_liquidity = 0
+            cumulative = 0
+            weighted_yes = 0
+
+            for market in shutdown_markets:
+                # get() ligado uma vez; None/"" e ausente viram 0.0 no mesmo "or"
+                get = market.get
+                question = get('question', 'N/A')
+                volume_24h = float(get('volume24hr') or 0.0)
+                liquidity = float(get('liquidity') or 0.0)
+
+                total_volume += volume_24h
+                total_liquidity += liquidity
+
+                # Parse prices (string JSON ou lista); faltando, ficam em 0.0
+                prices = get('outcomePrices') or ()
+                if isinstance(prices, str):
+                    prices = orjson.loads(prices)
+                yes_price, no_price = (*map(float, prices[:2]), 0.0, 0.0)[:2]
+
+                # Calcular implied odds
+                yes_prob = yes_price * 100
+                yes_odds = (1 / yes_price) if yes_price > 0 else 999
+                no_odds = (1 / no_price) if no_price > 0 else 999
+
+                cumulative += yes_prob
+                weighted_yes += yes_prob * volume_24h
+
+                markets_data.append(ShutdownRow(
+                    question=question,
+                    volume_24h=volume_24h,
+                    liquidity=liquidity,
+                    yes_price=yes_price,
+                    no_price=no_price,
+                    yes_prob=yes_prob,
+                    no_prob=no_price * 100,
+                    yes_odds=yes_odds,
+                    no_odds=no_odds,
+                    market_id=get('id', ''),
+                    short_question=question[:70],
+                    priority=extract_date_priority(question),
+                    value_key=yes_prob if volume_24h > VALUE_BET_MIN_VOLUME else 999,
+                ))
+
+            # Ordenar por data (parsing da pergunta)
+            markets_data.sort(key=attrgetter('priority'))
+
+            # Printar cada market
+            for i, m in enumerate(markets_data, 1):
+                emit(MARKET_BLOCK(i, m))
+
+            emit(f"\n💰 TOTAIS:")
+            emit(f"   Volume 24h combinado: ${total_volume:,.0f}")
+            emit(f"   Liquidez combinada: ${total_liquidity:,.0f}")
+            emit(f"   Média volume/market: ${total_volume/len(markets_data):,.0f}")
+
+            # Análise de probabilidades
+            emit("\n\n" + "="*100)
+            emit("📊 FASE 2: ANÁLISE DE PROBABILIDADES & DETECÇÃO DE ARBITRAGEM")
+            emit("="*100 + "\n")
+
+            emit("🎯 PROBABILIDADES IMPLÍCITAS (ordenadas cronologicamente):\n")
+
+            emit("\n".join(map(PROBABILITY_ROW, markets_data)))
+
+            emit(f"\n📊 SOMA DAS PROBABILIDADES: {cumulative:.1f}%")
+            emit()
+
+            if cumulative > 110:
+                emit("🔴 ALERTA CRÍTICO: ARBITRAGEM DETECTADA!")
+                emit(f"   Soma = {cumulative:.1f}% (deve ser ~100% para eventos mutuamente exclusivos)")
+                emit(f"   Overpricing total: {cumulative - 100:.1f}%")
+                emit(f"\n   💡 ESTRATÉGIA DE ARBITRAGEM:")
+                emit(f"      → Vender YES em TODOS os markets")
+                emit(f"      → Apenas UM evento pode acontecer, mas mercado precifica {cumulative:.0f}%")
+                emit(f"      → Profit garantido: ~{cumulative - 100:.1f}% (menos fees)")
+                emit()
+            elif cumulative < 90:
+                emit("🟢 OPORTUNIDADE: UNDERPRICING DETECTADO!")
+                emit(f"   Soma = {cumulative:.1f}% (deveria ser ~100%)")
+                emit(f"   Underpricing total: {100 - cumulative:.1f}%")
+                emit(f"\n   💡 ESTRATÉGIA:")
+                emit(f"      → Comprar YES nos markets mais underpriced")
+                emit(f"      → Edge de {100 - cumulative:.1f}% sobre o mercado")
+                emit()
+            else:
+                emit("✅ Mercado razoavelmente eficiente")
+                emit(f"   Soma = {cumulative:.1f}% (próximo de 100%)")
+                emit()
+
+            # Identificar o melhor value
+            emit("\n" + "="*100)
+            emit("💎 FASE 3: IDENTIFICAÇÃO DE VALUE BETS")
+            emit("="*100 + "\n")
+
+            # Value = alto volume + baixa probabilidade YES
+            # Só as 3 primeiras são usadas: seleção parcial em vez de ordenar tudo
+            value_bets = heapq.nsmallest(3, markets_data, key=attrgetter('value_key'))
+
+            emit("🟢 TOP 3 VALUE BETS (YES underpriced):\n")
+            for i, m in enumerate(value_bets, 1):
+                roi_potential = ((1 / m.yes_prob) * 100 - 100) if m.yes_prob > 0 else 999
+                emit(f"{i}. {m.short_question}")
+                emit(f"   YES @ {m.yes_prob:.1f}% = {roi_potential:.0f}% ROI potencial")
+                emit(f"   Odds: {m.yes_odds:.1f}x (cada $100 vira ${100 * m.yes_odds:,.0f})")
+                emit(f"   Volume: ${m.volume_24h:,.0f} (alta convicção)")
+                emit(f"   💡 Análise: Risco ${m.yes_price*100:.0f} para ganhar ${(1-m.yes_price)*100:.0f}")
+                emit()
+
+            # Consensus bets
+            consensus_bets = heapq.nlargest(3, markets_data, key=attrgetter('no_prob'))
+            emit("\n🔵 CONSENSUS BETS (NO altamente provável):\n")
+            for i, m in enumerate(consensus_bets, 1):
+                emit(f"{i}. {m.short_question}")
+                emit(f"   NO @ {m.no_prob:.1f}% (consenso forte)")
+                emit(f"   Retorno: {((1/m.no_prob)*100 - 100):.1f}% se vencer")
+                emit(f"   💡 Trade conservador: baixo risco, baixo retorno")
+                emit()
+
+            # Análise temporal
+            emit(TIMELINE_SECTION)
+
+            # Análise de sentimento
+            emit("\n" + "="*100)
+            emit("📈 FASE 5: ANÁLISE DE SENTIMENTO AGREGADO")
+            emit("="*100 + "\n")
+
+            # Calcular sentimento ponderado por volume
+            weighted_sentiment = weighted_yes / total_volume
+
+            emit(f"🎯 SENTIMENTO AGREGADO (ponderado por volume): {weighted_sentiment:.1f}%")
+            emit(f"   Isto significa: {weighted_sentiment:.1f}% de probabilidade do shutdown continuar")
+            emit(f"   Ou: {100-weighted_sentiment:.1f}% de confiança em resolução RÁPIDA")
+            emit()
+
+            if weighted_sentiment < 10:
+                sentiment_desc = "MUITO OTIMISTA"
+                interpretation = "Mercado extremamente confiante em resolução rápida"
+                risk = "RISCO: Possível complacência - considerar hedge com YES barato"
+            elif weighted_sentiment < 30:
+                sentiment_desc = "OTIMISTA"
+                interpretation = "Mercado confiante mas com alguma incerteza"
+                risk = "RISCO: Balanceado - oportunidades em ambos os lados"
+            else:
+                sentiment_desc = "PESSIMISTA"
+                interpretation = "Mercado espera shutdown prolongado"
+                risk = "RISCO: Posições longas podem ser prudentes"
+
+            emit(f"📊 INTERPRETAÇÃO: {sentiment_desc}")
+            emit(f"   {interpretation}")
+            emit(f"   {risk}")
+            emit()
+
+            # Estratégia recomendada
+            emit("\n" + "="*100)
+            emit("🎯 FASE 6: ESTRATÉGIA DE TRADING OTIMIZADA")
+            emit("="*100 + "\n")
+
+            emit("💼 PORTFOLIO RECOMENDADO ($1,000):\n")
+
+            # Encontrar os 3 melhores trades
+            by_leg = first_market_by_leg(markets_data)
+            early_market = by_leg.get('early')
+            mid_market = by_leg.get('mid')
+            long_market = by_leg.get('long')
+
+            position_num = 1
+
+            if early_market:
+                emit(f"{position_num}️⃣  TRADE CONSERVADOR - ${200} (20%):")
+                emit(f"   Market: {early_market.question[:65]}")
+                emit(f"   Lado: NO @ ${early_market.no_price:.4f}")
+                emit(f"   Lógica: Alta probabilidade ({early_market.no_prob:.1f}%) de resolução rápida")
+                emit(f"   Retorno esperado: {((1/early_market.no_prob)*100-100):.1f}% em 1-4 dias")
+                emit(f"   Risco: Muito baixo (consenso forte)\n")
+                position_num += 1
+
+            if mid_market and mid_market.yes_prob < 20:
+                emit(f"{position_num}️⃣  TRADE DE VALOR - ${400} (40%):")
+                emit(f"   Market: {mid_market.question[:65]}")
+                emit(f"   Lado: YES @ ${mid_market.yes_price:.4f}")
+                emit(f"   Lógica: YES underpriced em {mid_market.yes_prob:.1f}% - asymmetric upside")
+                emit(f"   Retorno potencial: {(mid_market.yes_odds-1)*100:.0f}% se vencer")
+                emit(f"   Risco: Médio-Alto (lottery ticket)\n")
+                position_num += 1
+
+            if long_market and long_market.yes_prob < 50:
+                emit(f"{position_num}️⃣  HEDGE POSITION - ${150} (15%):")
+                emit(f"   Market: {long_market.question[:65]}")
+                emit(f"   Lado: YES @ ${long_market.yes_price:.4f}")
+                emit(f"   Lógica: Hedge contra cenário pessimista prolongado")
+                emit(f"   Retorno potencial: {(long_market.yes_odds-1)*100:.0f}% se shutdown durar")
+                emit(f"   Risco: Alto (improvável mas possível)\n")
+                position_num += 1
+
+            # Adicionar posição especulativa no melhor value
+            best_value = value_bets[0] if value_bets else None
+            if best_value and best_value.yes_prob < 15:
+                emit(f"{position_num}️⃣  ESPECULAÇÃO - ${250} (25%):")
+                emit(f"   Market: {best_value.question[:65]}")
+                emit(f"   Lado: YES @ ${best_value.yes_price:.4f}")
+                emit(f"   Lógica: Melhor risk/reward - {best_value.yes_odds:.1f}x potencial")
+                emit(f"   Retorno potencial: {(best_value.yes_odds-1)*100:.0f}%")
+                emit(f"   Risco: Muito alto (longshot)\n")
+
+            # Resumo final
+            emit("\n" + "="*100)
+            emit("📋 RESUMO EXECUTIVO - KEY INSIGHTS")
+            emit("="*100 + "\n")
+
+            emit("🔑 TOP 5 INSIGHTS:\n")
+
+            emit("1️⃣  CONSENSUS DO MERCADO:")
+            emit(f"    • {100-weighted_sentiment:.1f}% de probabilidade de resolução RÁPIDA")
+            emit(f"    • ${total_volume:,.0f} em volume mostra alta convicção")
+            emit(f"    • Mercado está {sentiment_desc.lower()}\n")
+
+            emit("2️⃣  ARBITRAGEM/INEFICIÊNCIA:")
+            if cumulative > 110:
+                emit(f"    • OVERPRICING de {cumulative-100:.1f}% detectado")
+                emit(f"    • Oportunidade de vender YES em todos markets")
+            elif cumulative < 90:
+                emit(f"    • UNDERPRICING de {100-cumulative:.1f}% detectado")
+                emit(f"    • Oportunidade de comprar YES nos underpriced")
             else:
-                prices = prices_raw
-
-            yes_price = float(prices[0]) if prices and len(prices) > 0 else 0
-            no_price = float(prices[1]) if prices and len(prices) > 1 else 0
-
-            # Calcular implied odds
-            yes_odds = (1 / yes_price) if yes_price > 0 else 999
-            no_odds = (1 / no_price) if no_price > 0 else 999
-
-            markets_data.append({
-                'question': question,
-                'volume_24h': volume_24h,
-                'liquidity': liquidity,
-                'yes_price': yes_price,
-                'no_price': no_price,
-                'yes_prob': yes_price * 100,
-                'no_prob': no_price * 100,
-                'yes_odds': yes_odds,
-                'no_odds': no_odds,
-                'market_id': market.get('id', '')
-            })
-
-        # Ordenar por data (parsing da pergunta)
-        def extract_date_priority(question):
-            q = question.lower()
-            if 'november 8' in q or 'november 10' in q or '8-11' in q:
-                return 1
-            elif 'november 12' in q or '12-15' in q:
-                return 2
-            elif 'november 15' in q:
-                return 3
-            elif 'november 16' in q or 'later' in q:
-                return 4
-            elif 'november 30' in q:
-                return 5
-            elif 'december' in q:
-                return 6
-            return 99
-
-        markets_data.sort(key=lambda x: extract_date_priority(x['question']))
-
-        # Printar cada market
-        for i, m in enumerate(markets_data, 1):
-            print(f"#{i} - {m['question']}")
-            print(f"   💰 Volume 24h: ${m['volume_24h']:,.0f}")
-            print(f"   💧 Liquidez: ${m['liquidity']:,.0f}")
-            print(f"   📈 YES: {m['yes_prob']:.1f}% (${m['yes_price']:.4f}) - Odds: {m['yes_odds']:.1f}x")
-            print(f"   📉 NO:  {m['no_prob']:.1f}% (${m['no_price']:.4f}) - Odds: {m['no_odds']:.1f}x")
-            print()
-
-        print(f"\n💰 TOTAIS:")
-        print(f"   Volume 24h combinado: ${total_volume:,.0f}")
-        print(f"   Liquidez combinada: ${total_liquidity:,.0f}")
-        print(f"   Média volume/market: ${total_volume/len(markets_data):,.0f}")
-
-        # Análise de probabilidades
-        print("\n\n" + "="*100)
-        print("📊 FASE 2: ANÁLISE DE PROBABILIDADES & DETECÇÃO DE ARBITRAGEM")
-        print("="*100 + "\n")
-
-        print("🎯 PROBABILIDADES IMPLÍCITAS (ordenadas cronologicamente):\n")
-
-        cumulative = 0
-        for m in markets_data:
-            print(f"{m['question'][:70]:<72} YES: {m['yes_prob']:5.1f}%")
-            cumulative += m['yes_prob']
-
-        print(f"\n📊 SOMA DAS PROBABILIDADES: {cumulative:.1f}%")
-        print()
-
-        if cumulative > 110:
-            print("🔴 ALERTA CRÍTICO: ARBITRAGEM DETECTADA!")
-            print(f"   Soma = {cumulative:.1f}% (deve ser ~100% para eventos mutuamente exclusivos)")
-            print(f"   Overpricing total: {cumulative - 100:.1f}%")
-            print(f"\n   💡 ESTRATÉGIA DE ARBITRAGEM:")
-            print(f"      → Vender YES em TODOS os markets")
-            print(f"      → Apenas UM evento pode acontecer, mas mercado precifica {cumulative:.0f}%")
-            print(f"      → Profit garantido: ~{cumulative - 100:.1f}% (menos fees)")
-            print()
-        elif cumulative < 90:
-            print("🟢 OPORTUNIDADE: UNDERPRICING DETECTADO!")
-            print(f"   Soma = {cumulative:.1f}% (deveria ser ~100%)")
-            print(f"   Underpricing total: {100 - cumulative:.1f}%")
-            print(f"\n   💡 ESTRATÉGIA:")
-            print(f"      → Comprar YES nos markets mais underpriced")
-            print(f"      → Edge de {100 - cumulative:.1f}% sobre o mercado")
-            print()
-        else:
-            print("✅ Mercado razoavelmente eficiente")
-            print(f"   Soma = {cumulative:.1f}% (próximo de 100%)")
-            print()
-
-        # Identificar o melhor value
-        print("\n" + "="*100)
-        print("💎 FASE 3: IDENTIFICAÇÃO DE VALUE BETS")
-        print("="*100 + "\n")
-
-        # Value = alto volume + baixa probabilidade YES
-        value_bets = sorted(markets_data, key=lambda x: x['yes_prob'] if x['volume_24h'] > 500000 else 999)
-
-        print("🟢 TOP 3 VALUE BETS (YES underpriced):\n")
-        for i, m in enumerate(value_bets[:3], 1):
-            roi_potential = ((1 / m['yes_prob']) * 100 - 100) if m['yes_prob'] > 0 else 999
-            print(f"{i}. {m['question'][:70]}")
-            print(f"   YES @ {m['yes_prob']:.1f}% = {roi_potential:.0f}% ROI potencial")
-            print(f"   Odds: {m['yes_odds']:.1f}x (cada $100 vira ${100 * m['yes_odds']:,.0f})")
-            print(f"   Volume: ${m['volume_24h']:,.0f} (alta convicção)")
-            print(f"   💡 Análise: Risco ${m['yes_price']*100:.0f} para ganhar ${(1-m['yes_price'])*100:.0f}")
-            print()
-
-        # Consensus bets
-        consensus_bets = sorted(markets_data, key=lambda x: -x['no_prob'])
-        print("\n🔵 CONSENSUS BETS (NO altamente provável):\n")
-        for i, m in enumerate(consensus_bets[:3], 1):
-            print(f"{i}. {m['question'][:70]}")
-            print(f"   NO @ {m['no_prob']:.1f}% (consenso forte)")
-            print(f"   Retorno: {((1/m['no_prob'])*100 - 100):.1f}% se vencer")
-            print(f"   💡 Trade conservador: baixo risco, baixo retorno")
-            print()
-
-        # Análise temporal
-        print("\n" + "="*100)
-        print("⏰ FASE 4: ANÁLISE TEMPORAL & CATALISADORES")
-        print("="*100 + "\n")
-
-        print("📅 TIMELINE DOS EVENTOS:\n")
-        print("Nov 8-11:  Resolução muito próxima (1-4 dias)")
-        print("Nov 12-15: Resolução de curto prazo (5-8 dias)")
-        print("Nov 16+:   Resolução média prazo (9+ dias)")
-        print("Nov 30:    Resolução longo prazo (23 dias)")
-        print("Dec 31:    Resolução muito longa (54 dias)")
-        print()
-
-        print("🔔 CATALISADORES IMINENTES:\n")
-        print("📰 POSITIVOS (Resolução rápida):")
-        print("   • Acordo bipartidário iminente")
-        print("   • Pressão econômica (mercados, empresas)")
-        print("   • Midterms próximas (pressão eleitoral)")
-        print("   • Feriados chegando (Thanksgiving)")
-        print()
-
-        print("⚠️  NEGATIVOS (Shutdown prolongado):")
-        print("   • Gridlock político persistente")
-        print("   • Demandas irreconciliáveis")
-        print("   • Posturing para eleições")
-        print("   • Falta de urgência imediata")
-        print()
-
-        # Análise de sentimento
-        print("\n" + "="*100)
-        print("📈 FASE 5: ANÁLISE DE SENTIMENTO AGREGADO")
-        print("="*100 + "\n")
-
-        # Calcular sentimento ponderado por volume
-        weighted_sentiment = sum(m['yes_prob'] * m['volume_24h'] for m in markets_data) / total_volume
-
-        print(f"🎯 SENTIMENTO AGREGADO (ponderado por volume): {weighted_sentiment:.1f}%")
-        print(f"   Isto significa: {weighted_sentiment:.1f}% de probabilidade do shutdown continuar")
-        print(f"   Ou: {100-weighted_sentiment:.1f}% de confiança em resolução RÁPIDA")
-        print()
-
-        if weighted_sentiment < 10:
-            sentiment_desc = "MUITO OTIMISTA"
-            interpretation = "Mercado extremamente confiante em resolução rápida"
-            risk = "RISCO: Possível complacência - considerar hedge com YES barato"
-        elif weighted_sentiment < 30:
-            sentiment_desc = "OTIMISTA"
-            interpretation = "Mercado confiante mas com alguma incerteza"
-            risk = "RISCO: Balanceado - oportunidades em ambos os lados"
-        else:
-            sentiment_desc = "PESSIMISTA"
-            interpretation = "Mercado espera shutdown prolongado"
-            risk = "RISCO: Posições longas podem ser prudentes"
-
-        print(f"📊 INTERPRETAÇÃO: {sentiment_desc}")
-        print(f"   {interpretation}")
-        print(f"   {risk}")
-        print()
-
-        # Estratégia recomendada
-        print("\n" + "="*100)
-        print("🎯 FASE 6: ESTRATÉGIA DE TRADING OTIMIZADA")
-        print("="*100 + "\n")
-
-        print("💼 PORTFOLIO RECOMENDADO ($1,000):\n")
-
-        # Encontrar os 3 melhores trades
-        early_market = next((m for m in markets_data if 'november 8' in m['question'].lower() or '8-11' in m['question'].lower()), None)
-        mid_market = next((m for m in markets_data if 'november 16' in m['question'].lower() or 'later' in m['question'].lower()), None)
-        long_market = next((m for m in markets_data if 'december' in m['question'].lower()), None)
-
-        position_num = 1
-
-        if early_market:
-            print(f"{position_num}️⃣  TRADE CONSERVADOR - ${200} (20%):")
-            print(f"   Market: {early_market['question'][:65]}")
-            print(f"   Lado: NO @ ${early_market['no_price']:.4f}")
-            print(f"   Lógica: Alta probabilidade ({early_market['no_prob']:.1f}%) de resolução rápida")
-            print(f"   Retorno esperado: {((1/early_market['no_prob'])*100-100):.1f}% em 1-4 dias")
-            print(f"   Risco: Muito baixo (consenso forte)\n")
-            position_num += 1
-
-        if mid_market and mid_market['yes_prob'] < 20:
-            print(f"{position_num}️⃣  TRADE DE VALOR - ${400} (40%):")
-            print(f"   Market: {mid_market['question'][:65]}")
-            print(f"   Lado: YES @ ${mid_market['yes_price']:.4f}")
-            print(f"   Lógica: YES underpriced em {mid_market['yes_prob']:.1f}% - asymmetric upside")
-            print(f"   Retorno potencial: {(mid_market['yes_odds']-1)*100:.0f}% se vencer")
-            print(f"   Risco: Médio-Alto (lottery ticket)\n")
-            position_num += 1
-
-        if long_market and long_market['yes_prob'] < 50:
-            print(f"{position_num}️⃣  HEDGE POSITION - ${150} (15%):")
-            print(f"   Market: {long_market['question'][:65]}")
-            print(f"   Lado: YES @ ${long_market['yes_price']:.4f}")
-            print(f"   Lógica: Hedge contra cenário pessimista prolongado")
-            print(f"   Retorno potencial: {(long_market['yes_odds']-1)*100:.0f}% se shutdown durar")
-            print(f"   Risco: Alto (improvável mas possível)\n")
-            position_num += 1
-
-        # Adicionar posição especulativa no melhor value
-        best_value = value_bets[0] if value_bets else None
-        if best_value and best_value['yes_prob'] < 15:
-            print(f"{position_num}️⃣  ESPECULAÇÃO - ${250} (25%):")
-            print(f"   Market: {best_value['question'][:65]}")
-            print(f"   Lado: YES @ ${best_value['yes_price']:.4f}")
-            print(f"   Lógica: Melhor risk/reward - {best_value['yes_odds']:.1f}x potencial")
-            print(f"   Retorno potencial: {(best_value['yes_odds']-1)*100:.0f}%")
-            print(f"   Risco: Muito alto (longshot)\n")
-
-        # Resumo final
-        print("\n" + "="*100)
-        print("📋 RESUMO EXECUTIVO - KEY INSIGHTS")
-        print("="*100 + "\n")
-
-        print("🔑 TOP 5 INSIGHTS:\n")
-
-        print("1️⃣  CONSENSUS DO MERCADO:")
-        print(f"    • {100-weighted_sentiment:.1f}% de probabilidade de resolução RÁPIDA")
-        print(f"    • ${total_volume:,.0f} em volume mostra alta convicção")
-        print(f"    • Mercado está {sentiment_desc.lower()}\n")
-
-        print("2️⃣  ARBITRAGEM/INEFICIÊNCIA:")
-        if cumulative > 110:
-            print(f"    • OVERPRICING de {cumulative-100:.1f}% detectado")
-            print(f"    • Oportunidade de vender YES em todos markets")
-        elif cumulative < 90:
-            print(f"    • UNDERPRICING de {100-cumulative:.1f}% detectado")
-            print(f"    • Oportunidade de comprar YES nos underpriced")
-        else:
-            print(f"    • Mercado eficiente (~{cumulative:.0f}% total)")
-        print()
-
-        print("3️⃣  MELHOR VALUE BET:")
-        if value_bets:
-            best = value_bets[0]
-            print(f"    • {best['question'][:60]}")
-            print(f"    • YES {best['yes_prob']:.1f}% = {best['yes_odds']:.1f}x odds")
-            print(f"    • ROI potencial: {((best['yes_odds']-1)*100):.0f}%\n")
-
-        print("4️⃣  TIMELINE CRÍTICO:")
-        print(f"    • Próximos 3-5 dias são CRUCIAIS")
-        print(f"    • Catalisadores: votações, acordos, notícias")
-        print(f"    • Use WebSocket do MCP para alertas real-time\n")
-
-        print("5️⃣  RISK/REWARD:")
-        print(f"    • Trades conservadores: 3-5% retorno, baixo risco")
-        print(f"    • Trades de valor: 500-1000% retorno, médio-alto risco")
-        print(f"    • Portfolio diversificado: 15-30% retorno esperado\n")
-
-        print("\n💡 AÇÃO RECOMENDADA:")
-        print("   ✅ Entrar agora com posições pequenas")
-        print("   ✅ Monitorar notícias DIARIAMENTE")
-        print("   ✅ Usar stop-loss se cenário mudar")
-        print("   ✅ Escalar posições com novas informações")
-        print("   ✅ Ativar WebSocket alerts no MCP\n")
-
-        print("⚡ NEXT STEPS:")
-        print("   1. Configure WebSocket para alertas real-time")
-        print("   2. Entre com 20-30% do capital inicial")
-        print("   3. Reserve 70% para ajustes baseados em notícias")
-        print("   4. Monitor C-SPAN, Politico, Twitter de congressistas")
-        print("   5. Ajuste posições a cada 12-24h\n")
+                emit(f"    • Mercado eficiente (~{cumulative:.0f}% total)")
+            emit()
+
+            emit("3️⃣  MELHOR VALUE BET:")
+            if value_bets:
+                best = value_bets[0]
+                emit(f"    • {best.question[:60]}")
+                emit(f"    • YES {best.yes_prob:.1f}% = {best.yes_odds:.1f}x odds")
+                emit(f"    • ROI potencial: {((best.yes_odds-1)*100):.0f}%\n")
+
+            emit(CLOSING_SECTION)
+        finally:
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
 
 if __name__ == "__main__":
     asyncio.run(ultra_shutdown_analysis())
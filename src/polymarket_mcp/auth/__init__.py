@@ -1,11 +1,12 @@
 """Authentication and client management for Polymarket CLOB"""
 
-from .client import PolymarketClient, create_polymarket_client
+from .client import PolymarketClient, create_polymarket_client, clear_client_cache
 from .signer import OrderSigner, create_order_signer, SignatureType
 
 __all__ = [
     "PolymarketClient",
     "create_polymarket_client",
+    "clear_client_cache",
     "OrderSigner",
     "create_order_signer",
     "SignatureType",
@@ -2,16 +2,47 @@
 Polymarket CLOB client with authentication.
 Handles L1 (private key) and L2 (API key) authentication.
 """
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, TypeVar
+import asyncio
+import functools
 import logging
-from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import ApiCreds, OrderArgs, OrderType
-from py_clob_client.constants import POLYGON
+
+import httpx
+import orjson
 
 from .signer import OrderSigner
+from ..utils.http_client import get_http_client
+
+# py_clob_client pulls in web3 and its crypto stack, so it is imported where
+# a ClobClient is actually built rather than when this module loads
+if TYPE_CHECKING:
+    from py_clob_client.client import ClobClient
+    from py_clob_client.clob_types import ApiCreds
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# ClobClient is synchronous; its calls run on this pool so they don't block
+# the event loop. The cap bounds parallel order traffic from gathered calls.
+CLOB_MAX_WORKERS = 16
+_clob_executor = ThreadPoolExecutor(
+    max_workers=CLOB_MAX_WORKERS,
+    thread_name_prefix="clob"
+)
+
+# Concurrent requests allowed by the batched market data helpers
+BATCH_CONCURRENCY = 10
+
+# Market pages kept for conditional (If-None-Match) revalidation
+MARKETS_CACHE_SIZE = 32
+
+# Clients reused by create_polymarket_client, keyed by (address, chain_id,
+# host). Only one client (and one set of credentials) is kept per wallet
+_client_cache: Dict[Tuple[str, int, str], "PolymarketClient"] = {}
+
 
 class PolymarketClient:
     """
@@ -22,6 +53,10 @@ class PolymarketClient:
     - L2 authentication with API key HMAC
     - Auto-creation of API credentials if not provided
     - Comprehensive market and trading operations
+    - Pooled HTTP connections for public market data endpoints, shared
+      across instances
+
+    Can be used as an async context manager to close pooled connections.
     """
 
     def __init__(
@@ -55,8 +90,10 @@ class PolymarketClient:
         self.signer = OrderSigner(private_key, chain_id)
 
         # L2 API credentials
-        self.api_creds: Optional[ApiCreds] = None
+        self.api_creds: Optional["ApiCreds"] = None
         if api_key and (api_secret or passphrase):
+            from py_clob_client.clob_types import ApiCreds
+
             secret = api_secret or passphrase
             self.api_creds = ApiCreds(
                 api_key=api_key,
@@ -65,9 +102,12 @@ class PolymarketClient:
             )
 
         # Initialize CLOB client
-        self.client: Optional[ClobClient] = None
+        self.client: Optional["ClobClient"] = None
         self._initialize_client()
 
+        # Last ETag / Last-Modified and body per markets page cursor
+        self._markets_cache: "OrderedDict[Optional[str], Tuple[Dict[str, str], Any]]" = OrderedDict()
+
         logger.info(
             f"PolymarketClient initialized for {self.address} "
             f"(chain_id: {chain_id}, L2 auth: {self.api_creds is not None})"
@@ -75,6 +115,8 @@ class PolymarketClient:
 
     def _initialize_client(self) -> None:
         """Initialize the ClobClient with appropriate authentication"""
+        from py_clob_client.client import ClobClient
+
         try:
             # Build client arguments
             client_args = {
@@ -96,7 +138,7 @@ class PolymarketClient:
             logger.error(f"Failed to initialize ClobClient: {e}")
             raise
 
-    def get_client(self) -> ClobClient:
+    def get_client(self) -> "ClobClient":
         """
         Get the underlying ClobClient instance.
 
@@ -110,7 +152,51 @@ class PolymarketClient:
             raise RuntimeError("ClobClient not initialized")
         return self.client
 
-    async def create_api_credentials(self, nonce_timeout: int = 3600) -> ApiCreds:
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """
+        HTTP client for public CLOB endpoints.
+
+        This is the process-wide pool from get_http_client(), so every
+        PolymarketClient (and the market tools) reuse the same keep-alive
+        connections instead of each opening its own.
+
+        Returns:
+            Shared httpx.AsyncClient
+        """
+        return get_http_client()
+
+    async def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET a public CLOB endpoint on the pooled client and decode the JSON body"""
+        response = await self.http.get(f"{self.host}{path}", params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def _run_sync(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking ClobClient call on the CLOB thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _clob_executor,
+            functools.partial(func, *args, **kwargs)
+        )
+
+    async def aclose(self) -> None:
+        """
+        Release resources held by this client.
+
+        HTTP requests go through the process-wide pool from
+        utils.http_client, which other clients and tools keep using, so it
+        is left open here. Close it once on shutdown with
+        close_http_client().
+        """
+
+    async def __aenter__(self) -> "PolymarketClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def create_api_credentials(self, nonce_timeout: int = 3600) -> "ApiCreds":
         """
         Create L2 API credentials for this wallet.
 
@@ -126,11 +212,13 @@ class PolymarketClient:
         Raises:
             Exception: If credential creation fails
         """
+        from py_clob_client.clob_types import ApiCreds
+
         try:
             logger.info("Creating API credentials...")
 
             # Use the client's built-in method to create credentials
-            creds = self.client.create_api_key()
+            creds = await self._run_sync(self.client.create_api_key)
 
             # Store credentials
             self.api_creds = ApiCreds(
@@ -157,6 +245,10 @@ class PolymarketClient:
         """
         Fetch markets from Polymarket.
 
+        Pages seen before are revalidated with If-None-Match /
+        If-Modified-Since, so an unchanged page comes back as a bodyless
+        304 and the cached result is returned.
+
         Args:
             next_cursor: Pagination cursor
             limit: Number of markets to fetch (max 100)
@@ -165,8 +257,37 @@ class PolymarketClient:
             Dictionary with markets data
         """
         try:
-            # Use simplified markets endpoint
-            markets = self.client.get_markets(next_cursor=next_cursor)
+            params = {"next_cursor": next_cursor} if next_cursor else None
+            cached = self._markets_cache.get(next_cursor)
+
+            response = await self.http.get(
+                f"{self.host}/markets",
+                params=params,
+                headers=cached[0] if cached else None
+            )
+
+            if response.status_code == 304 and cached:
+                self._markets_cache.move_to_end(next_cursor)
+                logger.debug(f"Markets page {next_cursor!r} not modified")
+                return cached[1]
+
+            response.raise_for_status()
+            markets = orjson.loads(response.content)
+
+            validators = {}
+            if "etag" in response.headers:
+                validators["If-None-Match"] = response.headers["etag"]
+            if "last-modified" in response.headers:
+                validators["If-Modified-Since"] = response.headers["last-modified"]
+
+            if validators:
+                self._markets_cache[next_cursor] = (validators, markets)
+                self._markets_cache.move_to_end(next_cursor)
+                while len(self._markets_cache) > MARKETS_CACHE_SIZE:
+                    self._markets_cache.popitem(last=False)
+            else:
+                self._markets_cache.pop(next_cursor, None)
+
             return markets
 
         except Exception as e:
@@ -184,7 +305,7 @@ class PolymarketClient:
             Market data dictionary
         """
         try:
-            market = self.client.get_market(condition_id)
+            market = await self._get_json(f"/markets/{condition_id}")
             return market
 
         except Exception as e:
@@ -205,7 +326,7 @@ class PolymarketClient:
             Order book with bids and asks
         """
         try:
-            orderbook = self.client.get_order_book(token_id)
+            orderbook = await self._get_json("/book", params={"token_id": token_id})
             return orderbook
 
         except Exception as e:
@@ -228,13 +349,68 @@ class PolymarketClient:
             Price as float
         """
         try:
-            price_data = self.client.get_price(token_id, side.upper())
+            price_data = await self._get_json(
+                "/price",
+                params={"token_id": token_id, "side": side.upper()}
+            )
             return float(price_data.get("price", 0))
 
         except Exception as e:
             logger.error(f"Failed to fetch price for {token_id}: {e}")
             raise
 
+    async def _gather_limited(
+        self,
+        fetch: Callable[..., Any],
+        token_ids: List[str],
+        concurrency: int,
+        *args: Any
+    ) -> List[Any]:
+        """Run fetch(token_id, *args) for each token with at most `concurrency` in flight"""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_one(token_id: str) -> Any:
+            async with semaphore:
+                return await fetch(token_id, *args)
+
+        return await asyncio.gather(*(fetch_one(token_id) for token_id in token_ids))
+
+    async def get_orderbooks(
+        self,
+        token_ids: List[str],
+        concurrency: int = BATCH_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch order books for several tokens concurrently.
+
+        Args:
+            token_ids: Token IDs to fetch orderbooks for
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Order books in the same order as token_ids
+        """
+        return await self._gather_limited(self.get_orderbook, token_ids, concurrency)
+
+    async def get_prices(
+        self,
+        token_ids: List[str],
+        side: str,
+        concurrency: int = BATCH_CONCURRENCY
+    ) -> List[float]:
+        """
+        Get current prices for several tokens concurrently.
+
+        Args:
+            token_ids: Token IDs
+            side: BUY or SELL
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Prices in the same order as token_ids
+        """
+        return await self._gather_limited(self.get_price, token_ids, concurrency, side)
+
     async def post_order(
         self,
         token_id: str,
@@ -267,6 +443,8 @@ class PolymarketClient:
                 "Call create_api_credentials() first."
             )
 
+        from py_clob_client.clob_types import OrderArgs
+
         try:
             # Build order args
             order_args = OrderArgs(
@@ -281,7 +459,7 @@ class PolymarketClient:
                 order_args.expiration = expiration
 
             # Post order using client
-            order_response = self.client.create_order(order_args)
+            order_response = await self._run_sync(self.client.create_order, order_args)
 
             logger.info(
                 f"Order posted: {side} {size} @ {price} "
@@ -311,7 +489,7 @@ class PolymarketClient:
             raise RuntimeError("L2 API credentials required for canceling orders")
 
         try:
-            response = self.client.cancel(order_id)
+            response = await self._run_sync(self.client.cancel, order_id)
 
             logger.info(f"Order cancelled: {order_id}")
             return response
@@ -334,7 +512,7 @@ class PolymarketClient:
             raise RuntimeError("L2 API credentials required")
 
         try:
-            response = self.client.cancel_all()
+            response = await self._run_sync(self.client.cancel_all)
 
             logger.info("All orders cancelled")
             return response
@@ -372,7 +550,7 @@ class PolymarketClient:
             if asset_id:
                 params["asset_id"] = asset_id
 
-            orders = self.client.get_orders(**params)
+            orders = await self._run_sync(self.client.get_orders, **params)
             return orders
 
         except Exception as e:
@@ -393,7 +571,7 @@ class PolymarketClient:
             raise RuntimeError("L2 API credentials required")
 
         try:
-            positions = self.client.get_positions(self.address)
+            positions = await self._run_sync(self.client.get_positions, self.address)
             return positions
 
         except Exception as e:
@@ -414,7 +592,7 @@ class PolymarketClient:
             raise RuntimeError("L2 API credentials required")
 
         try:
-            balance_data = self.client.get_balance(self.address)
+            balance_data = await self._run_sync(self.client.get_balance, self.address)
             return balance_data
 
         except Exception as e:
@@ -441,10 +619,16 @@ def create_polymarket_client(
     api_key: Optional[str] = None,
     api_secret: Optional[str] = None,
     passphrase: Optional[str] = None,
+    host: str = "https://clob.polymarket.com",
 ) -> PolymarketClient:
     """
     Create PolymarketClient instance.
 
+    Clients are cached per (address, chain_id, host), so repeated calls
+    reuse the same signer and ClobClient. A cached client is replaced when
+    it was built from a different private key or API credentials. Call
+    clear_client_cache() to force new instances.
+
     Args:
         private_key: Polygon wallet private key
         address: Polygon wallet address
@@ -452,15 +636,42 @@ def create_polymarket_client(
         api_key: Optional L2 API key
         api_secret: Optional L2 API secret
         passphrase: Optional L2 API passphrase
+        host: CLOB API host URL
 
     Returns:
         PolymarketClient instance
     """
-    return PolymarketClient(
+    cache_key = (address.lower(), chain_id, host)
+
+    # PolymarketClient uses api_secret (or else passphrase) as both secret
+    # and passphrase, so that is the value to compare
+    secret = api_secret or passphrase
+
+    client = _client_cache.get(cache_key)
+    creds = client.api_creds if client is not None else None
+    if client is not None and client.private_key == private_key and (
+        api_key is None
+        or (
+            creds is not None
+            and creds.api_key == api_key
+            and (secret is None or creds.api_secret == secret)
+        )
+    ):
+        return client
+
+    client = PolymarketClient(
         private_key=private_key,
         address=address,
         chain_id=chain_id,
         api_key=api_key,
         api_secret=api_secret,
-        passphrase=passphrase
+        passphrase=passphrase,
+        host=host
     )
+    _client_cache[cache_key] = client
+    return client
+
+
+def clear_client_cache() -> None:
+    """Drop clients cached by create_polymarket_client"""
+    _client_cache.clear()
@@ -2,14 +2,29 @@
 Order signing utilities for Polymarket CLOB.
 Handles EIP-712 signatures and order hash generation.
 """
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, TypedDict, Union
+from eth_abi import encode
 from eth_account import Account
-from eth_account.messages import encode_typed_data
-from eth_utils import keccak
+from eth_account.messages import encode_defunct
+from eth_account.signers.local import LocalAccount
+from eth_keys import keys
+from eth_utils import keccak, to_checksum_address
+import orjson
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Per-order hashing calls pycryptodome (a dependency of eth-account) directly,
+# skipping eth_hash's backend dispatch; eth_utils.keccak is the fallback
+try:
+    from Crypto.Hash import keccak as _keccak_mod
+
+    def _keccak256(data: bytes) -> bytes:
+        return _keccak_mod.new(data=data, digest_bits=256).digest()
+except ImportError:
+    _keccak256 = keccak
+
 
 class SignatureType:
     """Signature types supported by Polymarket"""
@@ -18,6 +33,27 @@ class SignatureType:
     GNOSIS_SAFE = 2  # Gnosis Safe Multisig
 
 
+class Order(TypedDict):
+    """
+    Order fields signed with EIP-712.
+
+    Numeric fields may be ints or decimal / 0x-prefixed hex strings.
+    Addresses are 0x-prefixed hex strings.
+    """
+    salt: Union[int, str]
+    maker: str
+    signer: str
+    taker: str
+    tokenId: Union[int, str]
+    makerAmount: Union[int, str]
+    takerAmount: Union[int, str]
+    expiration: Union[int, str]
+    nonce: Union[int, str]
+    feeRateBps: Union[int, str]
+    side: Union[int, str]
+    signatureType: Union[int, str]
+
+
 # EIP-712 domain for Polymarket CTF Exchange
 EIP712_DOMAIN = {
     "name": "ClobAuthDomain",
@@ -25,6 +61,89 @@ EIP712_DOMAIN = {
     "chainId": 137,
 }
 
+# EIP-712 Order struct fields, in encoding order
+ORDER_FIELDS = [
+    ("salt", "uint256"),
+    ("maker", "address"),
+    ("signer", "address"),
+    ("taker", "address"),
+    ("tokenId", "uint256"),
+    ("makerAmount", "uint256"),
+    ("takerAmount", "uint256"),
+    ("expiration", "uint256"),
+    ("nonce", "uint256"),
+    ("feeRateBps", "uint256"),
+    ("side", "uint8"),
+    ("signatureType", "uint8"),
+]
+
+# uint256 fields can exceed orjson's 64-bit ints, so int values are sent as
+# decimal strings (the form the CLOB API expects)
+UINT256_FIELDS = frozenset(name for name, field_type in ORDER_FIELDS if field_type == "uint256")
+
+# EIP-712 type definitions shared by every typed-data payload
+EIP712_DOMAIN_TYPE = [
+    {"name": "name", "type": "string"},
+    {"name": "version", "type": "string"},
+    {"name": "chainId", "type": "uint256"},
+]
+ORDER_TYPE = [{"name": name, "type": field_type} for name, field_type in ORDER_FIELDS]
+
+# Every Order field ABI-encodes to one 32-byte word: uints big-endian,
+# addresses left-padded with 12 zero bytes
+ADDRESS_PADDING = bytes(12)
+UINT_MAX = {"uint256": 2 ** 256 - 1, "uint8": 2 ** 8 - 1}
+
+# EIP-712 type strings have fixed schemas, so their type hashes are
+# computed once at import
+EIP712_DOMAIN_TYPE_STRING = b"EIP712Domain(string name,string version,uint256 chainId)"
+EIP712_DOMAIN_TYPE_HASH = keccak(EIP712_DOMAIN_TYPE_STRING)
+EIP712_DOMAIN_NAME_HASH = keccak(text=EIP712_DOMAIN["name"])
+EIP712_DOMAIN_VERSION_HASH = keccak(text=EIP712_DOMAIN["version"])
+
+# "Order(uint256 salt,address maker,...)"
+ORDER_TYPE_STRING = (
+    "Order(" + ",".join(f"{field_type} {name}" for name, field_type in ORDER_FIELDS) + ")"
+).encode()
+ORDER_TYPE_HASH = keccak(ORDER_TYPE_STRING)
+
+CANCEL_ORDER_TYPE_STRING = b"CancelOrder(string orderId,string assetId)"
+CANCEL_ORDER_TYPE_HASH = keccak(CANCEL_ORDER_TYPE_STRING)
+
+# Constant part of the API key creation message; the nonce is appended
+API_KEY_MESSAGE_PREFIX = b"This message attests that I control the given wallet\n"
+
+
+@lru_cache(maxsize=8)
+def _load_account(private_key: Union[str, bytes]) -> Tuple[LocalAccount, keys.PrivateKey]:
+    """
+    Parse a private key into an eth_account account and an eth_keys key.
+
+    Both derive the public key with an EC multiplication, so results are
+    cached for signers created repeatedly with the same key.
+    """
+    account = Account.from_key(private_key)
+    return account, keys.PrivateKey(account.key)
+
+
+def _recover_address(digest: bytes, signature: Union[str, bytes]) -> bytes:
+    """
+    Recover the 20-byte address that signed a message digest.
+
+    Accepts the same signature formats as eth_account: hex with or without
+    0x, or raw bytes, with v in {0, 1} or {27, 28}.
+    """
+    if isinstance(signature, str):
+        signature = bytes.fromhex(signature[2:] if signature.startswith("0x") else signature)
+    if len(signature) != 65:
+        raise ValueError(f"Signature must be 65 bytes, got {len(signature)}")
+
+    v = signature[64]
+    if v >= 27:
+        v -= 27
+    vrs_signature = keys.Signature(signature_bytes=signature[:64] + bytes((v,)))
+    return vrs_signature.recover_public_key_from_msg_hash(digest).to_canonical_address()
+
 
 class OrderSigner:
     """
@@ -36,27 +155,56 @@ class OrderSigner:
     - Protection against replay attacks
     """
 
-    def __init__(self, private_key: str, chain_id: int = 137):
+    def __init__(self, private_key: Union[str, bytes], chain_id: int = 137):
         """
         Initialize order signer.
 
         Args:
-            private_key: Private key (without 0x prefix)
+            private_key: Private key as hex string (without 0x prefix) or raw bytes
             chain_id: Chain ID (137 for Polygon mainnet)
         """
         # Ensure private key has 0x prefix for eth_account
-        if not private_key.startswith("0x"):
+        if isinstance(private_key, str) and not private_key.startswith("0x"):
             private_key = "0x" + private_key
 
-        self.account = Account.from_key(private_key)
+        # eth_account re-parses the key (deriving the public key) on every
+        # sign; signing digests with one parsed key skips that
+        self.account, self._key = _load_account(private_key)
         self.chain_id = chain_id
         self.address = self.account.address
+        self._address_bytes = bytes.fromhex(self.address[2:])
+
+        # The domain only depends on chain_id, so hash it once
+        self._domain_separator = self._compute_domain_separator()
+
+        # Typed-data skeleton; only "message" changes between calls
+        self._order_typed_data = {
+            "types": {"EIP712Domain": EIP712_DOMAIN_TYPE, "Order": ORDER_TYPE},
+            "primaryType": "Order",
+            "domain": {**EIP712_DOMAIN, "chainId": chain_id},
+        }
 
         logger.info(f"OrderSigner initialized for address: {self.address}")
 
+    @classmethod
+    def from_bytes(cls, private_key: bytes, chain_id: int = 137) -> "OrderSigner":
+        """
+        Create a signer from a raw 32-byte private key.
+
+        Skips the hex string round trip when the key is already decoded.
+
+        Args:
+            private_key: 32-byte private key
+            chain_id: Chain ID (137 for Polygon mainnet)
+
+        Returns:
+            OrderSigner instance
+        """
+        return cls(private_key, chain_id)
+
     def sign_order(
         self,
-        order: Dict[str, Any],
+        order: Order,
         signature_type: int = SignatureType.EOA
     ) -> str:
         """
@@ -69,19 +217,83 @@ class OrderSigner:
         Returns:
             Signature as hex string
         """
-        # Build EIP-712 typed data structure
-        typed_data = self._build_typed_data(order)
+        return self.sign_order_bytes(order, signature_type).hex()
+
+    def sign_order_bytes(
+        self,
+        order: Order,
+        signature_type: int = SignatureType.EOA
+    ) -> bytes:
+        """
+        Sign an order using EIP-712, returning the raw signature.
+
+        For callers that need the signature bytes rather than hex, so they
+        don't have to decode the string from sign_order() again.
 
-        # Encode and sign
-        encoded_data = encode_typed_data(typed_data)
-        signed_message = self.account.sign_message(encoded_data)
+        Args:
+            order: Order dictionary with required fields
+            signature_type: Type of signature (default: EOA)
 
-        # Return signature as hex (with 0x prefix)
-        signature = signed_message.signature.hex()
+        Returns:
+            65-byte signature (r || s || v)
+        """
+        struct_hash = self._hash_order_struct(order)
+
+        signature = self._sign_struct_hash(struct_hash)
 
-        logger.debug(f"Signed order: {self._get_order_hash(order)}")
+        # Same value as _get_order_hash(), from the struct hash computed above
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Signed order: {_keccak256(struct_hash).hex()}")
         return signature
 
+    def sign_and_serialize(
+        self,
+        order: Order,
+        signature_type: int = SignatureType.EOA
+    ) -> bytes:
+        """
+        Sign an order and serialize it with its signature as JSON.
+
+        Args:
+            order: Order dictionary with required fields
+            signature_type: Type of signature (default: EOA)
+
+        Returns:
+            JSON-encoded order with a "signature" field, ready to POST;
+            uint256 fields are encoded as decimal strings
+        """
+        signature = self.sign_order(order, signature_type)
+        payload = {
+            name: str(value) if name in UINT256_FIELDS and isinstance(value, int) else value
+            for name, value in order.items()
+        }
+        payload["signature"] = signature
+        return orjson.dumps(payload)
+
+    def sign_orders_batch(
+        self,
+        orders: List[Order],
+        signature_type: int = SignatureType.EOA
+    ) -> List[str]:
+        """
+        Sign multiple orders using EIP-712.
+
+        Signatures are identical to calling sign_order() per order.
+
+        Args:
+            orders: List of order dictionaries with required fields
+            signature_type: Type of signature (default: EOA)
+
+        Returns:
+            List of signatures as hex strings, in input order
+        """
+        signatures = []
+        for order in orders:
+            signatures.append(self._sign_struct_hash(self._hash_order_struct(order)).hex())
+
+        logger.debug(f"Signed batch of {len(signatures)} orders")
+        return signatures
+
     def sign_api_key_request(self, nonce: int) -> str:
         """
         Sign API key creation request.
@@ -92,11 +304,11 @@ class OrderSigner:
         Returns:
             Signature as hex string
         """
-        message = f"This message attests that I control the given wallet\n{nonce}"
+        message = API_KEY_MESSAGE_PREFIX + str(nonce).encode()
 
-        # Sign the message
+        # Sign the message (EIP-191 personal_sign)
         signed_message = self.account.sign_message(
-            text=message
+            encode_defunct(primitive=message)
         )
 
         return signed_message.signature.hex()
@@ -116,37 +328,48 @@ class OrderSigner:
         Returns:
             Signature as hex string
         """
-        cancel_data = {
-            "orderId": order_id,
-            "assetId": asset_id
-        }
+        # EIP-712 string fields are hashed with keccak256 in the struct hash
+        struct_hash = _keccak256(
+            CANCEL_ORDER_TYPE_HASH
+            + _keccak256(order_id.encode())
+            + _keccak256(asset_id.encode())
+        )
+        return self._sign_struct_hash(struct_hash).hex()
 
-        typed_data = {
-            "types": {
-                "EIP712Domain": [
-                    {"name": "name", "type": "string"},
-                    {"name": "version", "type": "string"},
-                    {"name": "chainId", "type": "uint256"},
-                ],
-                "CancelOrder": [
-                    {"name": "orderId", "type": "string"},
-                    {"name": "assetId", "type": "string"},
-                ]
-            },
-            "primaryType": "CancelOrder",
-            "domain": {
-                **EIP712_DOMAIN,
-                "chainId": self.chain_id
-            },
-            "message": cancel_data
-        }
+    def _sign_struct_hash(self, struct_hash: bytes) -> bytes:
+        """
+        Sign an EIP-712 struct hash under this signer's domain.
 
-        encoded_data = encode_typed_data(typed_data)
-        signed_message = self.account.sign_message(encoded_data)
+        Produces the same signature as eth_account's sign_message() on the
+        0x1901 typed-data message, without re-parsing the key each call.
 
-        return signed_message.signature.hex()
+        Args:
+            struct_hash: 32-byte EIP-712 struct hash
+
+        Returns:
+            65-byte signature (r || s || v, v in {27, 28})
+        """
+        signature = self._key.sign_msg_hash(self._typed_data_digest(struct_hash))
+
+        return (
+            signature.r.to_bytes(32, "big")
+            + signature.s.to_bytes(32, "big")
+            + bytes((signature.v + 27,))
+        )
+
+    def _typed_data_digest(self, struct_hash: bytes) -> bytes:
+        """
+        Calculate the EIP-712 message digest for a struct hash.
+
+        Args:
+            struct_hash: 32-byte EIP-712 struct hash
 
-    def _build_typed_data(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        Returns:
+            keccak256(0x1901 || domain separator || struct hash)
+        """
+        return _keccak256(b"\x19\x01" + self._domain_separator + struct_hash)
+
+    def _build_typed_data(self, order: Order) -> Dict[str, Any]:
         """
         Build EIP-712 typed data structure for order.
 
@@ -156,37 +379,57 @@ class OrderSigner:
         Returns:
             EIP-712 typed data structure
         """
-        return {
-            "types": {
-                "EIP712Domain": [
-                    {"name": "name", "type": "string"},
-                    {"name": "version", "type": "string"},
-                    {"name": "chainId", "type": "uint256"},
-                ],
-                "Order": [
-                    {"name": "salt", "type": "uint256"},
-                    {"name": "maker", "type": "address"},
-                    {"name": "signer", "type": "address"},
-                    {"name": "taker", "type": "address"},
-                    {"name": "tokenId", "type": "uint256"},
-                    {"name": "makerAmount", "type": "uint256"},
-                    {"name": "takerAmount", "type": "uint256"},
-                    {"name": "expiration", "type": "uint256"},
-                    {"name": "nonce", "type": "uint256"},
-                    {"name": "feeRateBps", "type": "uint256"},
-                    {"name": "side", "type": "uint8"},
-                    {"name": "signatureType", "type": "uint8"},
-                ]
-            },
-            "primaryType": "Order",
-            "domain": {
-                **EIP712_DOMAIN,
-                "chainId": self.chain_id
-            },
-            "message": order
-        }
+        return {**self._order_typed_data, "message": order}
+
+    def _compute_domain_separator(self) -> bytes:
+        """
+        Calculate the EIP-712 domain separator for this chain.
+
+        Returns:
+            32-byte domain separator hash
+        """
+        return keccak(
+            EIP712_DOMAIN_TYPE_HASH
+            + EIP712_DOMAIN_NAME_HASH
+            + EIP712_DOMAIN_VERSION_HASH
+            + encode(["uint256"], [self.chain_id])
+        )
 
-    def _get_order_hash(self, order: Dict[str, Any]) -> str:
+    @staticmethod
+    def _hash_order_struct(order: Order) -> bytes:
+        """
+        Calculate the EIP-712 struct hash of an order.
+
+        Args:
+            order: Order dictionary
+
+        Returns:
+            32-byte struct hash
+        """
+        # The struct has a fixed shape, so the words are packed directly
+        # rather than walking eth_abi's type registry for every order
+        words = [ORDER_TYPE_HASH]
+        for name, field_type in ORDER_FIELDS:
+            value = order[name]
+
+            if field_type == "address":
+                if isinstance(value, str):
+                    value = bytes.fromhex(value[2:] if value.startswith("0x") else value)
+                if len(value) != 20:
+                    raise ValueError(f"Invalid address for {name}: {order[name]!r}")
+                words.append(ADDRESS_PADDING + value)
+                continue
+
+            if isinstance(value, str):
+                # Numeric fields may be passed as decimal or hex strings
+                value = int(value, 16) if value.startswith("0x") else int(value)
+            if isinstance(value, bool) or not 0 <= value <= UINT_MAX[field_type]:
+                raise ValueError(f"Invalid {field_type} for {name}: {order[name]!r}")
+            words.append(value.to_bytes(32, "big"))
+
+        return _keccak256(b"".join(words))
+
+    def _get_order_hash(self, order: Order) -> str:
         """
         Calculate order hash for tracking.
 
@@ -196,16 +439,15 @@ class OrderSigner:
         Returns:
             Order hash as hex string
         """
-        typed_data = self._build_typed_data(order)
-        encoded_data = encode_typed_data(typed_data)
+        struct_hash = self._hash_order_struct(order)
 
         # Hash the encoded data
-        order_hash = keccak(encoded_data.body)
+        order_hash = _keccak256(struct_hash)
         return order_hash.hex()
 
     def verify_signature(
         self,
-        order: Dict[str, Any],
+        order: Order,
         signature: str
     ) -> bool:
         """
@@ -219,22 +461,19 @@ class OrderSigner:
             True if signature is valid
         """
         try:
-            typed_data = self._build_typed_data(order)
-            encoded_data = encode_typed_data(typed_data)
-
             # Recover signer address from signature
-            recovered_address = Account.recover_message(
-                encoded_data,
-                signature=signature
+            recovered_address = _recover_address(
+                self._typed_data_digest(self._hash_order_struct(order)),
+                signature
             )
 
-            # Check if recovered address matches signer
-            is_valid = recovered_address.lower() == self.address.lower()
+            # Check if recovered address matches signer (raw 20-byte compare)
+            is_valid = recovered_address == self._address_bytes
 
             if not is_valid:
                 logger.warning(
                     f"Signature verification failed. "
-                    f"Expected: {self.address}, Got: {recovered_address}"
+                    f"Expected: {self.address}, Got: {to_checksum_address(recovered_address)}"
                 )
 
             return is_valid
@@ -243,6 +482,43 @@ class OrderSigner:
             logger.error(f"Error verifying signature: {e}")
             return False
 
+    def verify_signatures_batch(
+        self,
+        orders: List[Order],
+        signatures: List[str]
+    ) -> List[bool]:
+        """
+        Verify multiple order signatures.
+
+        Args:
+            orders: List of order dictionaries
+            signatures: Signatures to verify, one per order
+
+        Returns:
+            List of booleans, True where the signature is valid
+        """
+        if len(orders) != len(signatures):
+            raise ValueError(
+                f"Got {len(orders)} orders but {len(signatures)} signatures"
+            )
+
+        expected_address = self._address_bytes
+
+        results: List[bool] = [False] * len(orders)
+        for i, (order, signature) in enumerate(zip(orders, signatures)):
+            # One bad order or signature doesn't abort the whole batch
+            try:
+                digest = self._typed_data_digest(self._hash_order_struct(order))
+                results[i] = _recover_address(digest, signature) == expected_address
+            except Exception as e:
+                logger.error(f"Error verifying signature: {e}")
+
+        invalid = results.count(False)
+        if invalid:
+            logger.warning(f"Batch signature verification failed for {invalid} orders")
+
+        return results
+
 
 def create_order_signer(private_key: str, chain_id: int = 137) -> OrderSigner:
     """
@@ -3,11 +3,17 @@ Configuration management for Polymarket MCP server.
 Loads and validates environment variables with proper defaults.
 """
 import os
-from typing import Optional
-from pydantic import Field, field_validator
+from functools import lru_cache
+from typing import Any, Optional
+from pydantic import Field, TypeAdapter, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# Placeholder wallet used when DEMO_MODE is enabled without credentials
+DEMO_PRIVATE_KEY = "0000000000000000000000000000000000000000000000000000000000000001"
+DEMO_ADDRESS = "0x0000000000000000000000000000000000000001"
+
+
 class PolymarketConfig(BaseSettings):
     """
     Configuration settings for Polymarket MCP server.
@@ -18,7 +24,8 @@ class PolymarketConfig(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=True,
-        extra="ignore"
+        extra="ignore",
+        frozen=True
     )
 
     # DEMO MODE - Run without real credentials (read-only)
@@ -135,20 +142,33 @@ class PolymarketConfig(BaseSettings):
     @field_validator("POLYGON_ADDRESS", mode="before")
     @classmethod
     def validate_address(cls, v: str) -> str:
-        """Pre-validate address format - just clean up the value"""
+        """Pre-validate address format - clean up and normalize to lowercase"""
         if v is None:
             return ""
+        if isinstance(v, str):
+            v = v.lower()
         return v
 
+    @model_validator(mode="before")
+    @classmethod
+    def fill_demo_defaults(cls, data: Any) -> Any:
+        """In DEMO mode, fill in placeholder wallet values before validation"""
+        if not isinstance(data, dict):
+            return data
+        if not TypeAdapter(bool).validate_python(data.get("DEMO_MODE", False)):
+            return data
+
+        data = dict(data)
+        if not data.get("POLYGON_PRIVATE_KEY"):
+            data["POLYGON_PRIVATE_KEY"] = DEMO_PRIVATE_KEY
+        if not data.get("POLYGON_ADDRESS"):
+            data["POLYGON_ADDRESS"] = DEMO_ADDRESS
+        return data
+
     def model_post_init(self, __context) -> None:
         """Validate credentials after all fields are loaded (including DEMO_MODE)"""
-        # In DEMO mode, set placeholder values
+        # Placeholder values were already filled in by fill_demo_defaults
         if self.DEMO_MODE:
-            # Use object.__setattr__ to bypass frozen model if needed
-            if not self.POLYGON_PRIVATE_KEY or self.POLYGON_PRIVATE_KEY == "":
-                object.__setattr__(self, 'POLYGON_PRIVATE_KEY', "0000000000000000000000000000000000000000000000000000000000000001")
-            if not self.POLYGON_ADDRESS or self.POLYGON_ADDRESS == "":
-                object.__setattr__(self, 'POLYGON_ADDRESS', "0x0000000000000000000000000000000000000001")
             return
 
         # Normal validation for non-demo mode
@@ -157,13 +177,16 @@ class PolymarketConfig(BaseSettings):
                 "POLYGON_PRIVATE_KEY is required (or set DEMO_MODE=true for read-only access)"
             )
         
-        # Validate private key format
+        # Validate private key format. bytes.fromhex() skips whitespace, so
+        # the decoded length is checked as well
         pk = self.POLYGON_PRIVATE_KEY
         if len(pk) != 64:
             raise ValueError("POLYGON_PRIVATE_KEY must be 64 hex characters")
         try:
-            int(pk, 16)
+            valid_hex = len(bytes.fromhex(pk)) == 32
         except ValueError:
+            valid_hex = False
+        if not valid_hex:
             raise ValueError("POLYGON_PRIVATE_KEY must be valid hex")
 
         # Validate address
@@ -175,9 +198,12 @@ class PolymarketConfig(BaseSettings):
             raise ValueError("POLYGON_ADDRESS must start with 0x")
         if len(self.POLYGON_ADDRESS) != 42:
             raise ValueError("POLYGON_ADDRESS must be 42 characters")
-        
-        # Normalize address to lowercase
-        object.__setattr__(self, 'POLYGON_ADDRESS', self.POLYGON_ADDRESS.lower())
+        try:
+            valid_hex = len(bytes.fromhex(self.POLYGON_ADDRESS[2:])) == 20
+        except ValueError:
+            valid_hex = False
+        if not valid_hex:
+            raise ValueError("POLYGON_ADDRESS must be valid hex")
 
     @field_validator("MAX_SPREAD_TOLERANCE")
     @classmethod
@@ -218,10 +244,15 @@ class PolymarketConfig(BaseSettings):
         return data
 
 
+@lru_cache(maxsize=1)
 def load_config() -> PolymarketConfig:
     """
     Load configuration from environment variables.
 
+    The parsed configuration is cached, so the .env file is only read and
+    validated once per process. Call load_config.cache_clear() after changing
+    the environment or .env file to force a reload.
+
     Returns:
         PolymarketConfig: Validated configuration object
 
@@ -0,0 +1,50 @@
+"""
+Command-line scripts: market analysis report, live tool demo and trading
+smoke test.
+
+Several scripts can run in one process, sharing the event loop and one
+pair of pooled API clients:
+
+    python -m polymarket_mcp.scripts analyze demo
+"""
+import importlib.util
+from typing import Tuple
+
+import httpx
+
+GAMMA_API_URL = "https://gamma-api.polymarket.com"
+CLOB_API_URL = "https://clob.polymarket.com"
+
+# Keep-alive pool shared by all script requests (HTTP/2 when h2 is installed)
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=40, keepalive_expiry=30)
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def create_clients() -> Tuple[httpx.AsyncClient, httpx.AsyncClient]:
+    """
+    Create the Gamma and CLOB API clients used by the scripts.
+
+    Both clients share one SSL context, so CA certificates load only once.
+
+    Returns:
+        Tuple of (gamma_client, clob_client)
+    """
+    ssl_context = httpx.create_ssl_context()
+    gamma_client, clob_client = (
+        httpx.AsyncClient(
+            base_url=base_url,
+            http2=HTTP2,
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT,
+            verify=ssl_context
+        )
+        for base_url in (GAMMA_API_URL, CLOB_API_URL)
+    )
+    return gamma_client, clob_client
+
+
+async def close_clients(*clients: httpx.AsyncClient) -> None:
+    """Close API clients created by create_clients"""
+    for client in clients:
+        await client.aclose()
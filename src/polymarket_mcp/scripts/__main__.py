@@ -0,0 +1,65 @@
+"""
+Run one or more scripts in a single process.
+
+Usage:
+    python -m polymarket_mcp.scripts analyze|demo|smoke-test [...]
+"""
+import argparse
+import asyncio
+import importlib
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from . import close_clients, create_clients
+
+# Command name -> module with an async run(gamma_client, clob_client).
+# Imported lazily so analyze/demo don't need the trading dependencies.
+COMMANDS = {
+    "analyze": "analyze",
+    "demo": "demo",
+    "smoke-test": "smoke",
+}
+
+
+async def dispatch(commands: List[str]) -> None:
+    """Run the given commands in order on one shared pair of clients"""
+    gamma_client, clob_client = create_clients()
+    try:
+        for command in commands:
+            module = importlib.import_module(f".{COMMANDS[command]}", __package__)
+            await module.run(gamma_client, clob_client)
+    finally:
+        await close_clients(gamma_client, clob_client)
+
+
+def main(argv: Optional[List[str]] = None, env_path: Path = Path(".env")) -> None:
+    """
+    Parse the command line and run the selected scripts.
+
+    env_path is the .env file smoke-test requires; by default it is looked
+    up in the working directory, the same place load_config reads it from.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m polymarket_mcp.scripts",
+        description="Polymarket analysis, demo and smoke-test scripts"
+    )
+    parser.add_argument(
+        "commands",
+        nargs="+",
+        choices=list(COMMANDS),
+        metavar="command",
+        help=f"Script to run, in order ({', '.join(COMMANDS)})"
+    )
+    args = parser.parse_args(argv)
+
+    if "smoke-test" in args.commands:
+        from .smoke import check_env_file
+        if not check_env_file(env_path):
+            sys.exit(1)
+
+    asyncio.run(dispatch(args.commands))
+
+
+if __name__ == "__main__":
+    main()
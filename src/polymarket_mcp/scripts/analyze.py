@@ -0,0 +1,434 @@
+"""
+Análise completa dos top 10 markets da Polymarket
+Com recomendações de investimento
+"""
+import asyncio
+import functools
+import heapq
+import io
+import sys
+from bisect import bisect_left, bisect_right
+import orjson
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from operator import itemgetter
+
+from ..utils.cache import cached_get_json
+
+# Separador das seções do relatório
+RULE = "=" * 80
+
+# Quantidade de markets analisados
+TOP_MARKETS = 10
+
+# Máximo de requisições de orderbook em paralelo
+MAX_CONCURRENT_BOOKS = 5
+
+@dataclass(slots=True, frozen=True)
+class MarketRow:
+    """Campos de um market já convertidos, extraídos uma única vez"""
+    market_id: str
+    question: str
+    volume: float
+    liquidity: float
+    yes: float
+    no: float
+    token_id: str | None
+
+def parse_market(market):
+    """Converte o dict da Gamma API em MarketRow"""
+    prices = parse_prices(market.get('outcomePrices'))
+    return MarketRow(
+        market_id=market.get('id', 'N/A'),
+        question=market.get('question', 'N/A'),
+        volume=float(market.get('volume24hr', 0) or 0),
+        liquidity=float(market.get('liquidity', 0) or 0),
+        yes=float(prices[0]) if prices and len(prices) > 0 else 0,
+        no=float(prices[1]) if prices and len(prices) > 1 else 0,
+        token_id=first_token_id(market),
+    )
+
+def has_tokens(market):
+    """Market negociável no CLOB (tem clobTokenIds)"""
+    return bool(market.get('clobTokenIds'))
+
+def first_token_id(market):
+    """Primeiro token (YES) do market; clobTokenIds pode ser lista JSON ou CSV"""
+    raw = market.get('clobTokenIds')
+    if not raw:
+        return None
+    if isinstance(raw, str):
+        raw = orjson.loads(raw) if raw.startswith('[') else raw.split(',')
+    return raw[0] if raw else None
+
+def parse_prices(prices_raw):
+    """outcomePrices pode vir como string JSON ou lista"""
+    if isinstance(prices_raw, str):
+        return orjson.loads(prices_raw)
+    return prices_raw
+
+async def fetch_book(client, token_id, sem):
+    """Busca o orderbook de um token, limitado pelo semáforo"""
+    if not token_id:
+        return None
+    async with sem:
+        response = await client.get('/book', params={'token_id': token_id})
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+async def fetch_books(client, token_ids):
+    """
+    Busca todos os orderbooks num único POST /books.
+    Se o endpoint não existir (404), volta para um GET /book por token.
+    """
+    wanted = [token_id for token_id in token_ids if token_id]
+    if not wanted:
+        return [None] * len(token_ids)
+
+    response = await client.post('/books', json=[{'token_id': token_id} for token_id in wanted])
+    if response.status_code == 404:
+        sem = asyncio.Semaphore(MAX_CONCURRENT_BOOKS)
+        books = await asyncio.gather(
+            *[fetch_book(client, token_id, sem) for token_id in token_ids],
+            return_exceptions=True
+        )
+        failed = sum(isinstance(book, BaseException) for book in books)
+        if failed:
+            print(f"⚠️  Falha ao buscar {failed} orderbook(s) - seguindo sem dados de profundidade\n")
+        return [None if isinstance(book, BaseException) else book for book in books]
+    if response.is_error:
+        print(f"⚠️  Falha ao buscar orderbooks (HTTP {response.status_code}) - seguindo sem dados de profundidade\n")
+        return [None] * len(token_ids)
+
+    # A resposta não garante a ordem do pedido: casar pelo asset_id
+    by_token = {book.get('asset_id'): book for book in orjson.loads(response.content)}
+    return [by_token.get(token_id) for token_id in token_ids]
+
+async def get_top_markets_with_analysis(gamma_client, clob_client):
+    """Busca e analisa os top 10 markets"""
+
+    print("\n" + "="*80)
+    print("📊 TOP 10 MARKETS DA POLYMARKET - ANÁLISE COMPLETA DE INVESTIMENTO")
+    print("="*80)
+    print(f"📅 Data: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+
+    # Buscar top markets por volume
+    print("🔍 Buscando markets com maior volume...\n")
+    markets = await cached_get_json(
+        gamma_client,
+        '/markets',
+        params={
+            'limit': TOP_MARKETS,
+            'active': 'true',
+            'closed': 'false',
+            'order': 'volume24hr',
+            'ascending': 'false'
+        }
+    )
+
+    # A Gamma API não garante clobTokenIds: descartar os markets sem token
+    valid_markets = list(islice(filter(has_tokens, markets), TOP_MARKETS))
+
+    # Converter cada market uma única vez (preços, volume, token)
+    rows = [parse_market(m) for m in valid_markets]
+
+    # Buscar todos os orderbooks numa única requisição
+    books = await fetch_books(clob_client, [row.token_id for row in rows])
+
+    # Saída acumulada em memória e escrita de uma vez no final
+    buf = io.StringIO()
+    emit = functools.partial(print, file=buf)
+
+    analyses = []
+
+    for i, (row, book) in enumerate(zip(rows, books), 1):
+        spread = 0
+        spread_pct = 0
+        depth_score = 0
+        best_bid = 0
+        best_ask = 0
+
+        # Orderbook já buscado (None se indisponível)
+        if isinstance(book, dict):
+            try:
+                bids = book.get('bids', [])
+                asks = book.get('asks', [])
+
+                if bids and asks:
+                    best_bid = float(bids[0].get('price', 0))
+                    best_ask = float(asks[0].get('price', 0))
+                    spread = best_ask - best_bid
+                    spread_pct = (spread / best_bid * 100) if best_bid > 0 else 0
+
+                    # Calculate depth (top 5 levels)
+                    bid_depth = 0.0
+                    for b in bids[:5]:
+                        bid_depth += float(b['size'])
+                    ask_depth = 0.0
+                    for a in asks[:5]:
+                        ask_depth += float(a['size'])
+                    depth_score = min(bid_depth, ask_depth)
+            except (KeyError, TypeError, ValueError) as e:
+                # Orderbook malformado: segue só com os dados da Gamma API
+                emit(f"   ⚠️  Orderbook inválido para {row.market_id}: {e!r}")
+
+        # Calculate metrics
+        analysis = analyze_market(
+            question=row.question,
+            volume_24h=row.volume,
+            liquidity=row.liquidity,
+            yes_price=row.yes,
+            no_price=row.no,
+            spread_pct=spread_pct,
+            depth_score=depth_score,
+            best_bid=best_bid,
+            best_ask=best_ask
+        )
+
+        analyses.append({
+            'rank': i,
+            'question': row.question,
+            'market_id': row.market_id,
+            'volume_24h': row.volume,
+            'liquidity': row.liquidity,
+            'yes_price': row.yes,
+            'no_price': row.no,
+            'spread_pct': spread_pct,
+            'best_bid': best_bid,
+            'best_ask': best_ask,
+            'depth_score': depth_score,
+            **analysis
+        })
+
+        # Print market info: bloco do market montado e escrito de uma vez
+        lines = [
+            f"{RULE}\n#{i} - {row.question}\n{RULE}\n"
+            f"\n💰 MÉTRICAS FINANCEIRAS:\n"
+            f"   Volume 24h: ${row.volume:,.0f}\n"
+            f"   Liquidez: ${row.liquidity:,.0f}\n"
+            f"   Profundidade Orderbook: {depth_score:.0f} contratos\n"
+            f"\n📈 PREÇOS ATUAIS:\n"
+            f"   YES: ${row.yes:.4f} ({row.yes*100:.1f}%)\n"
+            f"   NO:  ${row.no:.4f} ({row.no*100:.1f}%)"
+        ]
+        if best_bid > 0 and best_ask > 0:
+            lines.append(
+                f"   Melhor Bid: ${best_bid:.4f}\n"
+                f"   Melhor Ask: ${best_ask:.4f}\n"
+                f"   Spread: ${spread:.4f} ({spread_pct:.2f}%)"
+            )
+
+        lines.append(
+            f"\n🎯 ANÁLISE DE INVESTIMENTO:\n"
+            f"   Recomendação: {analysis['recommendation']} {RECOMMENDATION_EMOJI.get(analysis['recommendation'], '🔴')}\n"
+            f"   Score de Confiança: {analysis['confidence_score']}/100\n"
+            f"   Risk Level: {analysis['risk_level']} {RISK_EMOJI.get(analysis['risk_level'], '🔴')}\n"
+            f"\n💡 JUSTIFICATIVA:"
+        )
+        lines.extend(f"   • {reason}" for reason in analysis['reasons'])
+
+        lines.append("\n📊 FATORES CONSIDERADOS:")
+        for factor, score in analysis['factors'].items():
+            emoji = "✅" if score >= 70 else "⚠️" if score >= 40 else "❌"
+            lines.append(f"   {emoji} {factor}: {score}/100")
+
+        lines.append("\n")
+        emit("\n".join(lines))
+
+    # Summary and recommendations
+    emit("\n" + "="*80)
+    emit("🏆 RESUMO E RECOMENDAÇÕES FINAIS")
+    emit("="*80)
+
+    # Rank by investment score
+    buy_recommendations = [a for a in analyses if a['recommendation'] == 'BUY']
+    # Só as 5 melhores são mostradas (e as 3 primeiras vão para o portfólio)
+    top_buys = heapq.nlargest(5, buy_recommendations, key=itemgetter('confidence_score'))
+    hold_recommendations = [a for a in analyses if a['recommendation'] == 'HOLD']
+
+    if buy_recommendations:
+        emit(f"\n🟢 TOP {len(buy_recommendations)} RECOMENDAÇÕES DE COMPRA:\n")
+        for idx, rec in enumerate(top_buys, 1):
+            emit(
+                f"{idx}. {rec['question'][:65]}...\n"
+                f"   💰 Volume: ${rec['volume_24h']:,.0f} | Confiança: {rec['confidence_score']}/100\n"
+                f"   🎯 Estratégia sugerida: {rec['strategy']}\n"
+            )
+
+    if hold_recommendations:
+        emit(f"\n🟡 MARKETS PARA OBSERVAR ({len(hold_recommendations)}):\n")
+        for idx, rec in enumerate(hold_recommendations[:3], 1):
+            emit(f"{idx}. {rec['question'][:65]}...\n   💡 Motivo: {rec['reasons'][0]}\n")
+
+    avoid_recommendations = [a for a in analyses if a['recommendation'] == 'AVOID']
+    if avoid_recommendations:
+        emit(f"\n🔴 MARKETS PARA EVITAR ({len(avoid_recommendations)}):\n")
+        for rec in avoid_recommendations:
+            emit(f"❌ {rec['question'][:65]}...\n   ⚠️  Risco: {rec['risk_level']} - {rec['reasons'][0]}\n")
+
+    # Portfolio diversification suggestion
+    emit("\n" + "="*80)
+    emit("💼 SUGESTÃO DE PORTFÓLIO DIVERSIFICADO")
+    emit("="*80)
+
+    if buy_recommendations:
+        emit("\n📊 Para um portfolio de $1,000:")
+        emit()
+
+        top_3 = top_buys[:3]
+        allocations = [0.4, 0.35, 0.25]  # 40%, 35%, 25%
+
+        for rec, allocation in zip(top_3, allocations):
+            amount = 1000 * allocation
+            emit(f"• ${amount:.0f} ({allocation*100:.0f}%) - {rec['question'][:55]}...\n  Lado: {rec['side']} @ ${rec['entry_price']:.4f}\n")
+
+        emit("🎯 Objetivos:")
+        emit("  • Diversificação entre diferentes categorias")
+        emit("  • Balanceamento entre risco e retorno")
+        emit("  • Liquidez suficiente para saída rápida")
+
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+
+# Tabelas de pontuação por faixa: bisect_right(BINS, valor) dá o índice em
+# SCORES (limites inclusivos no lado de cima, como ">=" nos thresholds)
+VOLUME_BINS = (50_000, 100_000, 500_000, 1_000_000)
+VOLUME_SCORES = (30, 50, 70, 85, 95)
+
+LIQUIDITY_BINS = (50_000, 100_000, 500_000)
+LIQUIDITY_SCORES = (35, 60, 80, 95)
+LIQUIDITY_REASONS = (
+    "Liquidez baixa - risco de slippage",
+    "Liquidez moderada",
+    "Boa liquidez disponível",
+    "Liquidez excelente permite entrada/saída fácil",
+)
+
+# Spread: quanto menor, melhor (limites exclusivos: "< 1", "< 2", "< 5")
+SPREAD_BINS = (1, 2, 5)
+SPREAD_SCORES = (95, 85, 60, 30)
+
+# Preço YES: 0.10-0.90 é eficiente, 0.05-0.95 aceitável, fora disso one-sided
+PRICE_LOW_BINS = (0.05, 0.10)
+PRICE_HIGH_BINS = (0.90, 0.95)
+PRICE_SCORES = (40, 70, 85)
+PRICE_REASONS = (
+    "Market muito one-sided - pouca oportunidade",
+    None,
+    "Preço reflete incerteza real - boa oportunidade",
+)
+
+DEPTH_BINS = (100, 500, 1000)
+DEPTH_SCORES = (35, 55, 75, 90)
+
+# Nível de risco pelo score geral (">= 60" médio, ">= 80" baixo)
+RISK_BINS = (60, 80)
+RISK_LEVELS = ("ALTO", "MÉDIO", "BAIXO")
+
+# Emojis do relatório (qualquer outro valor aparece em vermelho)
+RECOMMENDATION_EMOJI = {"BUY": "🟢", "HOLD": "🟡", "AVOID": "🔴"}
+RISK_EMOJI = {"BAIXO": "🟢", "MÉDIO": "🟡", "ALTO": "🔴"}
+
+# Nomes e tabelas de pontuação na mesma ordem retornada por factor_tiers
+FACTOR_KEYS = ('Volume/Atividade', 'Liquidez', 'Spread', 'Eficiência de Preço', 'Profundidade')
+FACTOR_SCORES = (VOLUME_SCORES, LIQUIDITY_SCORES, SPREAD_SCORES, PRICE_SCORES, DEPTH_SCORES)
+
+def factor_tiers(volume_24h, liquidity, spread_pct, yes_price, depth_score):
+    """
+    Núcleo numérico da pontuação: índice da faixa de cada fator
+    (volume, liquidez, spread, eficiência de preço, profundidade).
+    """
+    return (
+        bisect_right(VOLUME_BINS, volume_24h),
+        bisect_right(LIQUIDITY_BINS, liquidity),
+        bisect_right(SPREAD_BINS, spread_pct),
+        # Faixa simétrica: o tier é limitado pelo lado (baixo ou alto) mais extremo
+        min(
+            bisect_right(PRICE_LOW_BINS, yes_price),
+            len(PRICE_HIGH_BINS) - bisect_left(PRICE_HIGH_BINS, yes_price)
+        ),
+        bisect_right(DEPTH_BINS, depth_score),
+    )
+
+def analyze_market(question, volume_24h, liquidity, yes_price, no_price,
+                   spread_pct, depth_score, best_bid, best_ask):
+    """Análise detalhada de um market"""
+
+    # Calculate individual factor scores
+    tiers = factor_tiers(volume_24h, liquidity, spread_pct, yes_price, depth_score)
+    _, liq_tier, spread_tier, price_tier, _ = tiers
+    scores = [table[tier] for table, tier in zip(FACTOR_SCORES, tiers)]
+
+    # Justificativas só depois da parte numérica
+    reasons = [LIQUIDITY_REASONS[liq_tier]]
+    if spread_tier == len(SPREAD_BINS):
+        reasons.append("Spread elevado aumenta custo de entrada")
+    if PRICE_REASONS[price_tier]:
+        reasons.append(PRICE_REASONS[price_tier])
+
+    # Calculate overall score
+    overall_score = sum(scores) / len(scores)
+
+    # Determine risk level
+    risk_level = RISK_LEVELS[bisect_right(RISK_BINS, overall_score)]
+
+    # Determine recommendation
+    if overall_score >= 75 and liquidity >= 100000 and volume_24h >= 100000:
+        recommendation = "BUY"
+        confidence_score = min(95, int(overall_score))
+
+        # Determine best side
+        if yes_price < 0.3:
+            side = "YES"
+            entry_price = best_ask if best_ask > 0 else yes_price
+            reasons.insert(0, f"YES underpriced em ${yes_price:.3f} - upside potencial")
+        elif no_price < 0.3:
+            side = "NO"
+            entry_price = 1 - (best_bid if best_bid > 0 else yes_price)
+            reasons.insert(0, f"NO underpriced em ${no_price:.3f} - upside potencial")
+        elif 0.4 <= yes_price <= 0.6:
+            side = "YES" if yes_price < 0.5 else "NO"
+            entry_price = best_ask if side == "YES" else (1 - best_bid)
+            reasons.insert(0, "Market balanceado - boa para swing trading")
+        else:
+            side = "YES" if yes_price < no_price else "NO"
+            entry_price = yes_price if side == "YES" else no_price
+            reasons.insert(0, "Momentum trade baseado em probabilidades")
+
+        strategy = f"Entrar gradualmente, limit orders perto de ${entry_price:.4f}"
+
+    elif overall_score >= 55 and liquidity >= 50000:
+        recommendation = "HOLD"
+        confidence_score = int(overall_score)
+        side = "AGUARDAR"
+        entry_price = yes_price
+        strategy = "Observar movimento de preços antes de entrar"
+        reasons.insert(0, "Condições moderadas - aguardar melhor setup")
+
+    else:
+        recommendation = "AVOID"
+        confidence_score = int(overall_score)
+        side = "N/A"
+        entry_price = 0
+        strategy = "Não tradear - condições desfavoráveis"
+
+        if liquidity < 50000:
+            reasons.insert(0, "Liquidez insuficiente - alto risco")
+        if spread_pct > 5:
+            reasons.insert(0, "Spread muito alto - custo proibitivo")
+
+    return {
+        'recommendation': recommendation,
+        'confidence_score': confidence_score,
+        'risk_level': risk_level,
+        'factors': dict(zip(FACTOR_KEYS, scores)),
+        'reasons': reasons,
+        'side': side,
+        'entry_price': entry_price,
+        'strategy': strategy
+    }
+
+async def run(gamma_client, clob_client):
+    """Entrada do comando "analyze" """
+    await get_top_markets_with_analysis(gamma_client, clob_client)
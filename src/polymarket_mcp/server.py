@@ -13,7 +13,7 @@ from mcp.server import Server
 
 from .config import load_config, PolymarketConfig
 from .auth import PolymarketClient, create_polymarket_client
-from .utils import get_rate_limiter, create_safety_limits_from_config, SafetyLimits, WebSocketManager
+from .utils import get_rate_limiter, create_safety_limits_from_config, SafetyLimits, WebSocketManager, close_http_client
 from .tools import (
     market_discovery,
     market_analysis,
@@ -397,6 +397,9 @@ async def main() -> None:
     except Exception as e:
         logger.error(f"Server error: {e}")
         raise
+    finally:
+        # Release pooled keep-alive connections to the Polymarket APIs
+        await close_http_client()
 
 
 def run():
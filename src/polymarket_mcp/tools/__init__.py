@@ -1,8 +1,18 @@
 """Trading and market tools"""
 
-from . import market_discovery
-from . import market_analysis
-from .trading import TradingTools, get_tool_definitions
+import importlib
+from typing import Any
+
+# Tool modules are imported on first attribute access (PEP 562), so
+# importing one tool module doesn't load all the others
+_LAZY_MODULES = {
+    "market_discovery": ".market_discovery",
+    "market_analysis": ".market_analysis",
+}
+_LAZY_ATTRIBUTES = {
+    "TradingTools": ".trading",
+    "get_tool_definitions": ".trading",
+}
 
 __all__ = [
     "market_discovery",
@@ -10,3 +20,17 @@ __all__ = [
     "TradingTools",
     "get_tool_definitions",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_MODULES:
+        return importlib.import_module(_LAZY_MODULES[name], __name__)
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -12,16 +12,22 @@ Provides 10 tools for analyzing markets:
 - get_market_holders: Top position holders
 - analyze_market_opportunity: AI-powered analysis
 - compare_markets: Compare multiple markets
+
+get_market_snapshot is also available to Python callers that need price,
+spread, volume and liquidity together with a minimal number of requests.
 """
+import asyncio
 import json
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import mcp.types as types
-import httpx
+import orjson
 
 from ..utils.rate_limiter import EndpointCategory, get_rate_limiter
+from ..utils.http_client import get_http_client
+from ..utils.cache import async_ttl_cache
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +35,19 @@ logger = logging.getLogger(__name__)
 GAMMA_API_URL = "https://gamma-api.polymarket.com"
 CLOB_API_URL = "https://clob.polymarket.com"
 
+# How long an opportunity analysis is reused before recomputing
+ANALYSIS_CACHE_TTL = 15.0
+
+# Markets below this liquidity are always rated high risk (AVOID)
+MIN_TRADABLE_LIQUIDITY_USD = 10000
+
+# API requests made by one analyze_market_opportunity() call, per category
+# (market details; BUY and SELL prices for the YES and NO tokens)
+OPPORTUNITY_REQUESTS = {
+    EndpointCategory.GAMMA_API: 1,
+    EndpointCategory.MARKET_DATA: 4,
+}
+
 
 # Data Models
 class PriceData(BaseModel):
@@ -54,6 +73,21 @@ class OrderBook(BaseModel):
     asks: List[OrderBookEntry]
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
+    def top(self, n: int = 5) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
+        """
+        Get the best price levels on each side.
+
+        Args:
+            n: Number of levels per side
+
+        Returns:
+            (bids, asks) as lists of (price, size) tuples, best first
+        """
+        return (
+            [(entry.price, entry.size) for entry in self.bids[:n]],
+            [(entry.price, entry.size) for entry in self.asks[:n]]
+        )
+
 
 class VolumeData(BaseModel):
     """Volume statistics"""
@@ -64,8 +98,29 @@ class VolumeData(BaseModel):
     volume_all_time: Optional[float] = None
 
 
+class MarketSnapshot(BaseModel):
+    """Price, spread, volume and liquidity for a market in one object"""
+    market_id: str
+    token_id: Optional[str] = None
+    question: Optional[str] = None
+    bid: Optional[float] = None
+    ask: Optional[float] = None
+    mid: Optional[float] = None
+    spread_value: Optional[float] = None
+    spread_percentage: Optional[float] = None
+    volume_24h: Optional[float] = None
+    volume_7d: Optional[float] = None
+    volume_30d: Optional[float] = None
+    volume_all_time: Optional[float] = None
+    liquidity_usd: float = 0.0
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+
 class MarketOpportunity(BaseModel):
     """Market analysis and opportunity assessment"""
+    # Immutable so cached analyses can be shared between callers
+    model_config = ConfigDict(frozen=True)
+
     market_id: str
     market_question: str
     current_price_yes: Optional[float] = None
@@ -89,11 +144,11 @@ async def _fetch_gamma_api(endpoint: str, params: Optional[Dict] = None) -> Any:
     await rate_limiter.acquire(EndpointCategory.GAMMA_API)
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            url = f"{GAMMA_API_URL}{endpoint}"
-            response = await client.get(url, params=params or {})
-            response.raise_for_status()
-            return response.json()
+        client = get_http_client()
+        url = f"{GAMMA_API_URL}{endpoint}"
+        response = await client.get(url, params=params or {})
+        response.raise_for_status()
+        return orjson.loads(response.content)
     except Exception as e:
         logger.error(f"Gamma API error for {endpoint}: {e}")
         raise
@@ -106,11 +161,11 @@ async def _fetch_clob_api(endpoint: str, params: Optional[Dict] = None) -> Any:
     await rate_limiter.acquire(EndpointCategory.MARKET_DATA)
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            url = f"{CLOB_API_URL}{endpoint}"
-            response = await client.get(url, params=params or {})
-            response.raise_for_status()
-            return response.json()
+        client = get_http_client()
+        url = f"{CLOB_API_URL}{endpoint}"
+        response = await client.get(url, params=params or {})
+        response.raise_for_status()
+        return orjson.loads(response.content)
     except Exception as e:
         logger.error(f"CLOB API error for {endpoint}: {e}")
         raise
@@ -171,13 +226,18 @@ async def get_current_price(
     try:
         price_data = PriceData(token_id=token_id)
 
-        if side in ["BUY", "BOTH"]:
-            buy_data = await _fetch_clob_api("/price", {"token_id": token_id, "side": "BUY"})
-            price_data.ask = float(buy_data.get("price", 0))
+        # BUY and SELL quotes are independent requests, so fetch them together
+        sides = [s for s in ("BUY", "SELL") if side in (s, "BOTH")]
+        quotes = await asyncio.gather(*[
+            _fetch_clob_api("/price", {"token_id": token_id, "side": s})
+            for s in sides
+        ])
 
-        if side in ["SELL", "BOTH"]:
-            sell_data = await _fetch_clob_api("/price", {"token_id": token_id, "side": "SELL"})
-            price_data.bid = float(sell_data.get("price", 0))
+        for quote_side, quote in zip(sides, quotes):
+            if quote_side == "BUY":
+                price_data.ask = float(quote.get("price", 0))
+            else:
+                price_data.bid = float(quote.get("price", 0))
 
         # Calculate mid price
         if price_data.bid is not None and price_data.ask is not None:
@@ -209,18 +269,20 @@ async def get_orderbook(
     try:
         book_data = await _fetch_clob_api("/book", {"token_id": token_id})
 
-        # Parse bids and asks
+        # Parse bids and asks. Values are converted here already, so skip
+        # pydantic validation for every level (deep books have many)
+        construct_entry = OrderBookEntry.model_construct
         bids = [
-            OrderBookEntry(price=float(entry["price"]), size=float(entry["size"]))
+            construct_entry(price=float(entry["price"]), size=float(entry["size"]))
             for entry in book_data.get("bids", [])[:depth]
         ]
 
         asks = [
-            OrderBookEntry(price=float(entry["price"]), size=float(entry["size"]))
+            construct_entry(price=float(entry["price"]), size=float(entry["size"]))
             for entry in book_data.get("asks", [])[:depth]
         ]
 
-        orderbook = OrderBook(
+        orderbook = OrderBook.model_construct(
             token_id=token_id,
             bids=bids,
             asks=asks
@@ -272,6 +334,22 @@ async def get_spread(token_id: str) -> Dict[str, float]:
         raise
 
 
+def _parse_volume(market_id: str, market_data: Dict[str, Any]) -> VolumeData:
+    """Extract volume for each timeframe from a Gamma market object"""
+    return VolumeData(
+        market_id=market_id,
+        volume_24h=float(market_data.get("volume24hr", 0) or 0),
+        volume_7d=float(market_data.get("volume7d", 0) or 0),
+        volume_30d=float(market_data.get("volume30d", 0) or 0),
+        volume_all_time=float(market_data.get("volumeNum", 0) or 0)
+    )
+
+
+def _parse_liquidity(market_data: Dict[str, Any]) -> float:
+    """Extract liquidity in USD from a Gamma market object"""
+    return float(market_data.get("liquidity", 0) or 0)
+
+
 async def get_market_volume(
     market_id: str,
     timeframes: Optional[List[str]] = None
@@ -293,13 +371,7 @@ async def get_market_volume(
         # Get market details which include volume data
         market_data = await get_market_details(market_id=market_id)
 
-        volume_data = VolumeData(market_id=market_id)
-
-        # Extract volume for each timeframe
-        volume_data.volume_24h = float(market_data.get("volume24hr", 0) or 0)
-        volume_data.volume_7d = float(market_data.get("volume7d", 0) or 0)
-        volume_data.volume_30d = float(market_data.get("volume30d", 0) or 0)
-        volume_data.volume_all_time = float(market_data.get("volumeNum", 0) or 0)
+        volume_data = _parse_volume(market_id, market_data)
 
         logger.info(f"Volume for {market_id}: 24h=${volume_data.volume_24h}")
 
@@ -323,7 +395,7 @@ async def get_liquidity(market_id: str) -> Dict[str, Any]:
     try:
         market_data = await get_market_details(market_id=market_id)
 
-        liquidity = float(market_data.get("liquidity", 0) or 0)
+        liquidity = _parse_liquidity(market_data)
 
         result = {
             "market_id": market_id,
@@ -340,6 +412,75 @@ async def get_liquidity(market_id: str) -> Dict[str, Any]:
         raise
 
 
+async def get_market_snapshot(
+    market_id: str,
+    token_id: Optional[str] = None,
+    market_data: Optional[Dict[str, Any]] = None
+) -> MarketSnapshot:
+    """
+    Get price, spread, volume and liquidity in a single call.
+
+    Volume and liquidity come from one market details request instead of one
+    each, and the token prices are fetched concurrently with it.
+
+    Args:
+        market_id: Market ID
+        token_id: Token ID to price (optional, price fields are left empty without it)
+        market_data: Already fetched market details, to skip the details request
+
+    Returns:
+        MarketSnapshot with price, spread, volume and liquidity
+    """
+    try:
+        price_data = None
+
+        if market_data is None and token_id:
+            market_data, price_data = await asyncio.gather(
+                get_market_details(market_id=market_id),
+                get_current_price(token_id, "BOTH")
+            )
+        else:
+            if market_data is None:
+                market_data = await get_market_details(market_id=market_id)
+            if token_id:
+                price_data = await get_current_price(token_id, "BOTH")
+
+        volume_data = _parse_volume(market_id, market_data)
+
+        snapshot = MarketSnapshot(
+            market_id=market_id,
+            token_id=token_id,
+            question=market_data.get("question"),
+            volume_24h=volume_data.volume_24h,
+            volume_7d=volume_data.volume_7d,
+            volume_30d=volume_data.volume_30d,
+            volume_all_time=volume_data.volume_all_time,
+            liquidity_usd=_parse_liquidity(market_data)
+        )
+
+        if price_data is not None:
+            snapshot.bid = price_data.bid
+            snapshot.ask = price_data.ask
+            snapshot.mid = price_data.mid
+
+            if price_data.bid is not None and price_data.ask is not None:
+                snapshot.spread_value = price_data.ask - price_data.bid
+                snapshot.spread_percentage = (
+                    (snapshot.spread_value / price_data.mid) * 100 if price_data.mid else 0
+                )
+
+        logger.info(
+            f"Snapshot for {market_id}: mid={snapshot.mid}, "
+            f"24h=${snapshot.volume_24h}, liquidity=${snapshot.liquidity_usd:,.2f}"
+        )
+
+        return snapshot
+
+    except Exception as e:
+        logger.error(f"Failed to get market snapshot: {e}")
+        raise
+
+
 async def get_price_history(
     token_id: str,
     start_date: Optional[str] = None,
@@ -420,10 +561,14 @@ async def get_market_holders(
         raise
 
 
+@async_ttl_cache(ttl=ANALYSIS_CACHE_TTL, maxsize=128)
 async def analyze_market_opportunity(market_id: str) -> MarketOpportunity:
     """
     AI-powered market analysis.
 
+    Results are cached per market for ANALYSIS_CACHE_TTL seconds, so
+    workflows analysing overlapping markets share one analysis.
+
     Args:
         market_id: Market ID
 
@@ -431,51 +576,50 @@ async def analyze_market_opportunity(market_id: str) -> MarketOpportunity:
         Complete analysis with recommendation
     """
     try:
-        # Get comprehensive market data
+        # Get comprehensive market data (includes volume and liquidity)
         market_details = await get_market_details(market_id=market_id)
 
-        # Get volume and liquidity
-        volume_data = await get_market_volume(market_id)
-        liquidity_data = await get_liquidity(market_id)
-
         # Get current prices for tokens
         tokens = market_details.get("tokens", [])
         token_prices = {}
+        snapshot = None
+        spread_value = None
+        spread_pct = None
 
         if len(tokens) >= 2:
-            # Get YES and NO token prices
+            # Get YES snapshot (price + spread) and NO token price
             yes_token = tokens[0]
             no_token = tokens[1]
 
             try:
-                yes_price = await get_current_price(yes_token.get("token_id"), "BOTH")
-                no_price = await get_current_price(no_token.get("token_id"), "BOTH")
-
-                token_prices["yes"] = yes_price.mid
+                # Both tokens are priced concurrently, once details are known
+                snapshot, no_price = await asyncio.gather(
+                    get_market_snapshot(
+                        market_id, yes_token.get("token_id"), market_data=market_details
+                    ),
+                    get_current_price(no_token.get("token_id"), "BOTH")
+                )
+
+                token_prices["yes"] = snapshot.mid
                 token_prices["no"] = no_price.mid
 
-                # Calculate spread
-                if yes_price.bid and yes_price.ask:
-                    spread_value = yes_price.ask - yes_price.bid
-                    spread_pct = (spread_value / yes_price.mid) * 100 if yes_price.mid else 0
-                else:
-                    spread_value = None
-                    spread_pct = None
+                # Spread only counts when both sides are quoted
+                if snapshot.bid and snapshot.ask:
+                    spread_value = snapshot.spread_value
+                    spread_pct = snapshot.spread_percentage
 
             except Exception as price_error:
                 logger.warning(f"Could not fetch token prices: {price_error}")
-                spread_value = None
-                spread_pct = None
-        else:
-            spread_value = None
-            spread_pct = None
+
+        if snapshot is None:
+            snapshot = await get_market_snapshot(market_id, market_data=market_details)
 
         # Analyze market conditions
-        liquidity_usd = liquidity_data.get("liquidity_usd", 0)
-        volume_24h = volume_data.volume_24h or 0
+        liquidity_usd = snapshot.liquidity_usd
+        volume_24h = snapshot.volume_24h or 0
 
         # Risk assessment
-        if liquidity_usd < 10000:
+        if liquidity_usd < MIN_TRADABLE_LIQUIDITY_USD:
             risk = "high"
             risk_reason = "Low liquidity"
         elif spread_pct and spread_pct > 5:
@@ -554,35 +698,38 @@ async def compare_markets(market_ids: List[str]) -> List[Dict[str, Any]]:
         if len(market_ids) > 10:
             raise ValueError("Maximum 10 markets can be compared at once")
 
-        comparisons = []
+        async def _compare_one(market_id: str) -> Dict[str, Any]:
+            # Volume and liquidity are parsed from the same details response
+            market = await get_market_details(market_id=market_id)
+            volume = _parse_volume(market_id, market)
+
+            return {
+                "market_id": market_id,
+                "question": market.get("question", "Unknown"),
+                "volume_24h": volume.volume_24h,
+                "volume_7d": volume.volume_7d,
+                "liquidity_usd": _parse_liquidity(market),
+                "end_date": market.get("endDate") or market.get("end_date_iso"),
+                "active": market.get("active", True),
+                "tags": market.get("tags", [])
+            }
 
-        for market_id in market_ids:
-            try:
-                # Get market details
-                market = await get_market_details(market_id=market_id)
-                volume = await get_market_volume(market_id)
-                liquidity = await get_liquidity(market_id)
+        # Fetch all markets concurrently; failures become error entries
+        results = await asyncio.gather(
+            *[_compare_one(market_id) for market_id in market_ids],
+            return_exceptions=True
+        )
 
-                # Compile comparison data
-                comparison = {
-                    "market_id": market_id,
-                    "question": market.get("question", "Unknown"),
-                    "volume_24h": volume.volume_24h,
-                    "volume_7d": volume.volume_7d,
-                    "liquidity_usd": liquidity.get("liquidity_usd"),
-                    "end_date": market.get("endDate") or market.get("end_date_iso"),
-                    "active": market.get("active", True),
-                    "tags": market.get("tags", [])
-                }
-
-                comparisons.append(comparison)
-
-            except Exception as market_error:
-                logger.warning(f"Failed to fetch data for {market_id}: {market_error}")
+        comparisons = []
+        for market_id, result in zip(market_ids, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to fetch data for {market_id}: {result}")
                 comparisons.append({
                     "market_id": market_id,
-                    "error": str(market_error)
+                    "error": str(result)
                 })
+            else:
+                comparisons.append(result)
 
         logger.info(f"Compared {len(comparisons)} markets")
 
@@ -11,21 +11,68 @@ Provides 8 tools for discovering and filtering markets:
 - get_sports_markets: Sports betting markets
 - get_crypto_markets: Cryptocurrency markets
 """
+import heapq
 import json
 import logging
+import time
+from operator import itemgetter
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 import mcp.types as types
+import orjson
 import httpx
 
 from ..utils.rate_limiter import EndpointCategory, get_rate_limiter
+from ..utils.http_client import get_http_client
+from ..utils.cache import async_ttl_cache
 
 logger = logging.getLogger(__name__)
 
+# How long market listings are reused before refetching
+MARKET_LIST_CACHE_TTL = 30.0
+
 # Gamma API base URL
 GAMMA_API_URL = "https://gamma-api.polymarket.com"
 
 
+def _normalize_market_ids(markets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Ensure every market has its ID under the "id" key.
+
+    Some responses only carry "market_id"; copying it once here lets
+    callers use market["id"] without checking both keys.
+
+    Args:
+        markets: Market dictionaries, updated in place
+
+    Returns:
+        The same list of markets
+    """
+    for market in markets:
+        if isinstance(market, dict) and not market.get("id"):
+            market["id"] = market.get("market_id")
+    return markets
+
+
+def _parse_end_epoch(end_date: Any) -> float:
+    """
+    Convert a market end date to a Unix timestamp.
+
+    Args:
+        end_date: ISO 8601 string (naive values are treated as UTC) or epoch seconds
+
+    Returns:
+        End time as seconds since the epoch
+    """
+    if isinstance(end_date, str):
+        end_dt = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
+        if end_dt.tzinfo is None:
+            end_dt = end_dt.replace(tzinfo=timezone.utc)
+        return end_dt.timestamp()
+
+    return float(end_date)
+
+
 async def _fetch_gamma_markets(
     endpoint: str = "/markets",
     params: Optional[Dict[str, Any]] = None,
@@ -47,35 +94,38 @@ async def _fetch_gamma_markets(
     await rate_limiter.acquire(EndpointCategory.GAMMA_API)
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            url = f"{GAMMA_API_URL}{endpoint}"
-
-            # Set default params
-            if params is None:
-                params = {}
-
-            # Add limit if specified
-            if limit:
-                params["limit"] = limit
-
-            logger.debug(f"Fetching from {url} with params: {params}")
-
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-
-            data = response.json()
-
-            # Handle different response formats
-            if isinstance(data, list):
-                return data[:limit] if limit else data
-            elif isinstance(data, dict):
-                # Some endpoints return {data: [...], next_cursor: ...}
-                if "data" in data:
-                    return data["data"][:limit] if limit else data["data"]
-                # Others return the market directly
-                return [data]
+        client = get_http_client()
+        url = f"{GAMMA_API_URL}{endpoint}"
+
+        # Set default params
+        if params is None:
+            params = {}
+
+        # Add limit if specified
+        if limit:
+            params["limit"] = limit
+
+        logger.debug(f"Fetching from {url} with params: {params}")
+
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+
+        # Handle different response formats
+        if isinstance(data, list):
+            markets = data[:limit] if limit else data
+        elif isinstance(data, dict):
+            # Some endpoints return {data: [...], next_cursor: ...}
+            if "data" in data:
+                markets = data["data"][:limit] if limit else data["data"]
+            # Others return the market directly
+            else:
+                markets = [data]
+        else:
+            markets = []
 
-            return []
+        return _normalize_market_ids(markets)
 
     except httpx.HTTPError as e:
         logger.error(f"HTTP error fetching markets: {e}")
@@ -118,6 +168,7 @@ async def search_markets(
         raise
 
 
+@async_ttl_cache(ttl=MARKET_LIST_CACHE_TTL)
 async def get_trending_markets(
     timeframe: str = "24h",
     limit: int = 10
@@ -145,14 +196,12 @@ async def get_trending_markets(
 
         volume_key = volume_key_map.get(timeframe, "volume24hr")
 
-        # Sort by volume (descending)
-        sorted_markets = sorted(
+        # Top markets by volume (descending); same order as sorted()[:limit]
+        result = heapq.nlargest(
+            limit,
             markets,
-            key=lambda m: float(m.get(volume_key, 0) or 0),
-            reverse=True
+            key=lambda m: float(m.get(volume_key, 0) or 0)
         )
-
-        result = sorted_markets[:limit]
         logger.info(f"Found {len(result)} trending markets for timeframe: {timeframe}")
 
         return result
@@ -162,6 +211,7 @@ async def get_trending_markets(
         raise
 
 
+@async_ttl_cache(ttl=MARKET_LIST_CACHE_TTL)
 async def filter_markets_by_category(
     category: str,
     active_only: bool = True,
@@ -224,7 +274,7 @@ async def get_event_markets(
         else:
             event = event_data
 
-        markets = event.get("markets", [])
+        markets = _normalize_market_ids(event.get("markets", []))
 
         logger.info(f"Found {len(markets)} markets for event: {event_slug or event_id}")
         return markets
@@ -262,6 +312,7 @@ async def get_featured_markets(limit: int = 10) -> List[Dict[str, Any]]:
         raise
 
 
+@async_ttl_cache(ttl=MARKET_LIST_CACHE_TTL)
 async def get_closing_soon_markets(
     hours: int = 24,
     limit: int = 20
@@ -278,36 +329,30 @@ async def get_closing_soon_markets(
     """
     try:
         # Calculate cutoff time
-        cutoff_time = datetime.utcnow() + timedelta(hours=hours)
-        cutoff_timestamp = int(cutoff_time.timestamp())
+        cutoff_epoch = time.time() + hours * 3600
 
         # Fetch active markets
         markets = await _fetch_gamma_markets("/markets", {"active": "true"}, limit=100)
 
-        # Filter markets closing within timeframe
+        # Filter markets closing within timeframe, parsing each end date once
         closing_soon = []
         for market in markets:
             end_date = market.get("endDate") or market.get("end_date_iso")
             if end_date:
-                # Parse ISO date or timestamp
                 try:
-                    if isinstance(end_date, str):
-                        end_dt = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
-                    else:
-                        end_dt = datetime.fromtimestamp(int(end_date))
-
-                    # Check if closing within timeframe
-                    if end_dt <= cutoff_time:
-                        closing_soon.append(market)
-
-                except Exception as parse_error:
+                    end_epoch = _parse_end_epoch(end_date)
+                except (TypeError, ValueError) as parse_error:
                     logger.warning(f"Failed to parse end_date: {end_date}, error: {parse_error}")
                     continue
 
+                # Check if closing within timeframe
+                if end_epoch <= cutoff_epoch:
+                    closing_soon.append((end_epoch, market))
+
         # Sort by end date (soonest first)
-        closing_soon.sort(key=lambda m: m.get("endDate", m.get("end_date_iso", "")))
+        closing_soon.sort(key=itemgetter(0))
 
-        result = closing_soon[:limit]
+        result = [market for _, market in closing_soon[:limit]]
         logger.info(f"Found {len(result)} markets closing within {hours} hours")
 
         return result
@@ -12,13 +12,18 @@ from typing import Dict, Any, List, Optional, Tuple, Literal
 from datetime import datetime, timedelta
 from decimal import Decimal
 from collections import defaultdict
-import httpx
+import orjson
 import asyncio
 
 import mcp.types as types
 
+from ..utils.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
+DATA_API_URL = "https://data-api.polymarket.com"
+DATA_API_TIMEOUT = 10.0
+
 
 class PortfolioDataCache:
     """Simple cache for portfolio data to reduce API calls"""
@@ -49,6 +54,22 @@ class PortfolioDataCache:
 _portfolio_cache = PortfolioDataCache()
 
 
+async def _fetch_data_api(endpoint: str, params: Dict[str, Any]) -> Any:
+    """
+    Fetch from the Data API over the shared HTTP client.
+
+    Callers acquire the DATA_API rate limit token themselves.
+    """
+    client = get_http_client()
+    response = await client.get(
+        f"{DATA_API_URL}{endpoint}",
+        params=params,
+        timeout=DATA_API_TIMEOUT
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
 async def get_all_positions(
     polymarket_client,
     rate_limiter,
@@ -85,21 +106,14 @@ async def get_all_positions(
             positions_data = cached_data
         else:
             # Fetch positions using direct HTTP call to Data API
-            async with httpx.AsyncClient() as client:
-                params = {
-                    "user": config.POLYGON_ADDRESS.lower()
-                }
+            params = {
+                "user": config.POLYGON_ADDRESS.lower()
+            }
 
-                response = await client.get(
-                    "https://data-api.polymarket.com/positions",
-                    params=params,
-                    timeout=10.0
-                )
-                response.raise_for_status()
-                positions_data = response.json()
+            positions_data = await _fetch_data_api("/positions", params)
 
-                # Cache the result
-                _portfolio_cache.set(cache_key, positions_data)
+            # Cache the result
+            _portfolio_cache.set(cache_key, positions_data)
 
         if not positions_data:
             return [types.TextContent(
@@ -238,19 +252,12 @@ async def get_position_details(
 
         # Fetch position data
         await rate_limiter.acquire(EndpointCategory.DATA_API)
-        async with httpx.AsyncClient() as client:
-            params = {
-                "user": config.POLYGON_ADDRESS.lower(),
-                "market": market_id
-            }
+        params = {
+            "user": config.POLYGON_ADDRESS.lower(),
+            "market": market_id
+        }
 
-            response = await client.get(
-                "https://data-api.polymarket.com/positions",
-                params=params,
-                timeout=10.0
-            )
-            response.raise_for_status()
-            positions = response.json()
+        positions = await _fetch_data_api("/positions", params)
 
         if not positions:
             return [types.TextContent(
@@ -271,18 +278,11 @@ async def get_position_details(
 
         # Fetch recent trades in this market
         await rate_limiter.acquire(EndpointCategory.DATA_API)
-        async with httpx.AsyncClient() as client:
-            trade_response = await client.get(
-                "https://data-api.polymarket.com/trades",
-                params={
-                    "user": config.POLYGON_ADDRESS.lower(),
-                    "market": market_id,
-                    "limit": 10
-                },
-                timeout=10.0
-            )
-            trade_response.raise_for_status()
-            recent_trades = trade_response.json()
+        recent_trades = await _fetch_data_api("/trades", {
+            "user": config.POLYGON_ADDRESS.lower(),
+            "market": market_id,
+            "limit": 10
+        })
 
         # Calculate position metrics
         size = float(position.get('size', 0))
@@ -421,14 +421,7 @@ async def get_portfolio_value(
 
         # Get all positions
         await rate_limiter.acquire(EndpointCategory.DATA_API)
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://data-api.polymarket.com/positions",
-                params={"user": config.POLYGON_ADDRESS.lower()},
-                timeout=10.0
-            )
-            response.raise_for_status()
-            positions = response.json()
+        positions = await _fetch_data_api("/positions", {"user": config.POLYGON_ADDRESS.lower()})
 
         # Get open orders
         try:
@@ -568,32 +561,18 @@ async def get_pnl_summary(
 
         # Fetch trades
         await rate_limiter.acquire(EndpointCategory.DATA_API)
-        async with httpx.AsyncClient() as client:
-            params = {
-                "user": config.POLYGON_ADDRESS.lower(),
-                "limit": 500
-            }
-            if start_time:
-                params['start_time'] = start_time
+        params = {
+            "user": config.POLYGON_ADDRESS.lower(),
+            "limit": 500
+        }
+        if start_time:
+            params['start_time'] = start_time
 
-            response = await client.get(
-                "https://data-api.polymarket.com/trades",
-                params=params,
-                timeout=10.0
-            )
-            response.raise_for_status()
-            trades = response.json()
+        trades = await _fetch_data_api("/trades", params)
 
         # Fetch current positions for unrealized P&L
         await rate_limiter.acquire(EndpointCategory.DATA_API)
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://data-api.polymarket.com/positions",
-                params={"user": config.POLYGON_ADDRESS.lower()},
-                timeout=10.0
-            )
-            response.raise_for_status()
-            positions = response.json()
+        positions = await _fetch_data_api("/positions", {"user": config.POLYGON_ADDRESS.lower()})
 
         # Calculate realized P&L from trades
         # Group trades by market and outcome to match buys with sells
@@ -799,14 +778,7 @@ async def get_trade_history(
 
         # Fetch trades
         await rate_limiter.acquire(EndpointCategory.DATA_API)
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://data-api.polymarket.com/trades",
-                params=params,
-                timeout=10.0
-            )
-            response.raise_for_status()
-            trades = response.json()
+        trades = await _fetch_data_api("/trades", params)
 
         # Filter by side
         if side != 'BOTH':
@@ -915,14 +887,7 @@ async def get_activity_log(
 
         # Fetch activity
         await rate_limiter.acquire(EndpointCategory.DATA_API)
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://data-api.polymarket.com/activity",
-                params=params,
-                timeout=10.0
-            )
-            response.raise_for_status()
-            activities = response.json()
+        activities = await _fetch_data_api("/activity", params)
 
         if not activities:
             return [types.TextContent(
@@ -990,14 +955,7 @@ async def analyze_portfolio_risk(
 
         # Fetch all positions
         await rate_limiter.acquire(EndpointCategory.DATA_API)
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://data-api.polymarket.com/positions",
-                params={"user": config.POLYGON_ADDRESS.lower()},
-                timeout=10.0
-            )
-            response.raise_for_status()
-            positions = response.json()
+        positions = await _fetch_data_api("/positions", {"user": config.POLYGON_ADDRESS.lower()})
 
         if not positions:
             return [types.TextContent(
@@ -1228,14 +1186,7 @@ async def suggest_portfolio_actions(
 
         # Fetch all positions
         await rate_limiter.acquire(EndpointCategory.DATA_API)
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://data-api.polymarket.com/positions",
-                params={"user": config.POLYGON_ADDRESS.lower()},
-                timeout=10.0
-            )
-            response.raise_for_status()
-            positions = response.json()
+        positions = await _fetch_data_api("/positions", {"user": config.POLYGON_ADDRESS.lower()})
 
         if not positions:
             return [types.TextContent(
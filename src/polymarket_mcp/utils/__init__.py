@@ -1,10 +1,15 @@
-"""Utilities for rate limiting, safety validation, and WebSocket management"""
+"""Utilities for rate limiting, caching, safety validation, and WebSocket management"""
 
 from .rate_limiter import (
     RateLimiter,
     EndpointCategory,
     get_rate_limiter,
 )
+from .http_client import (
+    get_http_client,
+    close_http_client,
+)
+from .cache import async_ttl_cache, cached_get_json
 from .safety_limits import (
     SafetyLimits,
     OrderRequest,
@@ -28,6 +33,10 @@ __all__ = [
     "RateLimiter",
     "EndpointCategory",
     "get_rate_limiter",
+    "get_http_client",
+    "close_http_client",
+    "async_ttl_cache",
+    "cached_get_json",
     "SafetyLimits",
     "OrderRequest",
     "Position",
@@ -0,0 +1,169 @@
+"""
+Short-lived in-process caching for async API helpers.
+
+Market listings change slowly relative to how often the tools ask for
+them, so a few seconds of staleness saves repeated Gamma API round trips
+and rate limiter tokens.
+
+For development scripts, cached_get_json can also keep GET responses on
+disk between runs when POLYMARKET_DEV_CACHE=1 is set.
+"""
+import asyncio
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+import httpx
+import orjson
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# On-disk cache for development runs only (never enabled by default)
+DEV_CACHE_ENV = "POLYMARKET_DEV_CACHE"
+DEV_CACHE_DIR_ENV = "POLYMARKET_DEV_CACHE_DIR"
+DEV_CACHE_TTL = 60.0
+
+
+def async_ttl_cache(
+    ttl: float = 30.0,
+    maxsize: int = 32
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Cache results of an async function for a limited time.
+
+    Arguments are bound to the function signature first, so f("x") and
+    f(market_id="x") share a cache entry. Concurrent calls with the same
+    arguments share a single in-flight request. Failed calls are not cached. Cached values are returned
+    as-is, so callers must not mutate them.
+
+    Args:
+        ttl: Seconds a result stays valid
+        maxsize: Maximum number of cached argument combinations
+
+    Returns:
+        Decorator for async functions with hashable arguments
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        cache: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        pending: Dict[Hashable, asyncio.Future] = {}
+        signature = inspect.signature(func)
+
+        def _make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return tuple(
+                (name, tuple(sorted(value.items())))
+                if signature.parameters[name].kind is inspect.Parameter.VAR_KEYWORD
+                else (name, value)
+                for name, value in bound.arguments.items()
+            )
+
+        def _store(key: Hashable, task: asyncio.Future) -> None:
+            pending.pop(key, None)
+            if task.cancelled() or task.exception() is not None:
+                return
+
+            cache[key] = (time.monotonic() + ttl, task.result())
+            cache.move_to_end(key)
+            while len(cache) > maxsize:
+                cache.popitem(last=False)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            key = _make_key(args, kwargs)
+
+            entry = cache.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    cache.move_to_end(key)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Cache hit for {func.__name__}{args}")
+                    return entry[1]
+                del cache[key]
+
+            task = pending.get(key)
+            if task is None or task.get_loop() is not asyncio.get_running_loop():
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                pending[key] = task
+                task.add_done_callback(functools.partial(_store, key))
+
+            # Shield so one cancelled caller doesn't cancel the shared request
+            return await asyncio.shield(task)
+
+        def cache_clear() -> None:
+            """Drop all cached results"""
+            cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def _dev_cache_dir() -> Optional[Path]:
+    """Directory for the on-disk cache, or None when it is disabled"""
+    if os.environ.get(DEV_CACHE_ENV) != "1":
+        return None
+    return Path(os.environ.get(DEV_CACHE_DIR_ENV, ".httpcache"))
+
+
+async def cached_get_json(
+    client: httpx.AsyncClient,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    ttl: float = DEV_CACHE_TTL
+) -> Any:
+    """
+    GET a JSON endpoint, reusing a recent response saved on disk.
+
+    Only active when POLYMARKET_DEV_CACHE=1, so live market data is never
+    cached outside development. Otherwise this is a plain GET.
+
+    Args:
+        client: HTTP client (its base_url is part of the cache key)
+        url: Endpoint path or absolute URL
+        params: Query parameters
+        ttl: Seconds a saved response stays valid
+
+    Returns:
+        Decoded JSON response
+    """
+    cache_dir = _dev_cache_dir()
+    path = None
+
+    if cache_dir is not None:
+        key = orjson.dumps(
+            [str(client.base_url), url, sorted((params or {}).items())]
+        )
+        path = cache_dir / f"{hashlib.sha256(key).hexdigest()}.json"
+        try:
+            if time.time() - path.stat().st_mtime < ttl:
+                logger.debug(f"Dev cache hit for {url}")
+                return orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            pass
+
+    response = await client.get(url, params=params)
+    response.raise_for_status()
+    content = response.content
+    data = orjson.loads(content)
+
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so a concurrent reader never sees a partial file
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write dev cache entry {path}: {e}")
+
+    return data
@@ -0,0 +1,69 @@
+"""
+Shared HTTP client for the Polymarket REST APIs.
+
+Reusing one httpx.AsyncClient keeps connections alive between requests,
+so repeated Gamma and CLOB calls skip the TCP and TLS handshake.
+"""
+import asyncio
+import importlib.util
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Connection pool settings for the shared client
+HTTP_TIMEOUT = 30.0
+HTTP_LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0
+)
+
+# HTTP/2 needs the optional h2 package. httpx adds "br" to Accept-Encoding
+# by itself when brotli is installed, so no explicit header is set here.
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# Singleton instance and the event loop it belongs to
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared HTTP client.
+
+    Pooled connections are bound to the event loop they were opened on,
+    so a new client is created when called from a different loop
+    (e.g. successive asyncio.run() calls).
+
+    Returns:
+        httpx.AsyncClient shared by all tools
+    """
+    global _http_client, _http_client_loop
+
+    loop = asyncio.get_running_loop()
+
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            limits=HTTP_LIMITS,
+            http2=HTTP2_ENABLED
+        )
+        _http_client_loop = loop
+        logger.debug(f"Created shared HTTP client (http2={HTTP2_ENABLED})")
+
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and release its pooled connections"""
+    global _http_client, _http_client_loop
+
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+        logger.debug("Closed shared HTTP client")
+
+    _http_client = None
+    _http_client_loop = None
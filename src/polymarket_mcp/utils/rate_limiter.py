@@ -5,6 +5,7 @@ Respects Polymarket's API rate limits across different endpoint categories.
 import asyncio
 import time
 from collections import defaultdict
+from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, Optional
@@ -12,6 +13,12 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Reservations from acquire_many() active in the current task. Tasks created
+# inside an `async with` block inherit the context, so the whole batch sees them
+_active_reservations: ContextVar[Dict["EndpointCategory", "TokenReservation"]] = ContextVar(
+    "_active_reservations", default={}
+)
+
 
 class EndpointCategory(Enum):
     """Polymarket API endpoint categories with different rate limits"""
@@ -108,6 +115,13 @@ class TokenBucket:
         Returns:
             float: Time waited in seconds
         """
+        # Fast path: enough tokens left since the last refill and nobody
+        # queued ahead of us. No await between check and decrement, so this
+        # is atomic within the event loop.
+        if self.tokens >= tokens and not self._lock.locked():
+            self.tokens -= tokens
+            return 0.0
+
         async with self._lock:
             wait_time = 0.0
 
@@ -136,12 +150,92 @@ class TokenBucket:
                 await asyncio.sleep(sleep_time)
                 wait_time += sleep_time
 
+    def release(self, tokens: float) -> None:
+        """Return unused tokens to the bucket (never above max_tokens)"""
+        self._refill()
+        self.tokens = min(self.max_tokens, self.tokens + tokens)
+
     def available_tokens(self) -> int:
         """Get current number of available tokens"""
         self._refill()
         return int(self.tokens)
 
 
+class TokenReservation:
+    """
+    Tokens taken from a bucket up front for one batch of requests.
+
+    Use as an async context manager: entering waits for the tokens, and
+    while the block runs, acquire() calls made from it (including tasks it
+    starts) spend the reservation instead of the bucket. Tokens still
+    unspent on exit go back to the bucket.
+    """
+
+    def __init__(
+        self,
+        limiter: "RateLimiter",
+        category: "EndpointCategory",
+        count: int,
+        retry_on_429: bool = True
+    ):
+        self.limiter = limiter
+        self.category = category
+        self.count = count
+        self.retry_on_429 = retry_on_429
+        self.remaining = 0
+        self.wait_time = 0.0
+        self._context_token = None
+
+    async def __aenter__(self) -> "TokenReservation":
+        bucket = self.limiter.buckets.get(self.category)
+        if bucket is not None and self.count > 0:
+            if self.retry_on_429:
+                self.wait_time += await self.limiter._wait_for_backoff(self.category)
+
+            # The bucket never holds more than max_tokens, so take large
+            # reservations in bucket-sized chunks
+            remaining = self.count
+            try:
+                while remaining > 0:
+                    chunk = min(remaining, bucket.max_tokens)
+                    self.wait_time += await bucket.acquire(chunk)
+                    remaining -= chunk
+                    self.remaining += chunk
+            except BaseException:
+                self._release()
+                raise
+
+            logger.debug(
+                f"Reserved {self.count} tokens for {self.category.value} "
+                f"(waited {self.wait_time:.2f}s)"
+            )
+
+        self._context_token = _active_reservations.set(
+            {**_active_reservations.get(), self.category: self}
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        _active_reservations.reset(self._context_token)
+        self._release()
+
+    def spend(self, tokens: int) -> bool:
+        """Take tokens from the reservation, if enough are left"""
+        if self.remaining < tokens:
+            return False
+        self.remaining -= tokens
+        return True
+
+    def _release(self) -> None:
+        """Give unspent tokens back to the bucket"""
+        if self.remaining > 0:
+            logger.debug(
+                f"Releasing {self.remaining} unused tokens for {self.category.value}"
+            )
+            self.limiter.buckets[self.category].release(self.remaining)
+            self.remaining = 0
+
+
 class RateLimiter:
     """
     Rate limiter managing multiple token buckets for different endpoint categories.
@@ -150,6 +244,7 @@ class RateLimiter:
     - Separate buckets per endpoint category
     - Automatic queuing when limit reached
     - Exponential backoff on 429 errors
+    - Bulk token reservation for concurrent request batches
     - Thread-safe async operations
     """
 
@@ -184,22 +279,22 @@ class RateLimiter:
             logger.warning(f"Unknown category: {category}. No rate limiting applied.")
             return 0.0
 
+        # Spend tokens reserved by an enclosing acquire_many() block
+        # without touching the bucket
+        reservation = _active_reservations.get().get(category)
+        if (
+            reservation is not None
+            and reservation.limiter is self
+            and not (retry_on_429 and self._in_backoff(category))
+            and reservation.spend(tokens)
+        ):
+            return 0.0
+
         total_wait = 0.0
 
         # Apply 429 backoff if needed
         if retry_on_429:
-            async with self._backoff_lock:
-                backoff_until = self._429_backoff.get(category, 0.0)
-                now = time.monotonic()
-
-                if backoff_until > now:
-                    wait_time = backoff_until - now
-                    logger.warning(
-                        f"429 backoff active for {category.value}. "
-                        f"Waiting {wait_time:.2f}s"
-                    )
-                    await asyncio.sleep(wait_time)
-                    total_wait += wait_time
+            total_wait += await self._wait_for_backoff(category)
 
         # Acquire tokens from bucket
         wait_time = await bucket.acquire(tokens)
@@ -207,6 +302,64 @@ class RateLimiter:
 
         return total_wait
 
+    def acquire_many(
+        self,
+        category: EndpointCategory,
+        count: int,
+        retry_on_429: bool = True
+    ) -> TokenReservation:
+        """
+        Reserve tokens for a batch of requests up front.
+
+        Waits once for the whole batch when the returned reservation is
+        entered. Inside the `async with` block, acquire() calls for this
+        category return immediately while reserved tokens last, so the batch
+        can be issued concurrently without queueing on the bucket lock.
+        Unused tokens go back to the bucket when the block exits.
+
+        Example:
+            async with rate_limiter.acquire_many(EndpointCategory.MARKET_DATA, 10):
+                await asyncio.gather(*requests)
+
+        Args:
+            category: Endpoint category
+            count: Number of requests to reserve tokens for
+            retry_on_429: Whether to apply backoff if 429 was recently seen
+
+        Returns:
+            TokenReservation async context manager
+        """
+        return TokenReservation(self, category, count, retry_on_429)
+
+    def _in_backoff(self, category: EndpointCategory) -> bool:
+        """Check whether a 429 backoff is currently active for a category"""
+        return self._429_backoff.get(category, 0.0) > time.monotonic()
+
+    async def _wait_for_backoff(self, category: EndpointCategory) -> float:
+        """
+        Sleep until any active 429 backoff for a category has expired.
+
+        Args:
+            category: Endpoint category
+
+        Returns:
+            float: Time waited in seconds
+        """
+        async with self._backoff_lock:
+            backoff_until = self._429_backoff.get(category, 0.0)
+            now = time.monotonic()
+
+            if backoff_until > now:
+                wait_time = backoff_until - now
+                logger.warning(
+                    f"429 backoff active for {category.value}. "
+                    f"Waiting {wait_time:.2f}s"
+                )
+                await asyncio.sleep(wait_time)
+                return wait_time
+
+        return 0.0
+
     async def handle_429_error(
         self,
         category: EndpointCategory,
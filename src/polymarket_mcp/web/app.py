@@ -24,8 +24,8 @@ import uvicorn
 from pydantic import BaseModel, ValidationError
 
 from ..config import load_config, PolymarketConfig
-from ..auth import create_polymarket_client, PolymarketClient
-from ..utils import get_rate_limiter, create_safety_limits_from_config, SafetyLimits
+from ..auth import create_polymarket_client, clear_client_cache, PolymarketClient
+from ..utils import get_rate_limiter, create_safety_limits_from_config, SafetyLimits, close_http_client
 from ..tools import market_discovery, market_analysis
 
 # Configure logging
@@ -117,6 +117,8 @@ async def shutdown_event():
     # Close all websockets
     for ws in active_websockets:
         await ws.close()
+    # Release pooled keep-alive connections to the Polymarket APIs
+    await close_http_client()
     logger.info("Dashboard shutdown complete")
 
 
@@ -409,7 +411,10 @@ async def update_config(config_update: ConfigUpdateRequest):
         # Write back
         env_file.write_text('\n'.join(updated_lines))
 
-        # Reload config
+        # Reload config (drop the cached copies so the new .env is read
+        # and the client is rebuilt from it)
+        load_config.cache_clear()
+        clear_client_cache()
         await load_mcp_config()
 
         return JSONResponse({
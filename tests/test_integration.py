@@ -306,6 +306,252 @@ class TestDemoMode:
             if key in os.environ:
                 del os.environ[key]
 
+    def test_load_config_is_cached(self):
+        """Test that repeated load_config calls reuse the parsed config."""
+        os.environ["DEMO_MODE"] = "true"
+
+        import sys
+        sys.path.insert(0, "src")
+        from polymarket_mcp.config import load_config
+
+        load_config.cache_clear()
+        try:
+            first = load_config()
+            assert load_config() is first
+
+            # Clearing the cache forces a fresh parse
+            load_config.cache_clear()
+            assert load_config() is not first
+        finally:
+            load_config.cache_clear()
+            del os.environ["DEMO_MODE"]
+
+
+class TestClientFactory:
+    """Test caching of PolymarketClient instances."""
+
+    TEST_PRIVATE_KEY = "11" * 32
+    OTHER_PRIVATE_KEY = "22" * 32
+    TEST_ADDRESS = "0x19E7E376E7C213B7E7e7e46cc70A5dD086DAff2A"
+
+    def test_clients_cached_per_wallet(self):
+        """Test clients are reused per address and rebuilt for new credentials."""
+        import sys
+        sys.path.insert(0, "src")
+        from polymarket_mcp.auth import create_polymarket_client, clear_client_cache
+
+        clear_client_cache()
+        try:
+            first = create_polymarket_client(self.TEST_PRIVATE_KEY, self.TEST_ADDRESS)
+            assert create_polymarket_client(self.TEST_PRIVATE_KEY, self.TEST_ADDRESS.lower()) is first
+
+            # A different key for the same wallet replaces the cached client
+            replaced = create_polymarket_client(self.OTHER_PRIVATE_KEY, self.TEST_ADDRESS)
+            assert replaced is not first
+            assert create_polymarket_client(self.OTHER_PRIVATE_KEY, self.TEST_ADDRESS) is replaced
+
+            # Rotated L2 credentials replace the cached client
+            with_creds = create_polymarket_client(
+                self.OTHER_PRIVATE_KEY, self.TEST_ADDRESS, api_key="key", api_secret="secret"
+            )
+            assert with_creds is not replaced
+            assert create_polymarket_client(
+                self.OTHER_PRIVATE_KEY, self.TEST_ADDRESS, api_key="key", api_secret="secret"
+            ) is with_creds
+            assert create_polymarket_client(
+                self.OTHER_PRIVATE_KEY, self.TEST_ADDRESS, api_key="key", passphrase="rotated"
+            ) is not with_creds
+
+            # Other chains get their own client
+            assert create_polymarket_client(
+                self.OTHER_PRIVATE_KEY, self.TEST_ADDRESS, chain_id=80002
+            ) is not replaced
+
+            clear_client_cache()
+            assert create_polymarket_client(self.OTHER_PRIVATE_KEY, self.TEST_ADDRESS) is not replaced
+        finally:
+            clear_client_cache()
+
+
+class TestOrderSigner:
+    """Test EIP-712 order signing."""
+
+    TEST_PRIVATE_KEY = "11" * 32
+
+    def _make_orders(self, signer, count):
+        return [
+            {
+                "salt": i + 1,
+                "maker": signer.address,
+                "signer": signer.address,
+                "taker": "0x0000000000000000000000000000000000000000",
+                "tokenId": str(12345 + i),
+                "makerAmount": "1000000",
+                "takerAmount": str(2000000 + i),
+                "expiration": 0,
+                "nonce": i,
+                "feeRateBps": 0,
+                "side": i % 2,
+                "signatureType": 0,
+            }
+            for i in range(count)
+        ]
+
+    def test_sign_orders_batch_matches_typed_data(self):
+        """Test batch signing matches standard EIP-712 typed-data signing."""
+        import sys
+        sys.path.insert(0, "src")
+        from eth_account.messages import encode_typed_data
+        from polymarket_mcp.auth.signer import OrderSigner
+
+        signer = OrderSigner(self.TEST_PRIVATE_KEY)
+        orders = self._make_orders(signer, 4)
+
+        batch = signer.sign_orders_batch(orders)
+
+        expected = [
+            signer.account.sign_message(
+                encode_typed_data(full_message=signer._build_typed_data(order))
+            ).signature.hex()
+            for order in orders
+        ]
+        assert batch == expected
+        assert [signer.sign_order(order) for order in orders] == expected
+
+    def test_verify_signatures_batch(self):
+        """Test batch verification flags tampered orders."""
+        import sys
+        sys.path.insert(0, "src")
+        from polymarket_mcp.auth.signer import OrderSigner
+
+        signer = OrderSigner(self.TEST_PRIVATE_KEY)
+        orders = self._make_orders(signer, 4)
+        signatures = signer.sign_orders_batch(orders)
+
+        assert signer.verify_signatures_batch(orders, signatures) == [True] * 4
+
+        orders[2]["makerAmount"] = "999"
+        assert signer.verify_signatures_batch(orders, signatures) == [True, True, False, True]
+
+    def test_verify_signature(self):
+        """Test single-order verification accepts valid and rejects tampered orders."""
+        import sys
+        sys.path.insert(0, "src")
+        from polymarket_mcp.auth.signer import OrderSigner
+
+        signer = OrderSigner(self.TEST_PRIVATE_KEY)
+        order = self._make_orders(signer, 1)[0]
+        signature = signer.sign_order(order)
+
+        assert signer.verify_signature(order, signature)
+        assert not signer.verify_signature({**order, "salt": 99}, signature)
+
+    def test_from_bytes_matches_hex_key(self):
+        """Test a signer built from raw key bytes matches one built from hex."""
+        import sys
+        sys.path.insert(0, "src")
+        from polymarket_mcp.auth.signer import OrderSigner
+
+        signer = OrderSigner(self.TEST_PRIVATE_KEY)
+        raw = OrderSigner.from_bytes(bytes.fromhex(self.TEST_PRIVATE_KEY))
+
+        assert raw.address == signer.address
+        order = self._make_orders(signer, 1)[0]
+        assert raw.sign_order(order) == signer.sign_order(order)
+
+    def test_sign_order_bytes(self):
+        """Test raw signature bytes match the hex signature."""
+        import sys
+        sys.path.insert(0, "src")
+        from polymarket_mcp.auth.signer import OrderSigner
+
+        signer = OrderSigner(self.TEST_PRIVATE_KEY)
+        order = self._make_orders(signer, 1)[0]
+
+        signature = signer.sign_order_bytes(order)
+        assert len(signature) == 65
+        assert signature.hex() == signer.sign_order(order)
+
+    def test_sign_and_serialize(self):
+        """Test the serialized order carries the order fields and its signature."""
+        import sys
+        sys.path.insert(0, "src")
+        import json
+        from polymarket_mcp.auth.signer import OrderSigner
+
+        signer = OrderSigner(self.TEST_PRIVATE_KEY)
+        order = self._make_orders(signer, 1)[0]
+
+        payload = json.loads(signer.sign_and_serialize(order))
+        assert payload == {
+            **order,
+            "salt": str(order["salt"]),
+            "expiration": str(order["expiration"]),
+            "nonce": str(order["nonce"]),
+            "feeRateBps": str(order["feeRateBps"]),
+            "signature": signer.sign_order(order),
+        }
+
+    def test_sign_and_serialize_full_size_uint256(self):
+        """Test int uint256 fields beyond 64 bits serialize as decimal strings."""
+        import sys
+        sys.path.insert(0, "src")
+        import json
+        from polymarket_mcp.auth.signer import OrderSigner
+
+        signer = OrderSigner(self.TEST_PRIVATE_KEY)
+        order = {
+            **self._make_orders(signer, 1)[0],
+            "salt": 2 ** 64 + 1,
+            "tokenId": 71321045679252212594626385532706912750332728571942532289631379312455583992563,
+        }
+
+        payload = json.loads(signer.sign_and_serialize(order))
+        assert payload["salt"] == str(2 ** 64 + 1)
+        assert payload["tokenId"] == str(order["tokenId"])
+        assert payload["side"] == order["side"]
+        assert payload["signature"] == signer.sign_order(order)
+
+    def test_sign_api_key_request(self):
+        """Test the API key request is a personal_sign of the attestation message."""
+        import sys
+        sys.path.insert(0, "src")
+        from eth_account import Account
+        from eth_account.messages import encode_defunct
+        from polymarket_mcp.auth.signer import OrderSigner
+
+        signer = OrderSigner(self.TEST_PRIVATE_KEY)
+        signature = signer.sign_api_key_request(42)
+
+        message = encode_defunct(text="This message attests that I control the given wallet\n42")
+        assert Account.recover_message(message, signature=signature) == signer.address
+
+    def test_sign_cancel_order_matches_typed_data(self):
+        """Test cancel signing matches standard EIP-712 typed-data signing."""
+        import sys
+        sys.path.insert(0, "src")
+        from eth_account.messages import encode_typed_data
+        from polymarket_mcp.auth.signer import OrderSigner, EIP712_DOMAIN, EIP712_DOMAIN_TYPE
+
+        signer = OrderSigner(self.TEST_PRIVATE_KEY, chain_id=80002)
+        typed_data = {
+            "types": {
+                "EIP712Domain": EIP712_DOMAIN_TYPE,
+                "CancelOrder": [
+                    {"name": "orderId", "type": "string"},
+                    {"name": "assetId", "type": "string"},
+                ],
+            },
+            "primaryType": "CancelOrder",
+            "domain": {**EIP712_DOMAIN, "chainId": 80002},
+            "message": {"orderId": "0xabc", "assetId": "12345"},
+        }
+
+        expected = signer.account.sign_message(
+            encode_typed_data(full_message=typed_data)
+        ).signature.hex()
+        assert signer.sign_cancel_order("0xabc", "12345") == expected
+
 
 class TestWebSocketConnectivity:
     """Test WebSocket connections."""
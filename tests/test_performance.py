@@ -190,6 +190,155 @@ class TestRateLimiterPerformance:
         # Should handle all checks quickly
         assert duration < 1.0  # Should be very fast
 
+    @pytest.mark.asyncio
+    async def test_acquire_fast_path_respects_queue(self):
+        """Test available tokens are taken without waiting, but not past queued waiters."""
+        import sys
+        sys.path.insert(0, "src")
+
+        from polymarket_mcp.utils.rate_limiter import RateLimitConfig, TokenBucket
+
+        bucket = TokenBucket(RateLimitConfig(max_tokens=2, refill_rate=20.0, window_seconds=0.1))
+
+        assert await bucket.acquire() == 0.0
+        assert await bucket.acquire() == 0.0
+
+        # Bucket is empty: the first caller waits for a refill while holding
+        # the lock, and a later caller must queue behind it
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        assert bucket._lock.locked()
+
+        bucket.tokens = 1.0
+        late = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        assert not late.done()
+
+        assert await waiter >= 0.0
+        assert await late >= 0.0
+
+    @pytest.mark.asyncio
+    async def test_acquire_many_prepays_requests(self):
+        """Test reserved tokens let acquire calls inside the block skip the bucket."""
+        import sys
+        sys.path.insert(0, "src")
+
+        from polymarket_mcp.utils import RateLimiter, EndpointCategory
+
+        rate_limiter = RateLimiter()
+        category = EndpointCategory.MARKET_DATA
+        bucket = rate_limiter.buckets[category]
+
+        async with rate_limiter.acquire_many(category, 10) as reservation:
+            assert reservation.wait_time == 0.0
+            assert reservation.remaining == 10
+
+            tokens_before = bucket.tokens
+            waits = await asyncio.gather(*[rate_limiter.acquire(category) for _ in range(10)])
+            assert waits == [0.0] * 10
+            assert bucket.tokens == tokens_before
+            assert reservation.remaining == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_many_releases_unused_tokens(self):
+        """Test unspent reservations return to the bucket and limiting resumes."""
+        import sys
+        sys.path.insert(0, "src")
+
+        from polymarket_mcp.utils import RateLimiter, EndpointCategory
+        from polymarket_mcp.utils.rate_limiter import RateLimitConfig, TokenBucket
+
+        rate_limiter = RateLimiter()
+        category = EndpointCategory.MARKET_DATA
+        bucket = TokenBucket(RateLimitConfig(max_tokens=5, refill_rate=10.0, window_seconds=0.5))
+        rate_limiter.buckets[category] = bucket
+
+        async with rate_limiter.acquire_many(category, 5):
+            assert bucket.tokens < 1
+            await rate_limiter.acquire(category)
+            await rate_limiter.acquire(category)
+
+        # The 3 unspent tokens are back in the bucket
+        assert bucket.available_tokens() >= 3
+
+        # Outside the block every acquire hits the bucket again, so once the
+        # returned tokens are spent callers have to wait for a refill
+        bucket.tokens = 3.0
+        for _ in range(3):
+            assert await rate_limiter.acquire(category) == 0.0
+        assert await rate_limiter.acquire(category) > 0.0
+
+
+class TestCachePerformance:
+    """Test in-process caching of API helpers."""
+
+    @pytest.mark.asyncio
+    async def test_ttl_cache_reuses_results(self):
+        """Test repeated and concurrent calls share one underlying request."""
+        import sys
+        sys.path.insert(0, "src")
+
+        from polymarket_mcp.utils import async_ttl_cache
+
+        calls = []
+
+        @async_ttl_cache(ttl=60.0)
+        async def fetch(limit: int):
+            calls.append(limit)
+            await asyncio.sleep(0.01)
+            return list(range(limit))
+
+        results = await asyncio.gather(*[fetch(3) for _ in range(10)])
+        assert all(r == [0, 1, 2] for r in results)
+        assert await fetch(3) == [0, 1, 2]
+        assert calls == [3]
+
+        # Positional and keyword spellings of the same call share an entry
+        assert await fetch(limit=3) == [0, 1, 2]
+        assert calls == [3]
+
+        # Different arguments and cleared caches refetch
+        await fetch(limit=5)
+        fetch.cache_clear()
+        await fetch(3)
+        assert calls == [3, 5, 3]
+
+    @pytest.mark.asyncio
+    async def test_dev_disk_cache_opt_in(self, tmp_path, monkeypatch):
+        """Test the on-disk GET cache is only used when enabled."""
+        import sys
+        sys.path.insert(0, "src")
+
+        from polymarket_mcp.utils import cached_get_json
+
+        requests = []
+
+        def handler(request):
+            requests.append(str(request.url))
+            return httpx.Response(200, json=[{"id": "1"}])
+
+        monkeypatch.setenv("POLYMARKET_DEV_CACHE_DIR", str(tmp_path))
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler),
+            base_url="https://gamma-api.polymarket.com"
+        ) as client:
+            # Disabled by default: every call goes to the network
+            monkeypatch.delenv("POLYMARKET_DEV_CACHE", raising=False)
+            await cached_get_json(client, "/markets", {"limit": 5})
+            await cached_get_json(client, "/markets", {"limit": 5})
+            assert len(requests) == 2
+            assert not list(tmp_path.iterdir())
+
+            monkeypatch.setenv("POLYMARKET_DEV_CACHE", "1")
+            assert await cached_get_json(client, "/markets", {"limit": 5}) == [{"id": "1"}]
+            assert await cached_get_json(client, "/markets", {"limit": 5}) == [{"id": "1"}]
+            assert len(requests) == 3
+
+            # Different params and expired entries refetch
+            await cached_get_json(client, "/markets", {"limit": 10})
+            await cached_get_json(client, "/markets", {"limit": 5}, ttl=0)
+            assert len(requests) == 5
+
 
 class TestMemoryUsage:
     """Test memory usage patterns."""